@@ -11,11 +11,15 @@ import logging
 # Ensure src is on path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+# Entrypoint owns logging config; library modules only create loggers
+logging.basicConfig(level=logging.INFO)
+
 from src.database.database import init_db
 from src.auth.decorators import init_auth_state, logout_user
 from src.ui.pages.login import render_auth_page
 from src.database.database import get_user_api_keys
 from src.ui.pages.api_keys import render_api_keys_page
+from src.ui.flash import show_flash
 
 
 def _clear_reddit_env_and_settings() -> None:
@@ -103,6 +107,9 @@ def main():
             st.rerun()
         st.markdown("---")
 
+    # Show any message queued by the auth/keys pages before their rerun
+    show_flash()
+
     # Load per-user keys into env before importing dashboard/config
     user_id = st.session_state.get('user_id')
     if user_id:
@@ -138,29 +145,6 @@ def main():
         import src.reddit_scout as _rs
         importlib.reload(_cfg)
         importlib.reload(_rs)
-        # Patch RedditScout to avoid forcing user.me() (works with app-only creds)
-        try:
-            import praw
-            def _patched_setup(self):
-                try:
-                    self.reddit = praw.Reddit(
-                        client_id=_cfg.settings.reddit_client_id,
-                        client_secret=_cfg.settings.reddit_client_secret,
-                        user_agent=_cfg.settings.reddit_user_agent,
-                        username=_cfg.settings.reddit_username or None,
-                        password=_cfg.settings.reddit_password or None,
-                    )
-                except Exception:
-                    # Last resort: minimal client without creds (still allows some public reads)
-                    self.reddit = praw.Reddit(
-                        client_id=_cfg.settings.reddit_client_id or "",
-                        client_secret=_cfg.settings.reddit_client_secret or "",
-                        user_agent=_cfg.settings.reddit_user_agent or 'RedditScoutPro/1.0',
-                    )
-        
-            _rs.RedditScout._setup_reddit_client = _patched_setup
-        except Exception:
-            pass
         import src.dashboard as _dash
         importlib.reload(_dash)
         _dash.main()
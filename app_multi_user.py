@@ -19,6 +19,7 @@ try:
     from auth.decorators import init_auth_state, check_session_validity, clear_auth_state, logout_user
     from ui.pages.login import render_auth_page
     from ui.pages.api_keys import render_api_keys_page
+    from ui.flash import show_flash
     from core.encryption import test_encryption_system
     logger.info("All imports successful")
 except ImportError as e:
@@ -152,6 +153,9 @@ def render_main_content(page):
         render_auth_page()
         return
     
+    # Show any message queued by the auth/keys pages before their rerun
+    show_flash()
+    
     # Handle page redirects
     if st.session_state.get('page_redirect'):
         page = st.session_state.page_redirect
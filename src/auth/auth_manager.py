@@ -2,8 +2,9 @@
 
 import bcrypt
 import secrets
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Optional
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
 try:
     from ..database.models import User, Session as UserSession
@@ -75,8 +76,12 @@ class AuthManager:
             "errors": errors
         }
     
-    def register_user(self, username: str, email: str, password: str) -> Dict[str, any]:
-        """Register a new user."""
+    def register_user(self, username: str, email: str, password: str, login: bool = False) -> Dict[str, any]:
+        """Register a new user.
+        
+        With login=True a session is opened as well and the result has the
+        same shape as login_user's, so callers skip a second password check.
+        """
         db = get_db_session()
         try:
             # Validate input
@@ -91,9 +96,9 @@ class AuthManager:
                 return {"success": False, "message": "; ".join(password_validation["errors"])}
             
             # Check if user exists
-            existing = db.query(User).filter(
+            existing = db.execute(select(User).where(
                 (User.username == username) | (User.email == email)
-            ).first()
+            ).limit(1)).scalars().first()
             
             if existing:
                 if existing.username == username:
@@ -111,6 +116,8 @@ class AuthManager:
             db.commit()
             
             logger.info(f"New user registered: {username}")
+            if login:
+                return {**self._open_session(db, user), "message": "Registration successful"}
             return {
                 "success": True, 
                 "message": "Registration successful", 
@@ -124,14 +131,41 @@ class AuthManager:
         finally:
             db.close()
     
+    def _open_session(self, db: Session, user: User, user_agent: str = None, ip_address: str = None) -> Dict[str, any]:
+        """Create a session row for an authenticated user and commit."""
+        session_token = secrets.token_urlsafe(32)
+        expires_at = datetime.now(timezone.utc) + timedelta(days=self.session_timeout_days)
+        
+        session = UserSession(
+            user_id=user.id,
+            session_token=session_token,
+            expires_at=expires_at,
+            user_agent=user_agent,
+            ip_address=ip_address
+        )
+        db.add(session)
+        
+        # Update last login
+        user.last_login = datetime.now(timezone.utc)
+        db.commit()
+        
+        return {
+            "success": True,
+            "user_id": user.id,
+            "username": user.username,
+            "email": user.email,
+            "session_token": session_token,
+            "expires_at": expires_at.isoformat()
+        }
+    
     def login_user(self, username: str, password: str, user_agent: str = None, ip_address: str = None) -> Dict[str, any]:
         """Authenticate user and create session."""
         db = get_db_session()
         try:
             # Find user (allow login with username or email)
-            user = db.query(User).filter(
+            user = db.execute(select(User).where(
                 (User.username == username) | (User.email == username.lower())
-            ).first()
+            ).limit(1)).scalars().first()
             
             if not user:
                 return {"success": False, "message": "Invalid credentials"}
@@ -142,32 +176,9 @@ class AuthManager:
             if not self.verify_password(password, user.password_hash):
                 return {"success": False, "message": "Invalid credentials"}
             
-            # Create session token
-            session_token = secrets.token_urlsafe(32)
-            expires_at = datetime.utcnow() + timedelta(days=self.session_timeout_days)
-            
-            session = UserSession(
-                user_id=user.id,
-                session_token=session_token,
-                expires_at=expires_at,
-                user_agent=user_agent,
-                ip_address=ip_address
-            )
-            db.add(session)
-            
-            # Update last login
-            user.last_login = datetime.utcnow()
-            db.commit()
-            
+            result = self._open_session(db, user, user_agent, ip_address)
             logger.info(f"User logged in: {user.username}")
-            return {
-                "success": True,
-                "user_id": user.id,
-                "username": user.username,
-                "email": user.email,
-                "session_token": session_token,
-                "expires_at": expires_at.isoformat()
-            }
+            return result
         except Exception as e:
             db.rollback()
             logger.error(f"User login failed: {e}")
@@ -182,10 +193,10 @@ class AuthManager:
         
         db = get_db_session()
         try:
-            session = db.query(UserSession).filter(
+            session = db.execute(select(UserSession).where(
                 UserSession.session_token == session_token,
-                UserSession.expires_at > datetime.utcnow()
-            ).first()
+                UserSession.expires_at > datetime.now(timezone.utc)
+            )).scalar_one_or_none()
             
             if not session:
                 return {"valid": False, "message": "Invalid or expired session"}
@@ -213,9 +224,9 @@ class AuthManager:
         
         db = get_db_session()
         try:
-            session = db.query(UserSession).filter(
+            session = db.execute(select(UserSession).where(
                 UserSession.session_token == session_token
-            ).first()
+            )).scalar_one_or_none()
             
             if session:
                 db.delete(session)
@@ -234,13 +245,11 @@ class AuthManager:
         """Clean up expired sessions."""
         db = get_db_session()
         try:
-            expired_sessions = db.query(UserSession).filter(
-                UserSession.expires_at <= datetime.utcnow()
-            ).all()
-            
-            count = len(expired_sessions)
-            for session in expired_sessions:
-                db.delete(session)
+            # Single DELETE instead of loading and deleting each row
+            result = db.execute(delete(UserSession).where(
+                UserSession.expires_at <= datetime.now(timezone.utc)
+            ))
+            count = result.rowcount
             
             db.commit()
             logger.info(f"Cleaned up {count} expired sessions")
@@ -256,10 +265,10 @@ class AuthManager:
         """Get all active sessions for a user."""
         db = get_db_session()
         try:
-            sessions = db.query(UserSession).filter(
+            sessions = db.execute(select(UserSession).where(
                 UserSession.user_id == user_id,
-                UserSession.expires_at > datetime.utcnow()
-            ).all()
+                UserSession.expires_at > datetime.now(timezone.utc)
+            )).scalars().all()
             
             return [{
                 "id": session.id,
@@ -70,9 +70,11 @@ def clear_auth_state():
     
     # Clear any other user-specific session data
     keys_to_clear = [key for key in st.session_state.keys() 
-                    if key.startswith('user_') or key.startswith('reddit_')]
+                    if key.startswith(('user_', 'reddit_', 'cred_'))]
     for key in keys_to_clear:
         del st.session_state[key]
+    for key in ('api_keys_cache', 'keys_configured', 'praw_clients'):
+        st.session_state.pop(key, None)
 
 def check_session_validity():
     """Check if current session is still valid."""
@@ -44,6 +44,10 @@ class Settings(BaseSettings):
         default="en,es", 
         description="Default languages to monitor (comma-separated ISO codes)"
     )
+    language_model_path: str = Field(
+        default="",
+        description="Path to fastText's lid.176.ftz for language detection (optional; langdetect otherwise)"
+    )
     
     # Search Configuration
     trending_keywords: str = Field(
@@ -2,12 +2,23 @@
 
 import os
 import base64
+from functools import lru_cache
 from cryptography.fernet import Fernet
-from typing import Optional
+from typing import List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=4)
+def _get_fernet(key_bytes: bytes) -> Fernet:
+    """Build and self-test a cipher once per key; later instances reuse it."""
+    cipher = Fernet(key_bytes)
+    # Test encrypt/decrypt to ensure it works
+    test_data = b"test"
+    if cipher.decrypt(cipher.encrypt(test_data)) != test_data:
+        raise ValueError("Encryption test failed")
+    return cipher
+
 class APIKeyEncryption:
     """Handles encryption and decryption of API keys."""
     
@@ -38,13 +49,7 @@ class APIKeyEncryption:
                 key_bytes = encryption_key
             
             # Test that it's a valid Fernet key
-            cipher = Fernet(key_bytes)
-            # Test encrypt/decrypt to ensure it works
-            test_data = b"test"
-            encrypted = cipher.encrypt(test_data)
-            decrypted = cipher.decrypt(encrypted)
-            if decrypted != test_data:
-                raise ValueError("Encryption test failed")
+            cipher = _get_fernet(key_bytes)
             
             logger.info("✅ Encryption system initialized successfully")
             return cipher
@@ -57,7 +62,7 @@ class APIKeyEncryption:
             logger.warning(f"Using fallback encryption key. Set this in environment:")
             logger.warning(f"ENCRYPTION_KEY={encryption_key}")
             os.environ['ENCRYPTION_KEY'] = encryption_key
-            return Fernet(key)
+            return _get_fernet(key)
     
     def encrypt(self, plaintext: str) -> str:
         """
@@ -104,6 +109,36 @@ class APIKeyEncryption:
             logger.error(f"Decryption failed: {e}")
             return None
     
+    def encrypt_many(self, plaintexts: List[str]) -> List[str]:
+        """Encrypt several strings with the one cipher; empty strings stay empty."""
+        encrypt = self.cipher.encrypt
+        encrypted = []
+        try:
+            for plaintext in plaintexts:
+                if plaintext:
+                    encrypted.append(base64.b64encode(encrypt(plaintext.encode('utf-8'))).decode('utf-8'))
+                else:
+                    encrypted.append("")
+        except Exception as e:
+            logger.error(f"Encryption failed: {e}")
+            raise ValueError("Failed to encrypt data")
+        return encrypted
+    
+    def decrypt_many(self, ciphertexts: List[str]) -> List[Optional[str]]:
+        """Decrypt several strings with the one cipher; a failed entry comes back as None."""
+        decrypt = self.cipher.decrypt
+        decrypted = []
+        for ciphertext in ciphertexts:
+            if not ciphertext:
+                decrypted.append("")
+                continue
+            try:
+                decrypted.append(decrypt(base64.b64decode(ciphertext.encode('utf-8'))).decode('utf-8'))
+            except Exception as e:
+                logger.error(f"Decryption failed: {e}")
+                decrypted.append(None)
+        return decrypted
+    
     def test_encryption(self) -> bool:
         """Test encryption/decryption functionality."""
         try:
@@ -126,6 +161,14 @@ def decrypt_api_key(encrypted_key: str) -> Optional[str]:
     """Decrypt an API key from storage."""
     return encryption.decrypt(encrypted_key)
 
+def encrypt_many(api_keys: List[str]) -> List[str]:
+    """Encrypt several API keys for storage in one pass."""
+    return encryption.encrypt_many(api_keys)
+
+def decrypt_many(encrypted_keys: List[str]) -> List[Optional[str]]:
+    """Decrypt several API keys from storage in one pass."""
+    return encryption.decrypt_many(encrypted_keys)
+
 def test_encryption_system() -> bool:
     """Test the encryption system."""
     return encryption.test_encryption()
@@ -2,6 +2,7 @@
 
 import praw
 from typing import Optional, Dict, List, Any
+from sqlalchemy import select
 try:
     from ..database.models import APIKey, UserPreferences
     from ..database.database import get_db_session
@@ -11,7 +12,7 @@ except ImportError:
     from database.models import APIKey, UserPreferences
     from database.database import get_db_session
     from core.encryption import decrypt_api_key
-from datetime import datetime
+from datetime import datetime, timezone
 import logging
 import json
 
@@ -31,7 +32,7 @@ class UserRedditScout:
         """Get user's API keys from database."""
         db = get_db_session()
         try:
-            return db.query(APIKey).filter(APIKey.user_id == self.user_id).first()
+            return db.execute(select(APIKey).where(APIKey.user_id == self.user_id).limit(1)).scalars().first()
         except Exception as e:
             logger.error(f"Failed to get API keys for user {self.user_id}: {e}")
             return None
@@ -42,9 +43,9 @@ class UserRedditScout:
         """Load user preferences."""
         db = get_db_session()
         try:
-            self.preferences = db.query(UserPreferences).filter(
+            self.preferences = db.execute(select(UserPreferences).where(
                 UserPreferences.user_id == self.user_id
-            ).first()
+            ).limit(1)).scalars().first()
             
             if not self.preferences:
                 # Create default preferences
@@ -115,7 +116,7 @@ class UserRedditScout:
             test_reddit.user.me()
             
             # Keys are valid, save them
-            api_keys = db.query(APIKey).filter(APIKey.user_id == self.user_id).first()
+            api_keys = db.execute(select(APIKey).where(APIKey.user_id == self.user_id).limit(1)).scalars().first()
             
             if not api_keys:
                 api_keys = APIKey(user_id=self.user_id)
@@ -124,7 +125,7 @@ class UserRedditScout:
             api_keys.reddit_client_id = client_id
             api_keys.reddit_client_secret_encrypted = encrypt_api_key(client_secret)
             api_keys.reddit_user_agent = user_agent or "RedditScoutPro/2.0"
-            api_keys.updated_at = datetime.utcnow()
+            api_keys.updated_at = datetime.now(timezone.utc)
             
             db.commit()
             
@@ -163,7 +164,7 @@ class UserRedditScout:
                 if hasattr(self.preferences, key):
                     setattr(self.preferences, key, value)
             
-            self.preferences.updated_at = datetime.utcnow()
+            self.preferences.updated_at = datetime.now(timezone.utc)
             db.commit()
             
             return True
@@ -1,18 +1,338 @@
 """Reddit Explorer Dashboard - Streamlit interface for comprehensive Reddit analysis."""
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple
+import hashlib
+import io
+import json
+import math
+import threading
 import time
 
 from .reddit_scout import RedditScout
 from .config import settings
-import os
 from .database.database import get_user_api_keys
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Number of global searches whose aggregations stay cached per session
+_MAX_CACHED_BUNDLES = 8
+
+# Streamed listings render this many discussions per chunk and stay cached this long
+_STREAM_CHUNK_SIZE = 10
+_LISTING_TTL_SECONDS = 300
+
+# Fields _display_discussion reads (plus 'id' for ordering checks); listings drop the rest
+_LISTING_FIELDS = (
+    'id', 'title', 'author', 'selftext', 'score', 'upvote_ratio',
+    'num_comments', 'activity_score', 'created_utc', 'url'
+)
+
+# Keyword search sort options and the result field each one orders by
+_KEYWORD_SORT_FIELDS = {
+    "Score (High to Low)": 'score',
+    "Comments (High to Low)": 'num_comments',
+    "Date (Newest First)": 'created_utc',
+}
+
+
+# Columns the global search aggregations read - everything else stays out of the frame
+_FRAME_COLUMNS = (
+    'subreddit', 'score', 'num_comments', 'subreddit_subscribers',
+    'created_utc', 'matched_keyword', 'title', 'permalink', 'author'
+)
+_INT32_COLUMNS = frozenset({'score', 'num_comments', 'subreddit_subscribers'})
+
+# Columns of the compact global results table, in display order
+_GLOBAL_TABLE_COLUMNS = (
+    'title', 'subreddit', 'author', 'score', 'num_comments',
+    'matched_keyword', 'permalink', 'created_utc'
+)
+
+# Country subreddit patterns for the global search filter, plus the reverse
+# map so a post's country is one dict lookup on its lowercased subreddit
+_COUNTRY_SUBREDDITS = {
+    "USA": frozenset({"usa", "america", "unitedstates"}),
+    "UK": frozenset({"unitedkingdom", "ukpolitics", "britishproblems", "casualuk"}),
+    "Canada": frozenset({"canada", "onguardforthee", "canadapolitics"}),
+    "Australia": frozenset({"australia", "straya", "aussie"}),
+    "Germany": frozenset({"germany", "de", "deutschland"}),
+    "France": frozenset({"france", "french"}),
+    "Spain": frozenset({"spain", "es", "espana", "spainfire", "catalunya", "madrid", "barcelona"}),
+    "Mexico": frozenset({"mexico", "mujico"}),
+    "Brazil": frozenset({"brasil", "brazil"}),
+    "India": frozenset({"india", "indiaspeaks", "indianews"}),
+    "Japan": frozenset({"japan", "japanlife", "newsokur"}),
+    "Korea": frozenset({"korea", "hanguk"}),
+}
+_SUBREDDIT_TO_COUNTRY = {sub: country for country, subs in _COUNTRY_SUBREDDITS.items() for sub in subs}
+_COUNTRY_FILTER_OPTIONS = ("All",) + tuple(_COUNTRY_SUBREDDITS)
+
+# Global search analytics: histogram bin count and the scatter's point budget
+_HISTOGRAM_BINS = 30
+_SCATTER_MAX_POINTS = 2000
+
+# Global search "Sort by" options and the frame column each one orders by
+_GLOBAL_SORT_COLUMNS = {"Score": 'score', "Comments": 'num_comments', "Date": 'created_utc'}
+
+# Static global search widget options and result icons
+_TIME_FILTER_OPTIONS = ("week", "month", "year", "all", "day")
+_DISPLAY_COUNTS = (25, 50, 100, "All")
+_SORT_OPTIONS = tuple(_GLOBAL_SORT_COLUMNS)
+_COMMENT_ICON = "💬"
+
+# The detailed global results view never renders more posts than this at once
+_DETAILED_PAGE_SIZE = 50
+_POST_ICON = "📝"
+
+# Chart styling shared by every render - edit colors and titles here
+_ENG_COLORS = ('#ff6b6b', '#ffd93d', '#6bcf7f')
+_SENT_COLORS = ('#6bcf7f', '#ffd93d', '#ff6b6b')
+_ENG_LAYOUT = {'title': 'Engagement Distribution', 'xaxis_title': 'Engagement Level', 'yaxis_title': 'Number of Posts'}
+_HOURS_LAYOUT = {'title': 'Posts by Hour of Day', 'xaxis_title': 'Hour (UTC)', 'yaxis_title': 'Number of Posts'}
+_SENT_LAYOUT = {'title': 'Community Sentiment'}
+
+# Default subreddits, parsed once at import instead of on every sidebar render
+_DEFAULT_SUBS = tuple(settings.default_subreddits)
+_DEFAULT_SUBS_WITH_EMPTY = ('',) + _DEFAULT_SUBS
+
+
+@lru_cache(maxsize=None)
+def _get_plotly():
+    """Import plotly on first use so pages without charts don't pay for it at startup."""
+    import plotly.express as px
+    import plotly.graph_objects as go
+    
+    return px, go
+
+
+def _results_frame(results: List[Dict]) -> "pd.DataFrame":
+    """Build a slim DataFrame from result dicts through Arrow, projected to the used columns."""
+    import pandas as pd
+    import pyarrow as pa
+    
+    table = pa.table({
+        column: pa.array(
+            [result[column] for result in results],
+            type=pa.int32() if column in _INT32_COLUMNS else None
+        )
+        for column in _FRAME_COLUMNS
+    })
+    df = table.to_pandas(self_destruct=True)
+    # Results carry raw epoch seconds; one vectorized conversion for the whole column
+    df['created_utc'] = pd.to_datetime(df['created_utc'], unit='s')
+    return df
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _histogram_figure(values_bytes: bytes, title: str, x_title: str):
+    """Bin int64 values here and send Plotly only the bar heights; cached on the raw bytes."""
+    _, go = _get_plotly()
+    
+    values = np.frombuffer(values_bytes, dtype=np.int64)
+    counts, edges = np.histogram(values, bins=_HISTOGRAM_BINS)
+    fig = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges)))
+    fig.update_layout(title=title, xaxis_title=x_title, yaxis_title="Number of Posts", bargap=0)
+    return fig
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _subreddit_bar_figure(sub_df: "pd.DataFrame"):
+    """Top subreddits bar chart; Streamlit keys the cache on the frame's contents."""
+    px, _ = _get_plotly()
+    
+    fig = px.bar(
+        sub_df.head(15), 
+        x='Subreddit', 
+        y='Posts',
+        title="Top Subreddits by Post Count",
+        hover_data=['Avg Score', 'Avg Comments', 'Subscribers']
+    )
+    fig.update_layout(xaxis_tickangle=-45)
+    return fig
+
+
+def _build_global_bundle(results: List[Dict]) -> Dict:
+    """Pre-compute the frames and totals shown by the global search summary and tabs."""
+    df = _results_frame(results)
+    
+    # Top subreddits analysis - one grouped pass, top 20 by post count without a full sort
+    sub_df = (
+        df.groupby('subreddit', sort=False)
+        .agg(**{
+            'Posts': ('score', 'size'),
+            'Avg Score': ('score', 'mean'),
+            'Avg Comments': ('num_comments', 'mean'),
+            'Subscribers': ('subreddit_subscribers', 'first'),
+        })
+        .reset_index()
+        .rename(columns={'subreddit': 'Subreddit'})
+        .nlargest(20, 'Posts')
+    )
+    
+    # Display strings for the detailed results view, formatted once per search
+    df['created_str'] = df['created_utc'].dt.strftime('%Y-%m-%d %H:%M')
+    df['score_str'] = df['score'].map('{:,}'.format)
+    df['comments_str'] = df['num_comments'].map('{:,}'.format)
+    df['engagement'] = (df['score'].to_numpy(np.int64) + df['num_comments'].to_numpy(np.int64) * 2) / 100.0
+    
+    return {
+        'df': df,
+        'sub_df': sub_df,
+        'subreddit_count': df['subreddit'].nunique(),
+        # Most frequent keywords first, so the summary leads with the most relevant ones
+        'keyword_counts': df['matched_keyword'].value_counts().to_dict(),
+        'total_score': int(df['score'].sum()),
+        'total_comments': int(df['num_comments'].sum()),
+    }
+
+
+def _global_search_bundle(search_key: str, results: List[Dict]) -> Dict:
+    """Return the cached aggregation bundle for a search, building it on first use."""
+    bundles = st.session_state.setdefault('global_search_bundles', OrderedDict())
+    bundle = bundles.get(search_key)
+    if bundle is None:
+        bundle = _build_global_bundle(results)
+        bundles[search_key] = bundle
+        # Bound memory: only the most recent searches keep their aggregations
+        while len(bundles) > _MAX_CACHED_BUNDLES:
+            bundles.popitem(last=False)
+    else:
+        bundles.move_to_end(search_key)
+    return bundle
+
+
+@st.cache_resource(
+    show_spinner="Initializing Reddit API connection...",
+    hash_funcs={dict: lambda d: hash(tuple(sorted(d.items())))}
+)
+def _shared_scout(credentials: Dict[str, str]) -> RedditScout:
+    """One RedditScout (and PRAW connection pool) per credential set, shared across sessions."""
+    return RedditScout(**credentials)
+
+
+# Cached Reddit fetchers - the scout argument is excluded from the cache key
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_search_subreddits(_scout: RedditScout, query: str, limit: int) -> List[Dict]:
+    return _scout.search_subreddits(query, limit=limit)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_subreddit_overview(_scout: RedditScout, subreddit: str, limit: int) -> Tuple[Dict, Dict]:
+    """Fetch subreddit info and analytics concurrently - they are independent round-trips."""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        info_future = executor.submit(_scout.get_subreddit_info, subreddit)
+        analytics_future = executor.submit(_scout.get_subreddit_analytics, subreddit, limit=limit)
+        return info_future.result(), analytics_future.result()
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_subreddit_sentiment(_scout: RedditScout, subreddit: str, limit: int) -> Dict:
+    return _scout.analyze_subreddit_sentiment(subreddit, limit=limit)
+
+
+@st.cache_data(ttl=600, max_entries=128, show_spinner=False)
+def _cached_global_search(_scout: RedditScout, keywords: tuple, limit: int, time_filter: str,
+                          search_comments: bool, country_filter: Optional[str],
+                          min_score: int, min_comments: int, exclude_nsfw: bool,
+                          refresh: int = 0) -> List[Dict]:
+    """Global search with the page's content filters; refresh is bumped to bypass one cached query."""
+    return _scout.search_global_keywords(
+        list(keywords),
+        limit=limit,
+        time_filter=time_filter,
+        search_comments=search_comments,
+        country_filter=country_filter,
+        min_score=min_score,
+        min_comments=min_comments,
+        exclude_nsfw=exclude_nsfw
+    )
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_wordcloud_data(_scout: RedditScout, subreddit: str, limit: int) -> Dict:
+    return _scout.generate_wordcloud_data(subreddit, limit=limit)
+
+
+@st.cache_resource
+def _get_wordcloud_renderer():
+    """One configured WordCloud shared across reruns; layout mutates it, hence the lock."""
+    from wordcloud import WordCloud
+    
+    renderer = WordCloud(width=800, height=400, background_color='white', colormap='Blues', max_words=100)
+    return renderer, threading.Lock()
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _render_wordcloud_png(frequencies: np.ndarray) -> bytes:
+    """Lay out a word cloud from a (word, count) array and encode it straight to PNG through PIL."""
+    renderer, lock = _get_wordcloud_renderer()
+    with lock:
+        image = renderer.generate_from_frequencies(
+            dict(zip(frequencies['word'].tolist(), frequencies['count'].tolist()))
+        ).to_image()
+    buf = io.BytesIO()
+    image.save(buf, 'PNG')
+    return buf.getvalue()
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_keyword_discussions(_scout: RedditScout, keywords: tuple, subreddits: tuple, limit: int) -> List[Dict]:
+    return _scout.get_keyword_discussions(list(keywords), list(subreddits), limit=limit, max_workers=16)
+
+
+def _build_keyword_index(results: List[Dict]) -> Dict[tuple, List[Dict]]:
+    """Index keyword results by (sort option, keyword), each list already in sorted order."""
+    index = defaultdict(list)
+    for option, field in _KEYWORD_SORT_FIELDS.items():
+        for result in sorted(results, key=lambda x: x[field], reverse=True):
+            index[(option, result['matched_keyword'])].append(result)
+    return dict(index)
+
+
+@st.cache_resource
+def _listing_store() -> Dict:
+    """Process-wide store of recently streamed listings, shared across sessions and reloads."""
+    return {'lock': threading.Lock(), 'entries': {}}
+
+
+def _get_cached_listing(listing_key: tuple) -> Optional[List[Dict]]:
+    """Return a stored listing if it is younger than the listing TTL."""
+    store = _listing_store()
+    with store['lock']:
+        entry = store['entries'].get(listing_key)
+    if entry and time.monotonic() - entry[0] < _LISTING_TTL_SECONDS:
+        return entry[1]
+    return None
+
+
+def _put_cached_listing(listing_key: tuple, discussions: List[Dict]):
+    """Store a fully streamed listing, dropping expired entries."""
+    store = _listing_store()
+    now = time.monotonic()
+    with store['lock']:
+        entries = store['entries']
+        for key in [k for k, (stamp, _) in entries.items() if now - stamp >= _LISTING_TTL_SECONDS]:
+            del entries[key]
+        entries[listing_key] = (now, discussions)
+
+
+def _shift_offset(key: str, delta: int):
+    """Move a pagination offset stored in session state, never below zero."""
+    st.session_state[key] = max(0, st.session_state.get(key, 0) + delta)
+
+
+def _goto(page: str, subreddit: str):
+    """Button callback: switch page for the rerun the click already triggers."""
+    st.session_state.target_subreddit = subreddit
+    st.session_state.page_override = page
+
 
 class RedditDashboard:
     """Streamlit dashboard for Reddit Explorer."""
@@ -64,66 +384,53 @@ class RedditDashboard:
         
         # Quick subreddit access
         st.sidebar.subheader("Quick Access")
-        default_subs = settings.default_subreddits
         
         selected_sub = st.sidebar.selectbox(
             "Popular Subreddits:",
-            [""] + default_subs,
+            _DEFAULT_SUBS_WITH_EMPTY,
             key="quick_subreddit"
         )
         
-        if selected_sub and st.sidebar.button("Go to Active Discussions"):
-            st.session_state.target_subreddit = selected_sub
-            st.session_state.page_override = "🔥 Active Discussions"
-            st.rerun()
+        if selected_sub:
+            st.sidebar.button("Go to Active Discussions", on_click=_goto,
+                              args=("🔥 Active Discussions", selected_sub))
     
     def _initialize_scout(self):
         """Initialize Reddit Scout with caching."""
-        # Load per-user keys before constructing scout
+        credentials = {
+            'client_id': settings.reddit_client_id,
+            'client_secret': settings.reddit_client_secret,
+            'user_agent': settings.reddit_user_agent,
+            'username': settings.reddit_username,
+            'password': settings.reddit_password,
+        }
+        
+        # Per-user keys are passed straight to the scout - no env or settings rewriting
         if st.session_state.get('authenticated') and st.session_state.get('user_id'):
             try:
-                user_id = st.session_state.user_id
-                keys = get_user_api_keys(user_id)
-                if keys:
-                    # Set env vars (no values logged)
-                    os.environ['REDDIT_CLIENT_ID'] = keys.get('client_id') or ''
-                    os.environ['REDDIT_CLIENT_SECRET'] = keys.get('client_secret') or ''
-                    os.environ['REDDIT_USER_AGENT'] = keys.get('user_agent') or 'RedditScoutPro/1.0'
-                    if keys.get('reddit_username'):
-                        os.environ['REDDIT_USERNAME'] = keys['reddit_username']
-                    else:
-                        os.environ.pop('REDDIT_USERNAME', None)
-                    if keys.get('reddit_password'):
-                        os.environ['REDDIT_PASSWORD'] = keys['reddit_password']
-                    else:
-                        os.environ.pop('REDDIT_PASSWORD', None)
-
-                    # Hydrate settings in-place to ensure RedditScout sees them
-                    try:
-                        settings.reddit_client_id = os.environ.get('REDDIT_CLIENT_ID', '')
-                        settings.reddit_client_secret = os.environ.get('REDDIT_CLIENT_SECRET', '')
-                        settings.reddit_user_agent = os.environ.get('REDDIT_USER_AGENT', 'RedditScoutPro/1.0')
-                        settings.reddit_username = os.environ.get('REDDIT_USERNAME', '')
-                        settings.reddit_password = os.environ.get('REDDIT_PASSWORD', '')
-                    except Exception:
-                        pass
+                # The database layer caches decrypted keys per user and drops them on save/remove
+                keys = get_user_api_keys(st.session_state.user_id)
             except Exception:
-                pass
-
-        if 'reddit_scout' not in st.session_state:
-            with st.spinner("Initializing Reddit API connection..."):
-                try:
-                    st.session_state.reddit_scout = RedditScout()
-                    st.success("✅ Reddit API connected successfully!")
-                except Exception as e:
-                    st.error(f"❌ Failed to connect to Reddit API: {e}")
-                    st.stop()
+                keys = None
+            if keys:
+                credentials = {
+                    'client_id': keys.get('client_id') or '',
+                    'client_secret': keys.get('client_secret') or '',
+                    'user_agent': keys.get('user_agent') or 'RedditScoutPro/1.0',
+                    'username': keys.get('reddit_username') or '',
+                    'password': keys.get('reddit_password') or '',
+                }
         
-        self.scout = st.session_state.reddit_scout
+        # Shared per credential set so reruns and other sessions reuse the PRAW client
+        try:
+            self.scout = _shared_scout(credentials)
+        except Exception as e:
+            st.error(f"❌ Failed to connect to Reddit API: {e}")
+            st.stop()
     
     def _main_content(self):
         """Render main content based on selected page."""
-        # Handle page override from sidebar
+        # Navigation callbacks set page_override before this run starts
         page = getattr(st.session_state, 'page_override', self.page)
         if hasattr(st.session_state, 'page_override'):
             del st.session_state.page_override
@@ -178,25 +485,30 @@ class RedditDashboard:
             
             # Quick search
             quick_query = st.text_input("Quick subreddit search:", placeholder="e.g., python, startup")
-            if quick_query:
-                with st.spinner("Searching..."):
-                    results = self.scout.search_subreddits(quick_query, limit=5)
-                    for result in results:
-                        st.write(f"**r/{result['name']}** - {result['subscribers']:,} subscribers")
+            # Filled in after the rest of the page has painted
+            quick_results = st.empty()
         
         # Popular subreddits overview
         st.markdown("### Popular Subreddits")
         
         cols = st.columns(4)
-        for i, subreddit in enumerate(settings.default_subreddits[:8]):
+        for i, subreddit in enumerate(_DEFAULT_SUBS[:8]):
             with cols[i % 4]:
-                if st.button(f"r/{subreddit}", key=f"home_{subreddit}"):
-                    st.session_state.target_subreddit = subreddit
-                    st.session_state.page_override = "🔥 Active Discussions"
-                    st.rerun()
+                st.button(f"r/{subreddit}", key=f"home_{subreddit}", on_click=_goto,
+                          args=("🔥 Active Discussions", subreddit))
+        
+        # A slow Reddit API only holds up the quick search slot, not the page
+        if quick_query:
+            with quick_results.container():
+                with st.spinner("Searching..."):
+                    results = _cached_search_subreddits(self.scout, quick_query, 5)
+                    for result in results:
+                        st.write(f"**r/{result['name']}** - {result['subscribers']:,} subscribers")
     
     def _subreddit_finder_page(self):
         """Subreddit finder and explorer."""
+        import pandas as pd
+        
         st.title("🔍 Subreddit Finder")
         st.markdown("Discover relevant Reddit communities")
         
@@ -218,35 +530,62 @@ class RedditDashboard:
         
         if search_query and search_button:
             with st.spinner("Searching subreddits..."):
-                results = self.scout.search_subreddits(search_query, limit=limit)
+                # Kept in session state so row selection reruns can show details
+                st.session_state['subreddit_finder_results'] = _cached_search_subreddits(self.scout, search_query, limit)
+        
+        if 'subreddit_finder_results' not in st.session_state:
+            return
+        
+        results = st.session_state['subreddit_finder_results']
+        
+        if results:
+            st.success(f"Found {len(results)} subreddits")
+            
+            # One virtualized table instead of an expander per subreddit
+            table = pd.DataFrame(results, columns=['name', 'subscribers', 'title', 'url', 'nsfw', 'created_utc'])
+            selected = st.dataframe(
+                table,
+                use_container_width=True,
+                hide_index=True,
+                on_select="rerun",
+                selection_mode="single-row",
+                key="subreddit_finder_table",
+                column_config={
+                    'name': st.column_config.TextColumn("Subreddit"),
+                    'subscribers': st.column_config.NumberColumn("Subscribers", format="%d"),
+                    'title': st.column_config.TextColumn("Title"),
+                    'url': st.column_config.LinkColumn("Link"),
+                    'nsfw': st.column_config.CheckboxColumn("NSFW"),
+                    'created_utc': st.column_config.DatetimeColumn("Created", format="YYYY-MM-DD"),
+                }
+            )
+            
+            # Full details only for the selected row
+            if selected.selection.rows:
+                result = results[selected.selection.rows[0]]
+                st.subheader(f"r/{result['name']} - {result['subscribers']:,} subscribers")
+                col1, col2 = st.columns([2, 1])
                 
-                if results:
-                    st.success(f"Found {len(results)} subreddits")
+                with col1:
+                    st.write(f"**{result['title']}**")
+                    st.write(result['description'])
+                    st.write(f"🔗 [View on Reddit]({result['url']})")
                     
-                    # Display results
-                    for result in results:
-                        with st.expander(f"r/{result['name']} - {result['subscribers']:,} subscribers"):
-                            col1, col2 = st.columns([2, 1])
-                            
-                            with col1:
-                                st.write(f"**{result['title']}**")
-                                st.write(result['description'])
-                                st.write(f"🔗 [View on Reddit]({result['url']})")
-                                
-                                if result['nsfw']:
-                                    st.warning("⚠️ NSFW Content")
-                            
-                            with col2:
-                                st.metric("Subscribers", f"{result['subscribers']:,}")
-                                st.metric("Created", result['created_utc'].strftime("%Y-%m-%d"))
-                                
-                                if st.button(f"Analyze r/{result['name']}", key=f"analyze_{result['name']}"):
-                                    st.session_state.target_subreddit = result['name']
-                                    st.session_state.page_override = "📊 Subreddit Analytics"
-                                    st.rerun()
-                else:
-                    st.warning("No subreddits found. Try different keywords.")
+                    if result['nsfw']:
+                        st.warning("⚠️ NSFW Content")
+                
+                with col2:
+                    st.metric("Subscribers", f"{result['subscribers']:,}")
+                    st.metric("Created", result['created_utc'].strftime("%Y-%m-%d"))
+                    
+                    st.button(f"Analyze r/{result['name']}", key=f"analyze_{result['name']}", on_click=_goto,
+                              args=("📊 Subreddit Analytics", result['name']))
+            else:
+                st.caption("Select a row to see subreddit details.")
+        else:
+            st.warning("No subreddits found. Try different keywords.")
     
+    @st.fragment
     def _active_discussions_page(self):
         """Active discussions explorer."""
         st.title("🔥 Active Discussions")
@@ -273,130 +612,156 @@ class RedditDashboard:
             if 'active_trigger' in st.session_state:
                 del st.session_state.active_trigger
                 
-            with st.spinner("Fetching active discussions..."):
-                discussions = self.scout.get_active_discussions(subreddit, limit=limit)
-                
-                if discussions:
-                    st.success(f"Found {len(discussions)} active discussions in r/{subreddit}")
-                    
-                    # Display discussions
-                    for i, discussion in enumerate(discussions, 1):
-                        self._display_discussion(discussion, i)
-                else:
-                    st.warning(f"No discussions found in r/{subreddit}")
+            status = st.empty()
+            discussions = self._stream_discussions(
+                ('hot', subreddit, limit),
+                lambda: self.scout.iter_discussions(subreddit, 'hot', limit=limit, fields=_LISTING_FIELDS),
+                status,
+                sort_key='activity_score'
+            )
+            
+            if discussions:
+                status.success(f"Found {len(discussions)} active discussions in r/{subreddit}")
+            else:
+                status.warning(f"No discussions found in r/{subreddit}")
     
+    @st.fragment
     def _trending_discussions_page(self):
         """Trending discussions explorer."""
+        px, go = _get_plotly()
+        
         st.title("📈 Trending Discussions")
         st.markdown("Discover what's trending on Reddit")
         
-        # Input form
-        col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
-        
-        with col1:
-            subreddit = st.text_input(
-                "Subreddit:",
-                value=getattr(st.session_state, 'target_subreddit', 'technology'),
-                placeholder="e.g., technology, worldnews, science"
-            )
-        
-        with col2:
-            time_filter = st.selectbox(
-                "Time period:",
-                ["hour", "day", "week", "month", "year", "all"],
-                index=2
+        # Input form - editing the fields doesn't rerun anything until submit
+        with st.form(key='trending_form'):
+            col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
+            
+            with col1:
+                subreddit = st.text_input(
+                    "Subreddit:",
+                    value=getattr(st.session_state, 'target_subreddit', 'technology'),
+                    placeholder="e.g., technology, worldnews, science"
+                )
+            
+            with col2:
+                time_filter = st.selectbox(
+                    "Time period:",
+                    ["hour", "day", "week", "month", "year", "all"],
+                    index=2
+                )
+            
+            with col3:
+                limit = st.number_input("Number of posts:", min_value=10, max_value=100, value=50)
+            
+            with col4:
+                submitted = st.form_submit_button("📈 Get Trending", type="primary")
+        
+        if submitted and subreddit:
+            status = st.empty()
+            chart_slot = st.empty()
+            discussions = self._stream_discussions(
+                ('top', subreddit, limit, time_filter),
+                lambda: self.scout.iter_discussions(subreddit, 'top', limit=limit, time_filter=time_filter,
+                                                    fields=_LISTING_FIELDS),
+                status,
+                sort_key='score'
             )
-        
-        with col3:
-            limit = st.number_input("Number of posts:", min_value=10, max_value=100, value=50)
-        
-        with col4:
-            if st.button("📈 Get Trending", type="primary"):
-                st.session_state.trending_trigger = True
-        
-        if subreddit and getattr(st.session_state, 'trending_trigger', False):
-            if 'trending_trigger' in st.session_state:
-                del st.session_state.trending_trigger
-                
-            with st.spinner("Fetching trending discussions..."):
-                discussions = self.scout.get_trending_discussions(subreddit, limit=limit, time_filter=time_filter)
+            
+            if discussions:
+                status.success(f"Found {len(discussions)} trending discussions in r/{subreddit}")
                 
-                if discussions:
-                    st.success(f"Found {len(discussions)} trending discussions in r/{subreddit}")
-                    
-                    # Show trends chart
-                    if len(discussions) > 5:
-                        df = pd.DataFrame(discussions)
-                        fig = px.scatter(
-                            df.head(20), 
-                            x='num_comments', 
-                            y='score',
-                            size='activity_score',
-                            hover_data=['title'],
-                            title=f"Engagement Pattern - r/{subreddit}"
-                        )
-                        st.plotly_chart(fig, use_container_width=True)
+                # Chart needs the full listing, so it fills its slot once streaming ends
+                if len(discussions) > 5:
+                    # Only the plotted columns, built straight into numpy arrays
+                    top = discussions[:20]
+                    x = np.fromiter((d['num_comments'] for d in top), dtype=np.int32, count=len(top))
+                    y = np.fromiter((d['score'] for d in top), dtype=np.int32, count=len(top))
+                    sizes = np.fromiter((d['activity_score'] for d in top), dtype=np.float32, count=len(top))
+                    titles = [d['title'] for d in top]
                     
-                    # Display discussions
-                    for i, discussion in enumerate(discussions, 1):
-                        self._display_discussion(discussion, i)
-                else:
-                    st.warning(f"No trending discussions found in r/{subreddit}")
+                    fig = go.Figure(go.Scattergl(
+                        x=x,
+                        y=y,
+                        mode='markers',
+                        text=titles,
+                        hovertemplate="%{text}<br>Comments: %{x}<br>Score: %{y}<extra></extra>",
+                        marker=dict(size=sizes, sizemode='area', sizeref=2.0 * max(float(sizes.max()), 1.0) / 20 ** 2)
+                    ))
+                    fig.update_layout(
+                        title=f"Engagement Pattern - r/{subreddit}",
+                        xaxis_title="num_comments",
+                        yaxis_title="score"
+                    )
+                    chart_slot.plotly_chart(fig, use_container_width=True)
+            else:
+                status.warning(f"No trending discussions found in r/{subreddit}")
     
+    @st.fragment
     def _new_discussions_page(self):
         """New discussions explorer."""
         st.title("🆕 New Discussions")
         st.markdown("See the latest posts and discussions")
         
-        # Input form
-        col1, col2 = st.columns([3, 1])
-        
-        with col1:
-            subreddit = st.text_input(
-                "Subreddit:",
-                value=getattr(st.session_state, 'target_subreddit', 'programming'),
-                placeholder="e.g., programming, AskReddit, todayilearned"
+        # Input form - editing the fields doesn't rerun anything until submit
+        with st.form(key='new_form'):
+            col1, col2 = st.columns([3, 1])
+            
+            with col1:
+                subreddit = st.text_input(
+                    "Subreddit:",
+                    value=getattr(st.session_state, 'target_subreddit', 'programming'),
+                    placeholder="e.g., programming, AskReddit, todayilearned"
+                )
+            
+            with col2:
+                limit = st.number_input("Number of posts:", min_value=10, max_value=100, value=50)
+            
+            submitted = st.form_submit_button("🆕 Get New Discussions", type="primary")
+        
+        if submitted and subreddit:
+            status = st.empty()
+            discussions = self._stream_discussions(
+                ('new', subreddit, limit),
+                lambda: self.scout.iter_discussions(subreddit, 'new', limit=limit, fields=_LISTING_FIELDS),
+                status,
+                show_age=True
             )
-        
-        with col2:
-            limit = st.number_input("Number of posts:", min_value=10, max_value=100, value=50)
-        
-        if st.button("🆕 Get New Discussions", type="primary") and subreddit:
-            with st.spinner("Fetching new discussions..."):
-                discussions = self.scout.get_new_discussions(subreddit, limit=limit)
-                
-                if discussions:
-                    st.success(f"Found {len(discussions)} new discussions in r/{subreddit}")
-                    
-                    # Display discussions
-                    for i, discussion in enumerate(discussions, 1):
-                        self._display_discussion(discussion, i, show_age=True)
-                else:
-                    st.warning(f"No new discussions found in r/{subreddit}")
+            
+            if discussions:
+                status.success(f"Found {len(discussions)} new discussions in r/{subreddit}")
+            else:
+                status.warning(f"No new discussions found in r/{subreddit}")
     
+    @st.fragment
     def _analytics_page(self):
         """Subreddit analytics and insights."""
+        import pandas as pd
+        px, go = _get_plotly()
+        
         st.title("📊 Subreddit Analytics")
         st.markdown("Deep dive into subreddit metrics and patterns")
         
-        # Input form
-        col1, col2 = st.columns([3, 1])
-        
-        with col1:
-            subreddit = st.text_input(
-                "Subreddit to analyze:",
-                value=getattr(st.session_state, 'target_subreddit', 'datascience'),
-                placeholder="e.g., datascience, MachineLearning, entrepreneur"
-            )
-        
-        with col2:
-            limit = st.number_input("Posts to analyze:", min_value=50, max_value=500, value=100)
+        # Input form - editing the fields doesn't rerun anything until submit
+        with st.form(key='analytics_form'):
+            col1, col2 = st.columns([3, 1])
+            
+            with col1:
+                subreddit = st.text_input(
+                    "Subreddit to analyze:",
+                    value=getattr(st.session_state, 'target_subreddit', 'datascience'),
+                    placeholder="e.g., datascience, MachineLearning, entrepreneur"
+                )
+            
+            with col2:
+                limit = st.number_input("Posts to analyze:", min_value=50, max_value=500, value=100)
+            
+            submitted = st.form_submit_button("📊 Analyze Subreddit", type="primary")
         
-        if st.button("📊 Analyze Subreddit", type="primary") and subreddit:
+        if submitted and subreddit:
             with st.spinner("Analyzing subreddit..."):
-                # Get subreddit info
-                info = self.scout.get_subreddit_info(subreddit)
-                analytics = self.scout.get_subreddit_analytics(subreddit, limit=limit)
+                # Get subreddit info and analytics in one go
+                info, analytics = _cached_subreddit_overview(self.scout, subreddit, limit)
                 
                 if info and 'error' not in analytics:
                     # Subreddit overview
@@ -408,8 +773,7 @@ class RedditDashboard:
                     with col2:
                         st.metric("Active Users", f"{info.get('active_users', 0):,}")
                     with col3:
-                        age = datetime.now() - info['created_utc']
-                        st.metric("Age (years)", f"{age.days // 365}")
+                        st.metric("Age (years)", info['age_years'])
                     with col4:
                         st.metric("Posts Analyzed", analytics['total_posts'])
                     
@@ -431,16 +795,19 @@ class RedditDashboard:
                         st.subheader("🎯 Engagement Distribution")
                         
                         engagement_data = analytics['engagement_distribution']
+                        engagement_counts = np.array([
+                            engagement_data['high_engagement'],
+                            engagement_data['medium_engagement'],
+                            engagement_data['low_engagement']
+                        ], dtype=np.int32)
                         fig = go.Figure(data=[
                             go.Bar(
                                 x=['High', 'Medium', 'Low'],
-                                y=[engagement_data['high_engagement'], 
-                                   engagement_data['medium_engagement'], 
-                                   engagement_data['low_engagement']],
-                                marker_color=['#ff6b6b', '#ffd93d', '#6bcf7f']
+                                y=engagement_counts,
+                                marker_color=_ENG_COLORS
                             )
                         ])
-                        fig.update_layout(title="Engagement Distribution", xaxis_title="Engagement Level", yaxis_title="Number of Posts")
+                        fig.update_layout(**_ENG_LAYOUT)
                         st.plotly_chart(fig, use_container_width=True)
                     
                     # Top authors
@@ -454,42 +821,52 @@ class RedditDashboard:
                         st.subheader("🕒 Posting Patterns by Hour")
                         
                         hour_data = analytics['activity_by_hour']
-                        fig = px.bar(
-                            x=list(hour_data.keys()),
-                            y=list(hour_data.values()),
-                            title="Posts by Hour of Day"
-                        )
-                        fig.update_layout(xaxis_title="Hour", yaxis_title="Number of Posts")
+                        hours = np.fromiter(hour_data.keys(), dtype=np.int32, count=len(hour_data))
+                        counts = np.fromiter(hour_data.values(), dtype=np.int32, count=len(hour_data))
+                        fig = go.Figure(go.Bar(x=hours, y=counts))
+                        fig.update_layout(**_HOURS_LAYOUT)
                         st.plotly_chart(fig, use_container_width=True)
                     
                 else:
                     st.error("Failed to analyze subreddit. Please check the name and try again.")
     
+    @st.fragment
     def _sentiment_analysis_page(self):
         """Sentiment analysis of subreddit content."""
+        px, go = _get_plotly()
+        
         st.title("💭 Sentiment Analysis")
         st.markdown("Analyze the mood and sentiment of Reddit communities")
         
-        # Input form
-        col1, col2 = st.columns([3, 1])
-        
-        with col1:
-            subreddit = st.text_input(
-                "Subreddit to analyze:",
-                value=getattr(st.session_state, 'target_subreddit', 'politics'),
-                placeholder="e.g., politics, worldnews, cryptocurrency"
-            )
-        
-        with col2:
-            limit = st.number_input("Posts to analyze:", min_value=50, max_value=300, value=100)
+        # Input form - editing the fields doesn't rerun anything until submit
+        with st.form(key='sentiment_form'):
+            col1, col2 = st.columns([3, 1])
+            
+            with col1:
+                subreddit = st.text_input(
+                    "Subreddit to analyze:",
+                    value=getattr(st.session_state, 'target_subreddit', 'politics'),
+                    placeholder="e.g., politics, worldnews, cryptocurrency"
+                )
+            
+            with col2:
+                limit = st.number_input("Posts to analyze:", min_value=50, max_value=300, value=100)
+            
+            submitted = st.form_submit_button("💭 Analyze Sentiment", type="primary")
         
-        if st.button("💭 Analyze Sentiment", type="primary") and subreddit:
+        if submitted and subreddit:
             with st.spinner("Analyzing sentiment..."):
-                sentiment_data = self.scout.analyze_subreddit_sentiment(subreddit, limit=limit)
+                sentiment_data = _cached_subreddit_sentiment(self.scout, subreddit, limit)
                 
                 if sentiment_data['total_analyzed'] > 0:
                     st.success(f"Analyzed {sentiment_data['total_analyzed']} texts from r/{subreddit}")
                     
+                    # Pull the three percentages out once for the pie and the metrics
+                    percentages = sentiment_data['percentages']
+                    positive_pct, neutral_pct, negative_pct = (
+                        percentages[k] for k in ('positive', 'neutral', 'negative')
+                    )
+                    
                     # Sentiment distribution
                     col1, col2 = st.columns([1, 1])
                     
@@ -499,15 +876,11 @@ class RedditDashboard:
                         fig = go.Figure(data=[
                             go.Pie(
                                 labels=['Positive', 'Neutral', 'Negative'],
-                                values=[
-                                    sentiment_data['percentages']['positive'],
-                                    sentiment_data['percentages']['neutral'],
-                                    sentiment_data['percentages']['negative']
-                                ],
-                                marker_colors=['#6bcf7f', '#ffd93d', '#ff6b6b']
+                                values=[positive_pct, neutral_pct, negative_pct],
+                                marker_colors=_SENT_COLORS
                             )
                         ])
-                        fig.update_layout(title="Community Sentiment")
+                        fig.update_layout(**_SENT_LAYOUT)
                         st.plotly_chart(fig, use_container_width=True)
                     
                     with col2:
@@ -515,62 +888,71 @@ class RedditDashboard:
                         
                         col_a, col_b, col_c = st.columns(3)
                         with col_a:
-                            st.metric("😊 Positive", f"{sentiment_data['percentages']['positive']:.1f}%")
+                            st.metric("😊 Positive", f"{positive_pct:.1f}%")
                         with col_b:
-                            st.metric("😐 Neutral", f"{sentiment_data['percentages']['neutral']:.1f}%")
+                            st.metric("😐 Neutral", f"{neutral_pct:.1f}%")
                         with col_c:
-                            st.metric("😞 Negative", f"{sentiment_data['percentages']['negative']:.1f}%")
+                            st.metric("😞 Negative", f"{negative_pct:.1f}%")
                     
                     # Sample texts
                     if sentiment_data['sample_texts']:
                         st.subheader("📝 Sample Analysis")
                         
-                        for sample in sentiment_data['sample_texts'][:5]:
-                            sentiment_emoji = {"positive": "😊", "neutral": "😐", "negative": "😞"}
-                            st.write(f"{sentiment_emoji[sample['sentiment']]} **{sample['sentiment'].title()}** (Score: {sample['score']})")
-                            st.write(f"_{sample['text']}_")
+                        sentiment_emoji = {"positive": "😊", "neutral": "😐", "negative": "😞"}
+                        samples = [
+                            (sentiment_emoji[sample['sentiment']], sample['sentiment'].title(), sample['score'], sample['text'])
+                            for sample in sentiment_data['sample_texts'][:5]
+                        ]
+                        for emoji, label, score, text in samples:
+                            st.write(f"{emoji} **{label}** (Score: {score})")
+                            st.write(f"_{text}_")
                             st.markdown("---")
                 
                 else:
                     st.warning("No sentiment data available. Try a different subreddit.")
     
+    @st.fragment
     def _keyword_search_page(self):
         """Keyword-based discussion search."""
         st.title("🔎 Keyword Search")
         st.markdown("Find discussions containing specific keywords across multiple subreddits")
         
-        # Input form
-        col1, col2 = st.columns([2, 2])
-        
-        with col1:
-            keywords = st.text_area(
-                "Keywords (one per line):",
-                value="AI\nChatGPT\nPython",
-                height=100
-            )
-        
-        with col2:
-            subreddits = st.text_area(
-                "Subreddits (one per line):",
-                value="programming\ntechnology\nMachineLearning",
-                height=100
-            )
-        
-        col1, col2, col3 = st.columns([2, 1, 1])
-        
-        with col1:
-            limit = st.number_input("Results per keyword:", min_value=10, max_value=100, value=20)
-        
-        with col2:
-            search_button = st.button("🔎 Search Keywords", type="primary")
+        # Input form - editing the fields doesn't rerun anything until submit
+        with st.form(key='keyword_form'):
+            col1, col2 = st.columns([2, 2])
             
-        with col3:
-            if st.button("🗑️ Clear Results"):
-                if 'keyword_search_results' in st.session_state:
-                    del st.session_state['keyword_search_results']
-                if 'keyword_search_keywords' in st.session_state:
-                    del st.session_state['keyword_search_keywords']
-                st.rerun()
+            with col1:
+                keywords = st.text_area(
+                    "Keywords (one per line):",
+                    value="AI\nChatGPT\nPython",
+                    height=100
+                )
+            
+            with col2:
+                subreddits = st.text_area(
+                    "Subreddits (one per line):",
+                    value="programming\ntechnology\nMachineLearning",
+                    height=100
+                )
+            
+            col1, col2 = st.columns([3, 1])
+            
+            with col1:
+                limit = st.number_input("Results per keyword:", min_value=10, max_value=100, value=20)
+            
+            with col2:
+                search_button = st.form_submit_button("🔎 Search Keywords", type="primary")
+        
+        # Clear stays outside the form so it works without a submit
+        if st.button("🗑️ Clear Results"):
+            if 'keyword_search_results' in st.session_state:
+                del st.session_state['keyword_search_results']
+            if 'keyword_search_keywords' in st.session_state:
+                del st.session_state['keyword_search_keywords']
+            for key in ('keyword_index', 'keyword_search_subs', 'keyword_search_counts'):
+                if key in st.session_state:
+                    del st.session_state[key]
+            st.rerun()
         
         if search_button:
             keyword_list = [k.strip() for k in keywords.split('\n') if k.strip()]
@@ -578,11 +960,15 @@ class RedditDashboard:
             
             if keyword_list and subreddit_list:
                 with st.spinner("Searching across subreddits..."):
-                    results = self.scout.get_keyword_discussions(keyword_list, subreddit_list, limit=limit)
+                    results = _cached_keyword_discussions(self.scout, tuple(keyword_list), tuple(subreddit_list), limit)
                     
                     # Store results in session state
                     st.session_state['keyword_search_results'] = results
                     st.session_state['keyword_search_keywords'] = keyword_list
+                    st.session_state['keyword_index'] = _build_keyword_index(results)
+                    # Aggregates for the summary, computed once instead of on every rerun
+                    st.session_state['keyword_search_subs'] = sorted({r['subreddit'] for r in results})
+                    st.session_state['keyword_search_counts'] = Counter(r['matched_keyword'] for r in results)
         
         # Display results if they exist in session state
         if 'keyword_search_results' in st.session_state and st.session_state['keyword_search_results']:
@@ -591,50 +977,10 @@ class RedditDashboard:
             
             # Summary statistics
             st.success(f"Found {len(results)} discussions")
-            unique_subreddits = set(r['subreddit'] for r in results)
-            st.info(f"📊 Results from {len(unique_subreddits)} subreddits: {', '.join(sorted(unique_subreddits))}")
-            
-            # Add global display controls
-            st.markdown("---")
-            col1, col2 = st.columns([2, 1])
-            with col1:
-                st.markdown("### 📋 Search Results")
-            with col2:
-                sort_option = st.selectbox("Sort all results by:", 
-                                         ["Score (High to Low)", "Comments (High to Low)", "Date (Newest First)"],
-                                         key="global_sort")
+            unique_subreddits = st.session_state['keyword_search_subs']
+            st.info(f"📊 Results from {len(unique_subreddits)} subreddits: {', '.join(unique_subreddits)}")
             
-            # Sort all results based on selection
-            if sort_option == "Score (High to Low)":
-                results = sorted(results, key=lambda x: x['score'], reverse=True)
-            elif sort_option == "Comments (High to Low)":
-                results = sorted(results, key=lambda x: x['num_comments'], reverse=True)
-            else:  # Date (Newest First)
-                results = sorted(results, key=lambda x: x['created_utc'], reverse=True)
-            
-            # Group by keyword
-            for keyword in keyword_list:
-                keyword_results = [r for r in results if r['matched_keyword'] == keyword]
-                if keyword_results:
-                    st.subheader(f"🔍 Results for '{keyword}' ({len(keyword_results)} found)")
-                    
-                    # Show all results, but with pagination for large result sets
-                    max_display = st.selectbox(f"Show results for '{keyword}':", 
-                                             [10, 25, 50, "All"], 
-                                             index=0, 
-                                             key=f"display_{keyword}")
-                    
-                    if max_display == "All":
-                        display_results = keyword_results
-                    else:
-                        display_results = keyword_results[:max_display]
-                    
-                    for result in display_results:
-                        self._display_discussion(result, show_subreddit=True, show_keyword=True)
-                        
-                    # Show summary if there are more results
-                    if len(keyword_results) > len(display_results):
-                        st.info(f"Showing {len(display_results)} of {len(keyword_results)} results. Select 'All' above to see everything.")
+            self._keyword_results_view(keyword_list)
                         
         # Show message for first time or no results
         elif 'keyword_search_results' in st.session_state and not st.session_state['keyword_search_results']:
@@ -642,8 +988,84 @@ class RedditDashboard:
         elif 'keyword_search_results' not in st.session_state:
             st.info("👆 Enter keywords and subreddits above, then click 'Search Keywords' to find discussions.")
     
+    @st.fragment
+    def _keyword_results_view(self, keyword_list: List[str]):
+        """Sorted, per-keyword result listing; reruns on its own when its controls change."""
+        import pandas as pd
+        
+        # Add global display controls
+        st.markdown("---")
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            st.markdown("### 📋 Search Results")
+        with col2:
+            sort_option = st.selectbox("Sort all results by:", 
+                                     list(_KEYWORD_SORT_FIELDS),
+                                     key="global_sort")
+        
+        # Orderings were indexed once per search - just look up the selected one
+        keyword_index = st.session_state['keyword_index']
+        keyword_counts = st.session_state['keyword_search_counts']
+        
+        # Group by keyword
+        for keyword in keyword_list:
+            keyword_results = keyword_index.get((sort_option, keyword), ())
+            if keyword_results:
+                st.subheader(f"🔍 Results for '{keyword}' ({keyword_counts[keyword]} found)")
+                
+                # Page through large result sets - only the current slice is rendered
+                page_col, size_col = st.columns([1, 1])
+                with size_col:
+                    page_size = st.selectbox(f"Results per page for '{keyword}':", 
+                                             [10, 25, 50], 
+                                             index=0, 
+                                             key=f"display_{keyword}")
+                
+                page_count = math.ceil(len(keyword_results) / page_size)
+                page_key = f"kw_page_{keyword}"
+                # A larger page size can leave the stored page past the end
+                if st.session_state.get(page_key, 1) > page_count:
+                    st.session_state[page_key] = page_count
+                with page_col:
+                    page = st.number_input(f"Page for '{keyword}'", 
+                                           min_value=1, 
+                                           max_value=page_count, 
+                                           step=1, 
+                                           key=page_key)
+                
+                display_results = keyword_results[(page - 1) * page_size : page * page_size]
+                
+                # One virtualized table per keyword; details only for the selected row
+                table = pd.DataFrame(display_results, columns=['title', 'subreddit', 'score', 'num_comments', 'created_utc', 'url'])
+                table['created_utc'] = pd.to_datetime(table['created_utc'], unit='s')
+                selected = st.dataframe(
+                    table,
+                    use_container_width=True,
+                    hide_index=True,
+                    on_select="rerun",
+                    selection_mode="single-row",
+                    key=f"keyword_table_{keyword}",
+                    column_config={
+                        'title': st.column_config.TextColumn("Title", width="large"),
+                        'subreddit': st.column_config.TextColumn("Subreddit"),
+                        'score': st.column_config.NumberColumn("Score"),
+                        'num_comments': st.column_config.NumberColumn("Comments"),
+                        'created_utc': st.column_config.DatetimeColumn("Posted", format="YYYY-MM-DD HH:mm"),
+                        'url': st.column_config.LinkColumn("Link", display_text="Open"),
+                    }
+                )
+                if selected.selection.rows:
+                    self._display_discussion(display_results[selected.selection.rows[0]], show_subreddit=True, show_keyword=True)
+                
+                # Show summary if there are more results
+                if page_count > 1:
+                    st.info(f"Showing {len(display_results)} of {len(keyword_results)} results (page {page} of {page_count}).")
+    
+    @st.fragment
     def _global_search_page(self):
         """Global keyword search across all of Reddit."""
+        px, go = _get_plotly()
+        
         st.title("🌐 Global Search")
         st.markdown("**FAST global search** across **ALL of Reddit** - optimized for speed!")
         
@@ -664,7 +1086,7 @@ class RedditDashboard:
         with col2:
             time_filter = st.selectbox(
                 "Time range:",
-                options=["week", "month", "year", "all", "day"],
+                options=_TIME_FILTER_OPTIONS,
                 index=0,  # Default to 'week' for faster search
                 help="Filter results by time period - shorter periods are faster"
             )
@@ -694,25 +1116,9 @@ class RedditDashboard:
                 # Country filter
                 country_filter = st.selectbox(
                     "Filter by country subreddit:",
-                    options=["All", "USA", "UK", "Canada", "Australia", "Germany", "France", "Spain", "Mexico", "Brazil", "India", "Japan", "Korea"],
+                    options=_COUNTRY_FILTER_OPTIONS,
                     help="Filter results to country-specific subreddits"
                 )
-                
-                # Map countries to subreddit patterns
-                country_subreddits = {
-                    "USA": ["usa", "america", "unitedstates"],
-                    "UK": ["unitedkingdom", "ukpolitics", "britishproblems", "casualuk"],
-                    "Canada": ["canada", "onguardforthee", "canadapolitics"],
-                    "Australia": ["australia", "straya", "aussie"],
-                    "Germany": ["germany", "de", "deutschland"],
-                    "France": ["france", "french"],
-                    "Spain": ["spain", "es", "espana", "spainfire", "catalunya", "madrid", "barcelona"],
-                    "Mexico": ["mexico", "mujico"],
-                    "Brazil": ["brasil", "brazil"],
-                    "India": ["india", "indiaspeaks", "indianews"],
-                    "Japan": ["japan", "japanlife", "newsokur"],
-                    "Korea": ["korea", "hanguk"]
-                }
         
         # Search controls
         col1, col2 = st.columns([1, 1])
@@ -722,260 +1128,290 @@ class RedditDashboard:
             if country_filter != "All":
                 st.info(f"Will search {country_filter} subreddits if enabled above")
 
-        if st.button("⚡ Search Globally (Fast)", type="primary"):
+        col1, col2 = st.columns([1, 1])
+        with col1:
+            search_clicked = st.button("⚡ Search Globally (Fast)", type="primary")
+        with col2:
+            refresh_clicked = st.button("🔄 Force refresh", help="Ignore cached results and query Reddit again")
+        
+        if search_clicked or refresh_clicked:
             # Handle both single keywords and multiple keywords (one per line)
             keyword_list = [k.strip() for k in keywords.replace(',', '\n').split('\n') if k.strip()]
             
             if keyword_list:
+                search_params = [
+                    sorted(keyword_list), time_filter, limit, search_comments,
+                    country_filter, min_score, min_comments, exclude_nsfw
+                ]
+                search_key = hashlib.blake2b(json.dumps(search_params).encode(), digest_size=16).hexdigest()
+                # Force refresh moves only this query to a new cache entry; other users' searches stay cached
+                refresh_counts = st.session_state.setdefault('global_search_refresh', {})
+                if refresh_clicked:
+                    refresh_counts[search_key] = refresh_counts.get(search_key, 0) + 1
+                
                 with st.spinner(f"Fast search across Reddit for {len(keyword_list)} keywords..."):
-                    # Update filters temporarily
-                    old_min_score = settings.min_score_threshold
-                    old_min_comments = settings.min_comments_threshold
-                    old_exclude_nsfw = settings.exclude_nsfw
-                    
-                    settings.min_score_threshold = min_score
-                    settings.min_comments_threshold = min_comments
-                    settings.exclude_nsfw = exclude_nsfw
-                    
-                    try:
-                        # Pass country filter to search function
-                        country_for_search = country_filter if country_filter != "All" else None
-                        results = self.scout.search_global_keywords(
-                            keyword_list, 
-                            limit=limit,  # Use user-defined limit for speed
-                            time_filter=time_filter, 
-                            search_comments=search_comments,
-                            country_filter=country_for_search
-                        )
-                        
-                        # Country filter is now applied during search, not after
-                        # This ensures we don't lose results but add country-specific focus when requested
-                            
-                    finally:
-                        # Restore original settings
-                        settings.min_score_threshold = old_min_score
-                        settings.min_comments_threshold = old_min_comments
-                        settings.exclude_nsfw = old_exclude_nsfw
-                    
-                    if results:
-                        st.success(f"🎯 Found {len(results)} discussions across Reddit!")
-                        
-                        # Summary statistics
-                        unique_subreddits = set(r['subreddit'] for r in results)
-                        st.markdown(f"**📊 Summary:** {len(results)} posts from {len(unique_subreddits)} different subreddits")
-                        
-                        # Keyword distribution
-                        keyword_counts = {}
-                        for r in results:
-                            keyword = r.get('matched_keyword', 'Unknown')
-                            keyword_counts[keyword] = keyword_counts.get(keyword, 0) + 1
-                        
-                        # Display keyword summary
-                        col1, col2, col3 = st.columns(3)
-                        for i, (keyword, count) in enumerate(keyword_counts.items()):
-                            if i % 3 == 0:
-                                col1.metric(f"🔍 {keyword}", count)
-                            elif i % 3 == 1:
-                                col2.metric(f"🔍 {keyword}", count)
-                            else:
-                                col3.metric(f"🔍 {keyword}", count)
-                        
-                        # Tabs for different views
-                        tab1, tab2, tab3 = st.tabs(["📑 All Results", "🏆 Top Subreddits", "📊 Analytics"])
-                        
-                        with tab1:
-                            # Display controls
-                            col1, col2 = st.columns([2, 1])
-                            with col1:
-                                display_count = st.selectbox("Results to display:", [25, 50, 100, "All"], index=1)
-                            with col2:
-                                sort_by = st.selectbox("Sort by:", ["Score", "Comments", "Date"], index=0)
-                            
-                            # Sort results
-                            if sort_by == "Score":
-                                sorted_results = sorted(results, key=lambda x: x['score'], reverse=True)
-                            elif sort_by == "Comments":
-                                sorted_results = sorted(results, key=lambda x: x['num_comments'], reverse=True)
-                            else:  # Date
-                                sorted_results = sorted(results, key=lambda x: x['created_utc'], reverse=True)
-                            
-                            # Determine how many to show
-                            if display_count == "All":
-                                display_results = sorted_results
-                            else:
-                                display_results = sorted_results[:display_count]
-                            
-                            st.write(f"Showing {len(display_results)} of {len(results)} total results")
-                            
-                            # Display results
-                            for idx, post in enumerate(display_results):
-                                with st.container():
-                                    col1, col2 = st.columns([5, 1])
-                                    
-                                    with col1:
-                                        # Title with link - handle both 'permalink' and 'url' fields
-                                        post_url = post.get('permalink', post.get('url', '#'))
-                                        st.markdown(f"### [{post['title']}]({post_url})")
-                                        
-                                        # Metadata
-                                        match_location = post.get('match_location', 'post')
-                                        match_icon = "💬" if match_location == 'comment' else "📝"
-                                        
-                                        meta_parts = [
-                                            f"r/{post['subreddit']}",
-                                            f"👤 u/{post['author']}",
-                                            f"⬆️ {post['score']:,}",
-                                            f"💬 {post['num_comments']:,}",
-                                            f"{match_icon} {post['matched_keyword']} ({'in comment' if match_location == 'comment' else 'in post'})"
-                                        ]
-                                        
-                                        if post.get('subreddit_subscribers', 0) > 0:
-                                            meta_parts.append(f"👥 {post['subreddit_subscribers']:,} subscribers")
-                                        
-                                        st.markdown(" • ".join(meta_parts))
-                                        
-                                        # Show matched comment if available
-                                        if match_location == 'comment' and post.get('matched_comment'):
-                                            st.markdown(f"**💬 Matched comment:** _{post['matched_comment']}_")
-                                        
-                                        # Preview text if available and enabled
-                                        if show_preview and post.get('preview_text'):
-                                            st.markdown(f"_{post['preview_text']}_")
-                                        
-                                        # Time info
-                                        st.caption(f"Posted {post['created_utc'].strftime('%Y-%m-%d %H:%M')}")
-                                    
-                                    with col2:
-                                        # Engagement metrics
-                                        engagement = (post['score'] + post['num_comments'] * 2) / 100
-                                        st.metric("Engagement", f"{engagement:.1f}")
-                                    
-                                    st.markdown("---")
-                        
-                        with tab2:
-                            # Top subreddits analysis
-                            subreddit_stats = {}
-                            for post in results:
-                                sub = post['subreddit']
-                                if sub not in subreddit_stats:
-                                    subreddit_stats[sub] = {
-                                        'count': 0,
-                                        'total_score': 0,
-                                        'total_comments': 0,
-                                        'subscribers': post.get('subreddit_subscribers', 0)
-                                    }
-                                subreddit_stats[sub]['count'] += 1
-                                subreddit_stats[sub]['total_score'] += post['score']
-                                subreddit_stats[sub]['total_comments'] += post['num_comments']
-                            
-                            # Convert to dataframe
-                            sub_df = pd.DataFrame([
-                                {
-                                    'Subreddit': sub,
-                                    'Posts': stats['count'],
-                                    'Avg Score': stats['total_score'] / stats['count'],
-                                    'Avg Comments': stats['total_comments'] / stats['count'],
-                                    'Subscribers': stats['subscribers']
-                                }
-                                for sub, stats in subreddit_stats.items()
-                            ])
-                            
-                            # Sort by post count
-                            sub_df = sub_df.sort_values('Posts', ascending=False).head(20)
-                            
-                            # Display chart
-                            if not sub_df.empty:
-                                fig = px.bar(
-                                    sub_df.head(15), 
-                                    x='Subreddit', 
-                                    y='Posts',
-                                    title="Top Subreddits by Post Count",
-                                    hover_data=['Avg Score', 'Avg Comments', 'Subscribers']
-                                )
-                                fig.update_layout(xaxis_tickangle=-45)
-                                st.plotly_chart(fig, use_container_width=True)
-                                
-                                # Display table
-                                st.dataframe(
-                                    sub_df.style.format({
-                                        'Avg Score': '{:.0f}',
-                                        'Avg Comments': '{:.0f}',
-                                        'Subscribers': '{:,.0f}'
-                                    }),
-                                    use_container_width=True
-                                )
-                        
-                        with tab3:
-                            # Analytics
-                            st.subheader("📊 Search Analytics")
-                            
-                            # Time distribution
-                            times_df = pd.DataFrame([
-                                {'Time': post['created_utc'], 'Score': post['score']}
-                                for post in results
-                            ])
-                            
-                            if not times_df.empty:
-                                fig = px.scatter(
-                                    times_df, 
-                                    x='Time', 
-                                    y='Score',
-                                    title="Score Distribution Over Time"
-                                )
-                                st.plotly_chart(fig, use_container_width=True)
-                            
-                            # Engagement distribution
-                            col1, col2 = st.columns(2)
-                            
-                            with col1:
-                                # Score distribution
-                                scores = [post['score'] for post in results]
-                                fig = px.histogram(
-                                    x=scores, 
-                                    nbins=30,
-                                    title="Score Distribution",
-                                    labels={'x': 'Score', 'y': 'Number of Posts'}
-                                )
-                                st.plotly_chart(fig, use_container_width=True)
-                            
-                            with col2:
-                                # Comments distribution
-                                comments = [post['num_comments'] for post in results]
-                                fig = px.histogram(
-                                    x=comments, 
-                                    nbins=30,
-                                    title="Comments Distribution",
-                                    labels={'x': 'Number of Comments', 'y': 'Number of Posts'}
-                                )
-                                st.plotly_chart(fig, use_container_width=True)
-                            
-                            # Summary stats
-                            st.subheader("📈 Summary Statistics")
-                            
-                            total_score = sum(post['score'] for post in results)
-                            total_comments = sum(post['num_comments'] for post in results)
-                            
-                            col1, col2, col3, col4 = st.columns(4)
-                            col1.metric("Total Score", f"{total_score:,}")
-                            col2.metric("Total Comments", f"{total_comments:,}")
-                            col3.metric("Avg Score", f"{total_score/len(results):.0f}")
-                            col4.metric("Avg Comments", f"{total_comments/len(results):.0f}")
-                            
-                    else:
-                        st.warning("No results found. Try different keywords or adjust filters.")
-                        st.info("💡 **Tips to find more results:**")
-                        st.markdown("""
-                        - Try different **time ranges** (change from 'week' to 'all' or 'month')
-                        - Use **broader keywords** (e.g., 'invest' instead of specific company names)
-                        - Check **spelling** and try alternative terms
-                        - Lower the **minimum score** filter in Advanced Options
-                        - Try **related terms** or synonyms
-                        """)
+                    # Country filter is applied during search, adding country-specific focus when requested
+                    country_for_search = country_filter if country_filter != "All" else None
+                    results = _cached_global_search(
+                        self.scout,
+                        tuple(sorted(keyword_list)),
+                        limit,
+                        time_filter,
+                        search_comments,
+                        country_for_search,
+                        min_score,
+                        min_comments,
+                        exclude_nsfw,
+                        refresh_counts.get(search_key, 0)
+                    )
+                
+                # Keep results across reruns so paging and tab widgets don't wipe them. The cached
+                # fetch may have expired and refetched, so the old aggregations are rebuilt from
+                # these results on every search click
+                st.session_state.setdefault('global_search_bundles', OrderedDict()).pop(search_key, None)
+                st.session_state.global_search_key = search_key
+                st.session_state.global_search_results = results
+                st.session_state.global_results_offset = 0
             else:
                 st.warning("Please enter at least one keyword to search.")
+        
+        if 'global_search_results' not in st.session_state:
+            return
+        
+        results = st.session_state.global_search_results
+        
+        if results:
+            st.success(f"🎯 Found {len(results)} discussions across Reddit!")
+            
+            # One columnar frame per search feeds the summary, every tab and the sorting;
+            # it is cached so widget reruns don't rebuild it
+            bundle = _global_search_bundle(st.session_state.global_search_key, results)
+            df = bundle['df']
+            
+            # Summary statistics
+            st.markdown(f"**📊 Summary:** {len(results)} posts from {bundle['subreddit_count']} different subreddits")
+            
+            # Keyword distribution
+            keyword_counts = bundle['keyword_counts']
+            
+            # Display keyword summary
+            with st.container():
+                n_cols = min(len(keyword_counts), 6)
+                cols = st.columns(n_cols)
+                for i, (keyword, count) in enumerate(keyword_counts.items()):
+                    cols[i % n_cols].metric(f"🔍 {keyword}", count)
+            
+            # A single post has nothing to aggregate - skip the subreddit and analytics tabs
+            if len(results) < 2:
+                self._render_global_results(results, df, show_preview)
+                return
+            
+            # Tabs for different views
+            tab1, tab2, tab3 = st.tabs(["📑 All Results", "🏆 Top Subreddits", "📊 Analytics"])
+            
+            with tab1:
+                self._render_global_results(results, df, show_preview)
+            
+            with tab2:
+                # Top subreddits analysis
+                sub_df = bundle['sub_df']
+                
+                # Display chart
+                if not sub_df.empty:
+                    st.plotly_chart(_subreddit_bar_figure(sub_df), use_container_width=True)
+                    
+                    # Display table
+                    st.dataframe(
+                        sub_df.style.format({
+                            'Avg Score': '{:.0f}',
+                            'Avg Comments': '{:.0f}',
+                            'Subscribers': '{:,.0f}'
+                        }),
+                        use_container_width=True
+                    )
+            
+            with tab3:
+                # Analytics
+                st.subheader("📊 Search Analytics")
+                
+                # Time distribution - scatter draws every point, so decimate large result sets
+                times_df = df[['created_utc', 'score']].rename(columns={'created_utc': 'Time', 'score': 'Score'})
+                if len(times_df) > _SCATTER_MAX_POINTS:
+                    times_df = times_df.sample(_SCATTER_MAX_POINTS, random_state=0)
+                
+                if not times_df.empty:
+                    fig = px.scatter(
+                        times_df, 
+                        x='Time', 
+                        y='Score',
+                        title="Score Distribution Over Time",
+                        render_mode='webgl'
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                
+                # Engagement distribution
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    # Score distribution
+                    fig = _histogram_figure(df['score'].to_numpy(np.int64).tobytes(), "Score Distribution", "Score")
+                    st.plotly_chart(fig, use_container_width=True)
+                
+                with col2:
+                    # Comments distribution
+                    fig = _histogram_figure(
+                        df['num_comments'].to_numpy(np.int64).tobytes(), "Comments Distribution", "Number of Comments"
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                
+                # Summary stats
+                st.subheader("📈 Summary Statistics")
+                
+                total_score = bundle['total_score']
+                total_comments = bundle['total_comments']
+                
+                col1, col2, col3, col4 = st.columns(4)
+                col1.metric("Total Score", f"{total_score:,}")
+                col2.metric("Total Comments", f"{total_comments:,}")
+                col3.metric("Avg Score", f"{total_score/len(results):.0f}")
+                col4.metric("Avg Comments", f"{total_comments/len(results):.0f}")
+                
+        else:
+            st.warning("No results found. Try different keywords or adjust filters.")
+            st.info("💡 **Tips to find more results:**")
+            st.markdown("""
+            - Try different **time ranges** (change from 'week' to 'all' or 'month')
+            - Use **broader keywords** (e.g., 'invest' instead of specific company names)
+            - Check **spelling** and try alternative terms
+            - Lower the **minimum score** filter in Advanced Options
+            - Try **related terms** or synonyms
+            """)
+    
+    def _render_global_results(self, results: List[Dict], df: "pd.DataFrame", show_preview: bool):
+        """Render global search results one page at a time; df rows line up with results."""
+        # Display controls
+        col1, col2, col3 = st.columns([2, 1, 1])
+        with col1:
+            display_count = st.selectbox("Results to display:", _DISPLAY_COUNTS, index=1)
+        with col2:
+            sort_by = st.selectbox("Sort by:", _SORT_OPTIONS, index=0)
+        with col3:
+            # One table for the page; the per-post layout is opt-in since it costs a dozen widgets per post
+            detailed = st.toggle("Detailed view", value=False, help="Show previews and matched comments for each post")
+        
+        # The table virtualizes its rows, so it can take everything; the detailed
+        # layout builds widgets per post and always pages, even for "All"
+        show_all = display_count == "All" and not detailed
+        
+        # Determine which page to show
+        total = len(df)
+        if show_all:
+            page_size = total
+        else:
+            page_size = _DETAILED_PAGE_SIZE if display_count == "All" else display_count
+        offset = st.session_state.get('global_results_offset', 0)
+        if show_all or offset >= total:
+            offset = 0
+        
+        # Order only as far as the current page reaches - a partial selection
+        # instead of a full sort unless everything is shown
+        sort_column = _GLOBAL_SORT_COLUMNS[sort_by]
+        if show_all:
+            order = df.sort_values(sort_column, ascending=False, kind='stable').index
+        else:
+            order = df[sort_column].nlargest(offset + page_size, keep='first').index
+        page_index = order[offset:offset + page_size]
+        
+        st.write(f"Showing {offset + 1}-{offset + len(page_index)} of {total} total results")
+        
+        if detailed:
+            # Fixed-height scroll area; posts are pulled from results one at a time as they render
+            with st.container(height=800):
+                formatted = df.loc[page_index, ['created_str', 'score_str', 'comments_str', 'engagement']].itertuples()
+                for row in formatted:
+                    self._render_global_post(results[row.Index], row, show_preview)
+        else:
+            st.dataframe(
+                df.loc[page_index, list(_GLOBAL_TABLE_COLUMNS)],
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    'title': st.column_config.TextColumn("Title", width="large"),
+                    'subreddit': st.column_config.TextColumn("Subreddit"),
+                    'author': st.column_config.TextColumn("Author"),
+                    'score': st.column_config.NumberColumn("Score"),
+                    'num_comments': st.column_config.NumberColumn("Comments"),
+                    'matched_keyword': st.column_config.TextColumn("Keyword"),
+                    'permalink': st.column_config.LinkColumn("Link", display_text="Open"),
+                    'created_utc': st.column_config.DatetimeColumn("Posted", format="YYYY-MM-DD HH:mm"),
+                }
+            )
+        
+        # Page through large result sets instead of rendering everything at once
+        if page_size < total:
+            col1, col2 = st.columns(2)
+            with col1:
+                st.button(
+                    "⬅️ Previous",
+                    disabled=offset == 0,
+                    on_click=_shift_offset,
+                    args=('global_results_offset', -page_size)
+                )
+            with col2:
+                st.button(
+                    f"Next {page_size} ➡️",
+                    disabled=offset + page_size >= total,
+                    on_click=_shift_offset,
+                    args=('global_results_offset', page_size)
+                )
+    
+    def _render_global_post(self, post: Dict, formatted, show_preview: bool):
+        """Render one global search result; formatted carries its pre-formatted display strings."""
+        with st.container():
+            col1, col2 = st.columns([5, 1])
+            
+            with col1:
+                # Title with link
+                st.markdown(f"### [{post['title']}]({post['permalink']})")
+                
+                # Metadata
+                match_location = post.get('match_location', 'post')
+                match_icon = _COMMENT_ICON if match_location == 'comment' else _POST_ICON
+                
+                meta_parts = [
+                    f"r/{post['subreddit']}",
+                    f"👤 u/{post['author']}",
+                    f"⬆️ {formatted.score_str}",
+                    f"💬 {formatted.comments_str}",
+                    f"{match_icon} {post['matched_keyword']} ({'in comment' if match_location == 'comment' else 'in post'})"
+                ]
+                
+                if post['subreddit_subscribers'] > 0:
+                    meta_parts.append(f"👥 {post['subreddit_subscribers']:,} subscribers")
+                
+                st.markdown(" • ".join(meta_parts))
+                
+                # Show matched comment if available
+                if match_location == 'comment' and post.get('matched_comment'):
+                    st.markdown(f"**💬 Matched comment:** _{post['matched_comment']}_")
+                
+                # Preview text if available and enabled
+                if show_preview and post.get('preview_text'):
+                    st.markdown(f"_{post['preview_text']}_")
+                
+                # Time info
+                st.caption(f"Posted {formatted.created_str}")
+            
+            with col2:
+                # Engagement metrics
+                st.metric("Engagement", f"{formatted.engagement:.1f}")
+            
+            st.markdown("---")
     
     def _wordcloud_page(self):
         """Word cloud generation from subreddit content."""
+        px, go = _get_plotly()
+        
         st.title("☁️ Word Cloud")
         st.markdown("Visualize the most common words in subreddit discussions")
         
@@ -995,7 +1431,7 @@ class RedditDashboard:
         if st.button("☁️ Generate Word Cloud", type="primary") and subreddit:
             with st.spinner("Generating word cloud..."):
                 try:
-                    wordcloud_data = self.scout.generate_wordcloud_data(subreddit, limit=limit)
+                    wordcloud_data = _cached_wordcloud_data(self.scout, subreddit, limit)
                     
                     if 'error' in wordcloud_data:
                         st.error(f"Error: {wordcloud_data.get('error', 'Unknown error')}")
@@ -1008,7 +1444,7 @@ class RedditDashboard:
                     return
                 
                 # Only proceed if we have valid data
-                if isinstance(wordcloud_data, dict) and 'word_frequencies' in wordcloud_data and wordcloud_data.get('word_frequencies'):
+                if isinstance(wordcloud_data, dict) and len(wordcloud_data.get('word_frequencies', ())):
                     st.success(f"Analyzed {wordcloud_data['total_words']} words from r/{subreddit}")
                     
                     # Show additional stats
@@ -1018,19 +1454,18 @@ class RedditDashboard:
                     # Word frequency chart
                     st.subheader("📊 Top Words")
                     
-                    top_words = list(wordcloud_data['word_frequencies'].items())[:20]
-                    if top_words:
-                        words_df = pd.DataFrame(top_words, columns=['Word', 'Frequency'])
-                        
+                    # Frequencies arrive most frequent first, so the top 20 is a slice of the packed columns
+                    top_words = wordcloud_data['word_frequencies'][:20]
+                    if len(top_words):
                         fig = px.bar(
-                            words_df, 
-                            x='Word', 
-                            y='Frequency',
+                            x=top_words['word'], 
+                            y=top_words['count'],
+                            labels={'x': 'Word', 'y': 'Frequency'},
                             title=f"Most Common Words in r/{subreddit}",
-                            color='Frequency',
+                            color=top_words['count'],
                             color_continuous_scale='blues'
                         )
-                        fig.update_layout(xaxis_tickangle=-45, showlegend=False)
+                        fig.update_layout(xaxis_tickangle=-45, showlegend=False, coloraxis_colorbar_title='Frequency')
                         st.plotly_chart(fig, use_container_width=True)
                         
                         # Word statistics
@@ -1048,28 +1483,12 @@ class RedditDashboard:
                         
                         # Display word cloud visualization using wordcloud library
                         try:
-                            from wordcloud import WordCloud
-                            import matplotlib.pyplot as plt
-                            
-                            # Generate word cloud
-                            wc = WordCloud(
-                                width=800, 
-                                height=400, 
-                                background_color='white',
-                                colormap='Blues',
-                                max_words=100
-                            ).generate_from_frequencies(wordcloud_data['word_frequencies'])
-                            
-                            # Display the word cloud
-                            fig, ax = plt.subplots(figsize=(10, 5))
-                            ax.imshow(wc, interpolation='bilinear')
-                            ax.axis('off')
-                            ax.set_title(f"Word Cloud for r/{subreddit}", fontsize=16, pad=20)
-                            st.pyplot(fig)
-                            plt.close()
+                            # Cached on the frequencies, so identical inputs skip the layout entirely
+                            png = _render_wordcloud_png(wordcloud_data['word_frequencies'])
+                            st.image(png, caption=f"Word Cloud for r/{subreddit}", use_container_width=True)
                             
                         except ImportError:
-                            st.info("Install 'matplotlib' for word cloud visualization")
+                            st.info("Install 'wordcloud' for word cloud visualization")
                         except Exception as e:
                             st.warning(f"Could not generate visual word cloud: {e}")
                         
@@ -1136,13 +1555,58 @@ class RedditDashboard:
         
         subreddits_text = st.text_area(
             "Default subreddits (one per line):",
-            value='\n'.join(settings.default_subreddits),
+            value='\n'.join(_DEFAULT_SUBS),
             height=100
         )
         
         if st.button("💾 Save Settings"):
             st.success("Settings saved! (Note: This is a demo - settings are not persisted)")
     
+    def _stream_discussions(self, listing_key: tuple, stream_factory: Callable[[], Iterator[Dict]],
+                            status, sort_key: Optional[str] = None, show_age: bool = False) -> List[Dict]:
+        """Render discussions in chunks while they stream in; recent listings render from the store."""
+        stop_slot = st.empty()
+        placeholder = st.empty()
+        discussions = _get_cached_listing(listing_key)
+        
+        if discussions is None:
+            status.info("Fetching discussions...")
+            # Clicking Stop reruns the page, which abandons the stream mid-way
+            stop_slot.button("⏹️ Stop loading", key=f"stop_{listing_key[0]}")
+            
+            discussions = []
+            with placeholder.container():
+                chunk = []
+                for discussion in stream_factory():
+                    chunk.append(discussion)
+                    if len(chunk) == _STREAM_CHUNK_SIZE:
+                        self._display_discussion_chunk(chunk, len(discussions) + 1, show_age)
+                        discussions.extend(chunk)
+                        chunk = []
+                if chunk:
+                    self._display_discussion_chunk(chunk, len(discussions) + 1, show_age)
+                    discussions.extend(chunk)
+            stop_slot.empty()
+            
+            streamed_order = [d['id'] for d in discussions]
+            if sort_key:
+                discussions = sorted(discussions, key=lambda x: x[sort_key], reverse=True)
+            _put_cached_listing(listing_key, discussions)
+            
+            if [d['id'] for d in discussions] == streamed_order:
+                return discussions
+        
+        # Final ordering (or a cached listing) replaces the streamed chunks
+        with placeholder.container():
+            self._display_discussion_chunk(discussions, 1, show_age)
+        return discussions
+    
+    def _display_discussion_chunk(self, discussions: List[Dict], start: int, show_age: bool):
+        """Render a run of discussions numbered from start."""
+        with st.container():
+            for i, discussion in enumerate(discussions, start):
+                self._display_discussion(discussion, i, show_age=show_age)
+    
     def _display_discussion(self, discussion: Dict, index: int = None, show_age: bool = False, 
                           show_subreddit: bool = False, show_keyword: bool = False):
         """Display a discussion in a consistent format."""
@@ -1161,7 +1625,7 @@ class RedditDashboard:
                 if show_keyword:
                     st.write(f"🔍 Matched: **{discussion.get('matched_keyword', '')}**")
                 
-                post_url = discussion.get('url', discussion.get('permalink', '#'))
+                post_url = discussion['url']
                 st.write(f"🔗 [View on Reddit]({post_url})")
             
             with col2:
@@ -1170,7 +1634,7 @@ class RedditDashboard:
                 st.metric("Upvote %", f"{discussion['upvote_ratio']*100:.0f}%")
                 
                 if show_age:
-                    age = datetime.now() - discussion['created_utc']
+                    age = timedelta(seconds=time.time() - discussion['created_utc'])
                     if age.days > 0:
                         st.metric("Age", f"{age.days}d")
                     else:
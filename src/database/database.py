@@ -1,53 +1,133 @@
-"""Database connection and session management for Reddit Scout Pro."""
+"""Database connection and session management for Reddit Scout Pro.
+
+PostgreSQL pool tuning is read from the environment:
+
+- DB_POOL_SIZE / DB_MAX_OVERFLOW / DB_POOL_TIMEOUT: pool sizing (10 / 20 / 30s)
+- DB_POOL_RECYCLE: seconds before a pooled connection is replaced (60)
+- DB_POOL_PRE_PING: 1 to ping connections on checkout (0)
+- DB_CONNECT_TIMEOUT: seconds libpq waits for a new connection (5)
+
+Pre-ping is off by default because behind PgBouncer in transaction pooling
+mode the extra SELECT 1 pins a backend and leaves it idle in transaction;
+pool_recycle retires dead connections without that side effect. Set
+DB_POOL_PRE_PING=1 when connecting straight to Postgres.
+"""
 
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
+import threading
+import importlib.util
+import time
+from functools import lru_cache
+from typing import Optional
+from urllib.parse import quote
+from sqlalchemy import create_engine, delete, event, func, inspect, select, text
+from contextlib import contextmanager
+from sqlalchemy.orm import scoped_session, sessionmaker, Session
+from sqlalchemy.pool import NullPool
 from .models import Base, UserAPIKey
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured by the entrypoint; this module only emits
 logger = logging.getLogger(__name__)
 
+__all__ = [
+    "DatabaseManager",
+    "get_db_manager",
+    "get_db",
+    "get_db_session",
+    "session_scope",
+    "init_db",
+    "check_db_health",
+    "get_user_api_keys",
+    "upsert_user_api_keys",
+    "delete_user_api_keys",
+    "invalidate_user_api_keys",
+]
+
+@lru_cache(maxsize=1)
+def _resolve_database_url() -> str:
+    """Resolve the database URL from the environment once per process."""
+    # Try standard DATABASE_URL first (Render, Heroku, etc.)
+    database_url = os.getenv('DATABASE_URL')
+    
+    if database_url:
+        # Fix postgres:// to postgresql:// if needed (Heroku compatibility)
+        if database_url.startswith('postgres://'):
+            database_url = database_url.replace('postgres://', 'postgresql://', 1)
+            logger.debug("Fixed postgres:// to postgresql:// in DATABASE_URL")
+        
+        logger.debug("Using DATABASE_URL from environment")
+        return database_url
+    
+    # Fallback to Replit's individual database environment variables
+    db_host = os.getenv('DB_HOST', 'localhost')
+    db_port = os.getenv('DB_PORT', '5432')
+    db_name = os.getenv('DB_NAME', 'reddit_scout')
+    db_user = os.getenv('DB_USER', 'postgres')
+    db_pass = os.getenv('DB_PASS', '')
+    
+    if db_host and db_port and db_name and db_user:
+        # Quote credentials so special characters can't break the URL
+        database_url = f"postgresql://{quote(db_user, safe='')}:{quote(db_pass, safe='')}@{db_host}:{db_port}/{db_name}"
+        logger.debug("Using individual database environment variables")
+        return database_url
+    
+    # Development fallback to SQLite
+    logger.warning("No PostgreSQL configuration found, using SQLite for development")
+    return "sqlite:///reddit_scout.db"
+
+def _postgres_driver_url(url: str) -> str:
+    """Pin a bare postgresql:// URL to psycopg (v3) when it is installed.
+    
+    psycopg's C implementation has lower per-statement overhead than psycopg2;
+    URLs that already name a driver are left alone, and psycopg2 remains the
+    default when psycopg isn't available.
+    """
+    if url.startswith('postgresql://') and importlib.util.find_spec('psycopg') is not None:
+        return 'postgresql+psycopg://' + url[len('postgresql://'):]
+    return url
+
+def _sqlite_engine(url: str, timeout: int = 20):
+    """File-backed SQLite engine safe for Streamlit's concurrent script runs.
+    
+    NullPool opens a connection per checkout instead of funnelling every
+    thread through one shared connection, and WAL lets readers proceed while
+    a writer holds the lock.
+    """
+    engine = create_engine(
+        url,
+        poolclass=NullPool,
+        connect_args={
+            "check_same_thread": False,
+            "timeout": timeout
+        },
+        query_cache_size=500,
+        logging_name="reddit_scout",
+        echo=False  # Set to True for SQL debugging
+    )
+    
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={timeout * 1000}")
+        cursor.close()
+    
+    return engine
+
 class DatabaseManager:
     """Manages database connections and sessions."""
     
     def __init__(self):
         self.engine = None
         self.SessionLocal = None
+        self.ScopedSession = None
         self._initialize_database()
     
     def _get_database_url(self) -> str:
         """Get database URL from environment variables."""
-        # Try standard DATABASE_URL first (Render, Heroku, etc.)
-        database_url = os.getenv('DATABASE_URL')
-        
-        if database_url:
-            # Fix postgres:// to postgresql:// if needed (Heroku compatibility)
-            if database_url.startswith('postgres://'):
-                database_url = database_url.replace('postgres://', 'postgresql://', 1)
-                logger.info("Fixed postgres:// to postgresql:// in DATABASE_URL")
-            
-            logger.info("Using DATABASE_URL from environment")
-            return database_url
-        
-        # Fallback to Replit's individual database environment variables
-        db_host = os.getenv('DB_HOST', 'localhost')
-        db_port = os.getenv('DB_PORT', '5432')
-        db_name = os.getenv('DB_NAME', 'reddit_scout')
-        db_user = os.getenv('DB_USER', 'postgres')
-        db_pass = os.getenv('DB_PASS', '')
-        
-        if all([db_host, db_port, db_name, db_user]):
-            database_url = f"postgresql://{db_user}:{db_pass}@{db_host}:{db_port}/{db_name}"
-            logger.info("Using individual database environment variables")
-            return database_url
-        
-        # Development fallback to SQLite
-        logger.warning("No PostgreSQL configuration found, using SQLite for development")
-        return "sqlite:///reddit_scout.db"
+        return _resolve_database_url()
     
     def _initialize_database(self):
         """Initialize database connection and create tables."""
@@ -56,35 +136,28 @@ class DatabaseManager:
         # Configure engine based on database type
         if database_url.startswith('sqlite'):
             # SQLite configuration for development
-            self.engine = create_engine(
-                database_url,
-                poolclass=StaticPool,
-                connect_args={
-                    "check_same_thread": False,
-                    "timeout": 20
-                },
-                echo=False  # Set to True for SQL debugging
-            )
+            self.engine = _sqlite_engine(database_url)
         else:
             # PostgreSQL configuration for production
             try:
                 self.engine = create_engine(
-                    database_url,
-                    pool_size=10,
-                    max_overflow=20,
-                    pool_pre_ping=True,
+                    _postgres_driver_url(database_url),
+                    pool_size=int(os.getenv('DB_POOL_SIZE', '10')),
+                    max_overflow=int(os.getenv('DB_MAX_OVERFLOW', '20')),
+                    pool_timeout=int(os.getenv('DB_POOL_TIMEOUT', '30')),
+                    pool_recycle=int(os.getenv('DB_POOL_RECYCLE', '60')),
+                    pool_pre_ping=bool(int(os.getenv('DB_POOL_PRE_PING', '0'))),
+                    # libpq waits indefinitely by default; fail fast on a bad DATABASE_URL
+                    connect_args={'connect_timeout': int(os.getenv('DB_CONNECT_TIMEOUT', '5'))},
+                    query_cache_size=1200,
+                    logging_name="reddit_scout",
                     echo=False  # Set to True for SQL debugging
                 )
             except Exception as e:
-                if "psycopg2" in str(e).lower():
-                    logger.error("PostgreSQL driver (psycopg2) not available. Using SQLite fallback for testing.")
+                if "psycopg" in str(e).lower():
+                    logger.error("PostgreSQL driver (psycopg/psycopg2) not available. Using SQLite fallback for testing.")
                     # Fallback to SQLite for testing
-                    self.engine = create_engine(
-                        "sqlite:///reddit_scout_fallback.db",
-                        poolclass=StaticPool,
-                        connect_args={"check_same_thread": False},
-                        echo=False
-                    )
+                    self.engine = _sqlite_engine("sqlite:///reddit_scout_fallback.db", timeout=5)
                 else:
                     raise
         
@@ -94,6 +167,8 @@ class DatabaseManager:
             autoflush=False,
             bind=self.engine
         )
+        # One session per thread, reused by every call made inside a get_db() block
+        self.ScopedSession = scoped_session(self.SessionLocal)
         
         logger.info(f"Database initialized with URL: {database_url.split('@')[0]}@***")
     
@@ -101,36 +176,115 @@ class DatabaseManager:
         """Create all database tables."""
         try:
             Base.metadata.create_all(bind=self.engine)
+            self._ensure_user_keys_unique()
             logger.info("Database tables created successfully")
         except Exception as e:
             logger.error(f"Error creating database tables: {e}")
             raise
     
+    def _ensure_user_keys_unique(self):
+        """Bring an existing user_api_keys table up to one row per user.
+        
+        create_all never alters existing tables, so databases created before user_id
+        became unique lack the index that ON CONFLICT (user_id) relies on. Keep each
+        user's newest row (ties broken by highest id), then add the unique index.
+        A no-op once any unique index or constraint covers user_id.
+        """
+        insp = inspect(self.engine)
+        unique_cols = [ix['column_names'] for ix in insp.get_indexes('user_api_keys') if ix.get('unique')]
+        unique_cols += [uc['column_names'] for uc in insp.get_unique_constraints('user_api_keys')]
+        if ['user_id'] in unique_cols:
+            return
+        
+        with self.engine.begin() as conn:
+            removed = conn.execute(text(
+                "DELETE FROM user_api_keys WHERE id IN ("
+                " SELECT id FROM ("
+                "  SELECT id, ROW_NUMBER() OVER ("
+                "   PARTITION BY user_id ORDER BY updated_at DESC, id DESC) AS rn"
+                "  FROM user_api_keys) ranked"
+                " WHERE rn > 1)"
+            )).rowcount
+            conn.execute(text(
+                "CREATE UNIQUE INDEX IF NOT EXISTS ix_user_api_keys_user_id_unique"
+                " ON user_api_keys (user_id)"
+            ))
+        logger.info(f"user_api_keys: removed {removed} duplicate row(s), added unique index on user_id")
+    
     def get_session(self) -> Session:
         """Get a database session."""
         return self.SessionLocal()
     
+    def ping(self) -> None:
+        """Run SELECT 1 on a connection checked out of the pool for this probe."""
+        with self.engine.connect() as conn:
+            conn.exec_driver_sql("SELECT 1")
+    
     def close_connection(self):
         """Close database connection."""
         if self.engine:
             self.engine.dispose()
             logger.info("Database connection closed")
 
-# Global database manager instance
-db_manager = DatabaseManager()
+# Global database manager, created on first use rather than at import time
+_db_manager: Optional[DatabaseManager] = None
+_db_manager_lock = threading.Lock()
+
+def get_db_manager() -> DatabaseManager:
+    """Return the process-wide DatabaseManager, creating the engine on first call."""
+    global _db_manager
+    if _db_manager is None:
+        with _db_manager_lock:
+            if _db_manager is None:
+                _db_manager = DatabaseManager()
+    return _db_manager
 
+@contextmanager
 def get_db():
-    """Dependency to get database session."""
-    db = db_manager.get_session()
+    """Request-scoped session: commits on success, rolls back on error, then is released."""
+    manager = get_db_manager()
+    db = manager.ScopedSession()
     try:
         yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
     finally:
-        db.close()
+        manager.ScopedSession.remove()
+
+_DB_TRACE = os.getenv('DB_TRACE', '').lower() in ('1', 'true', 'yes')
+
+@contextmanager
+def session_scope(op: str = "db", session: Optional[Session] = None):
+    """Transactional scope for one DB operation.
+    
+    Owns a fresh session (commit on success, rollback on error, always closed)
+    unless the caller passes its own, in which case the work joins the caller's
+    transaction. Set DB_TRACE=1 to log how long each operation took.
+    """
+    start = time.perf_counter() if _DB_TRACE else 0.0
+    try:
+        if session is not None:
+            yield session
+            return
+        db = get_db_session()
+        try:
+            yield db
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+    finally:
+        if _DB_TRACE:
+            logger.debug("db op %s took %.2fms", op, (time.perf_counter() - start) * 1000)
 
 def init_db():
     """Initialize database and create tables."""
     try:
-        db_manager.create_tables()
+        get_db_manager().create_tables()
         logger.info("Database initialization completed")
         return True
     except Exception as e:
@@ -139,17 +293,14 @@ def init_db():
 
 def get_db_session():
     """Get a database session (for direct use)."""
-    return db_manager.get_session()
+    return get_db_manager().get_session()
 
 # Health check function
 def check_db_health():
     """Check database connectivity."""
     try:
-        from sqlalchemy import text
-        db = get_db_session()
-        # Simple query to test connection
-        db.execute(text("SELECT 1"))
-        db.close()
+        # Plain driver SQL on a pooled connection - no ORM session or SQL compile per probe
+        get_db_manager().ping()
         return True
     except Exception as e:
         logger.error(f"Database health check failed: {e}")
@@ -158,73 +309,135 @@ def check_db_health():
 # ------------------------------------------------------------
 # User API Keys CRUD (Phase 3)
 # ------------------------------------------------------------
-from typing import Optional, Dict
-from ..core.encryption import encrypt_api_key, decrypt_api_key
+from typing import Dict, Tuple
+from ..core.encryption import encrypt_many, decrypt_many
+
+# Decrypted keys per user, kept in process memory only for a short TTL;
+# upsert_user_api_keys drops a user's entry as soon as their keys change.
+_KEYS_CACHE_TTL = 60
+_KEYS_CACHE_MAX = 4096
+_keys_cache: Dict[int, Tuple[float, Dict[str, Optional[str]]]] = {}
+_keys_cache_lock = threading.RLock()
+
+def _cached_keys(user_id: int) -> Optional[Dict[str, Optional[str]]]:
+    with _keys_cache_lock:
+        entry = _keys_cache.get(user_id)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= _KEYS_CACHE_TTL:
+            del _keys_cache[user_id]
+            return None
+        return dict(entry[1])
 
-def get_user_api_keys(user_id: int) -> Optional[Dict[str, Optional[str]]]:
-    """Return latest per-user Reddit API keys decrypted.
+def _store_keys(user_id: int, keys: Dict[str, Optional[str]]) -> None:
+    with _keys_cache_lock:
+        if len(_keys_cache) >= _KEYS_CACHE_MAX:
+            _keys_cache.clear()
+        _keys_cache[user_id] = (time.monotonic(), dict(keys))
+
+def invalidate_user_api_keys(user_id: int) -> None:
+    """Forget cached keys for a user (call after changing their stored keys)."""
+    with _keys_cache_lock:
+        _keys_cache.pop(user_id, None)
+
+def _user_keys_stmt(user_id: int):
+    """2.0-style point read of a user's key row (user_id is unique); same structure every
+    call, so its compiled form comes from the engine's query cache."""
+    return select(UserAPIKey).where(UserAPIKey.user_id == user_id)
+
+def _upsert_insert(dialect_name: str):
+    """Dialect insert() supporting ON CONFLICT, or None when the backend has no such form."""
+    if dialect_name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect_name == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        return None
+    return insert
+
+def get_user_api_keys(user_id: int, session: Optional[Session] = None) -> Optional[Dict[str, Optional[str]]]:
+    """Return per-user Reddit API keys decrypted.
 
     Returns a dict with keys: client_id, client_secret, user_agent,
-    reddit_username, reddit_password; or None if not found.
+    reddit_username, reddit_password; or None if not found. Pass the
+    request's session (e.g. from get_db()) to reuse it instead of opening one.
     """
-    db = get_db_session()
+    cached = _cached_keys(user_id)
+    if cached is not None:
+        return cached
+
     try:
-        record = (
-            db.query(UserAPIKey)
-            .filter(UserAPIKey.user_id == user_id)
-            .order_by(UserAPIKey.updated_at.desc())
-            .first()
-        )
-        if not record:
-            return None
+        with session_scope("get_user_api_keys", session) as db:
+            record = db.execute(_user_keys_stmt(user_id)).scalar_one_or_none()
+            if not record:
+                return None
 
-        # Decrypt sensitive fields; never log decrypted values
-        return {
-            "client_id": decrypt_api_key(record.client_id) if record.client_id else "",
-            "client_secret": decrypt_api_key(record.client_secret) if record.client_secret else "",
-            "user_agent": record.user_agent or "RedditScoutPro/1.0",
-            "reddit_username": decrypt_api_key(record.reddit_username) if record.reddit_username else "",
-            "reddit_password": decrypt_api_key(record.reddit_password) if record.reddit_password else "",
-        }
-    except Exception:
-        # Do not leak secrets in logs
+            # Decrypt sensitive fields; never log decrypted values
+            client_id, client_secret, reddit_username, reddit_password = decrypt_many([
+                record.client_id, record.client_secret, record.reddit_username, record.reddit_password
+            ])
+            user_agent = record.user_agent
+    except Exception as e:
+        # Do not leak secrets in logs: the exception type is enough to spot a broken read
+        logger.error(f"Failed to load API keys for user {user_id}: {type(e).__name__}")
         return None
-    finally:
-        db.close()
 
-def upsert_user_api_keys(user_id: int, payload: Dict[str, Optional[str]]) -> None:
+    keys = {
+        "client_id": client_id,
+        "client_secret": client_secret,
+        "user_agent": user_agent or "RedditScoutPro/1.0",
+        "reddit_username": reddit_username,
+        "reddit_password": reddit_password,
+    }
+    _store_keys(user_id, keys)
+    return keys
+
+def upsert_user_api_keys(user_id: int, payload: Dict[str, Optional[str]], session: Optional[Session] = None) -> None:
     """Insert or update per-user Reddit API keys.
 
     Encrypt non-empty sensitive fields on write. Required fields: client_id, client_secret.
+    With a caller-provided session the write joins its transaction and the caller commits.
     """
-    db = get_db_session()
-    try:
-        record = (
-            db.query(UserAPIKey)
-            .filter(UserAPIKey.user_id == user_id)
-            .order_by(UserAPIKey.updated_at.desc())
-            .first()
-        )
-        if not record:
-            record = UserAPIKey(user_id=user_id)
-            db.add(record)
-
-        # Encrypt on write; allow empty strings to clear values
-        client_id_val = payload.get("client_id") or ""
-        client_secret_val = payload.get("client_secret") or ""
-        user_agent_val = payload.get("user_agent") or "RedditScoutPro/1.0"
-        reddit_username_val = payload.get("reddit_username") or ""
-        reddit_password_val = payload.get("reddit_password") or ""
-
-        record.client_id = encrypt_api_key(client_id_val) if client_id_val else ""
-        record.client_secret = encrypt_api_key(client_secret_val) if client_secret_val else ""
-        record.user_agent = user_agent_val
-        record.reddit_username = encrypt_api_key(reddit_username_val) if reddit_username_val else ""
-        record.reddit_password = encrypt_api_key(reddit_password_val) if reddit_password_val else ""
+    # Encrypt on write; allow empty strings to clear values
+    client_id, client_secret, reddit_username, reddit_password = encrypt_many([
+        payload.get("client_id") or "",
+        payload.get("client_secret") or "",
+        payload.get("reddit_username") or "",
+        payload.get("reddit_password") or "",
+    ])
 
-        db.commit()
-    except Exception:
-        db.rollback()
-        raise
-    finally:
-        db.close()
+    values = {
+        "client_id": client_id,
+        "client_secret": client_secret,
+        "user_agent": payload.get("user_agent") or "RedditScoutPro/1.0",
+        "reddit_username": reddit_username,
+        "reddit_password": reddit_password,
+        "updated_at": func.now(),
+    }
+
+    with session_scope("upsert_user_api_keys", session) as db:
+        insert = _upsert_insert(db.get_bind().dialect.name)
+        if insert is not None:
+            # Single round trip: insert, or update the existing row on the user_id unique key
+            stmt = insert(UserAPIKey).values(user_id=user_id, **values)
+            stmt = stmt.on_conflict_do_update(index_elements=['user_id'], set_=values)
+            db.execute(stmt)
+        else:
+            record = db.execute(_user_keys_stmt(user_id)).scalar_one_or_none()
+            if not record:
+                record = UserAPIKey(user_id=user_id)
+                db.add(record)
+            for field, value in values.items():
+                setattr(record, field, value)
+
+    invalidate_user_api_keys(user_id)
+
+def delete_user_api_keys(user_id: int, session: Optional[Session] = None) -> None:
+    """Remove a user's stored Reddit API keys with a single DELETE.
+
+    With a caller-provided session the delete joins its transaction and the caller commits.
+    """
+    with session_scope("delete_user_api_keys", session) as db:
+        db.execute(delete(UserAPIKey).where(UserAPIKey.user_id == user_id))
+
+    invalidate_user_api_keys(user_id)
@@ -1,9 +1,8 @@
 """Database models for Reddit Scout Pro Community Edition."""
 
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Boolean, ForeignKey, Text
+from sqlalchemy import create_engine, Column, Integer, String, DateTime, Boolean, ForeignKey, Text, Index, func
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
-from datetime import datetime
 import os
 
 Base = declarative_base()
@@ -16,8 +15,8 @@ class User(Base):
     username = Column(String(50), unique=True, nullable=False)
     email = Column(String(100), unique=True, nullable=False)
     password_hash = Column(String(255), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    last_login = Column(DateTime)
+    created_at = Column(DateTime(timezone=True), default=func.now(), server_default=func.now())
+    last_login = Column(DateTime(timezone=True))
     is_active = Column(Boolean, default=True)
     
     # Relationships
@@ -36,8 +35,8 @@ class APIKey(Base):
     reddit_client_id = Column(String(255))
     reddit_client_secret_encrypted = Column(Text)  # Encrypted using Fernet
     reddit_user_agent = Column(String(100), default="RedditScoutPro/2.0")
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), default=func.now(), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), default=func.now(), server_default=func.now(), onupdate=func.now())
     
     # Relationships
     user = relationship("User", back_populates="api_keys")
@@ -54,7 +53,8 @@ class UserAPIKey(Base):
     __tablename__ = 'user_api_keys'
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(Integer, ForeignKey('users.id'), nullable=False, index=True)
+    # One key row per user; the unique index also serves the point read and ON CONFLICT upsert
+    user_id = Column(Integer, ForeignKey('users.id'), nullable=False, unique=True, index=True)
 
     # Encrypted fields (Fernet base64 strings)
     client_id = Column(Text, nullable=True)
@@ -65,8 +65,8 @@ class UserAPIKey(Base):
     # User agent can be plaintext; default provided
     user_agent = Column(String(150), default="RedditScoutPro/1.0", nullable=False)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), default=func.now(), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=func.now(), server_default=func.now(), onupdate=func.now(), nullable=False)
 
     # Optional relationship back to user
     user = relationship("User")
@@ -77,12 +77,16 @@ class UserAPIKey(Base):
 class Session(Base):
     """User session management for authentication."""
     __tablename__ = 'sessions'
+    __table_args__ = (
+        # Active-session listing filters on user_id and expires_at together
+        Index('ix_sessions_user_id_expires_at', 'user_id', 'expires_at'),
+    )
     
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
     session_token = Column(String(255), unique=True, nullable=False)
-    expires_at = Column(DateTime, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), default=func.now(), server_default=func.now())
     user_agent = Column(String(255))  # Optional: track user agent
     ip_address = Column(String(45))   # Optional: track IP address
     
@@ -114,8 +118,8 @@ class UserPreferences(Base):
     theme = Column(String(20), default="light")
     items_per_page = Column(Integer, default=25)
     
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), default=func.now(), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), default=func.now(), server_default=func.now(), onupdate=func.now())
     
     # Relationships
     user = relationship("User")
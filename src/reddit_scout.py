@@ -1,51 +1,246 @@
 """Reddit Scout - Comprehensive Reddit exploration and analysis."""
 
-import asyncio
+import heapq
+import os
+import re
+import threading
 import time
+import xml.etree.ElementTree as ET
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
-import pandas as pd
+import numpy as np
 import praw
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from praw.models import Comment, Submission
 from langdetect import detect
 from langdetect.lang_detect_exception import LangDetectException
-from textblob import TextBlob
-import plotly.express as px
-import plotly.graph_objects as go
-from wordcloud import WordCloud
 
 from .config import settings
 
+# Focused subreddits searched per country when country-focused search is enabled
+COUNTRY_FOCUS_SUBREDDITS = {
+    'Spain': ('SpainFIRE', 'spain', 'es', 'eupersonalfinance'),
+    'USA': ('personalfinance', 'investing', 'financialindependence', 'Fire'),
+    'UK': ('UKPersonalFinance', 'FIREUK', 'unitedkingdom'),
+    'Germany': ('Finanzen', 'germany', 'de'),
+    'France': ('vosfinances', 'france'),
+    'Canada': ('PersonalFinanceCanada', 'canada'),
+}
+
+# Lexicon sentiment: tokens, and the words that flip the polarity of the next scored word
+_SENTIMENT_TOKEN_RE = re.compile(r"[a-z]+(?:'[a-z]+)?")
+_NEGATIONS = frozenset({'not', 'no', 'never', 'nor', 'cannot'})
+
+
+# Word cloud tokens (letters and numbers, including accented characters) and
+# the multilingual stopwords dropped before counting
+_WORD_RE = re.compile(r'\b[a-záéíóúñüç0-9]+\b')
+# Top word frequencies as one packed array, most frequent first (words are capped at 20 chars)
+_WORD_FREQ_DTYPE = np.dtype([('word', 'U20'), ('count', 'i4')])
+_WORDCLOUD_STOPWORDS = frozenset({
+    # English
+    'the', 'be', 'to', 'of', 'and', 'a', 'in', 'that', 'have', 'i',
+    'it', 'for', 'not', 'on', 'with', 'he', 'as', 'you', 'do', 'at',
+    'this', 'but', 'his', 'by', 'from', 'they', 'we', 'say', 'her', 'she',
+    'or', 'an', 'will', 'my', 'one', 'all', 'would', 'there', 'their',
+    'what', 'so', 'up', 'out', 'if', 'about', 'who', 'get', 'which', 'go',
+    'me', 'when', 'make', 'can', 'like', 'time', 'no', 'just', 'him', 'know',
+    'take', 'people', 'into', 'year', 'your', 'good', 'some', 'could', 'them',
+    'see', 'other', 'than', 'then', 'now', 'look', 'only', 'come', 'its', 'over',
+    'think', 'also', 'back', 'after', 'use', 'two', 'how', 'our', 'work',
+    'first', 'well', 'way', 'even', 'new', 'want', 'because', 'any', 'these',
+    'give', 'day', 'most', 'us', 'is', 'are', 'was', 'been', 'has', 'had',
+    'were', 'am', 'will', 'would', 'could', 'should', 'may', 'might', 'must',
+    'can', 'much', 'many', 'lot', 'more', 'less', 'very', 'too', 'still',
+    'being', 'going', 'why', 'before', 'here', 'there', 'where', 'does', 'did',
+    'thing', 'things', 'something', 'someone', 'really', 'actually', 'probably',
+    'maybe', 'seems', 'definitely', 'literally', 'basically', 'honestly',
+    'obviously', 'clearly', 'certainly', 'exactly', 'absolutely', 'completely',
+    # Spanish
+    'el', 'la', 'de', 'que', 'y', 'a', 'en', 'un', 'es', 'se', 'no', 'te', 'lo',
+    'le', 'da', 'su', 'por', 'son', 'con', 'no', 'me', 'todo', 'pero', 'más',
+    'hay', 'ya', 'está', 'mi', 'si', 'porque', 'qué', 'solo', 'has', 'le',
+    'ya', 'puede', 'ahora', 'cada', 'muy', 'sin', 'sobre', 'también', 'hasta',
+    'donde', 'who', 'desde', 'todos', 'durante', 'tanto', 'menos', 'mucho',
+    'ante', 'ellos', 'ella', 'uno', 'ser', 'tener', 'hacer', 'poder', 'decir',
+    'ir', 'ver', 'dar', 'saber', 'querer', 'estar', 'poner', 'parecer', 'seguir',
+    'para', 'como', 'con', 'del', 'una', 'este', 'esta', 'esto', 'ese', 'esa',
+    'eso', 'aquel', 'aquella', 'aquello', 'los', 'las', 'nos', 'vos', 'les',
+    'algo', 'alguien', 'nada', 'nadie', 'alguno', 'ninguno', 'mucho', 'poco',
+    'tanto', 'demasiado', 'bastante', 'más', 'menos', 'muy', 'bien', 'mal',
+    'mejor', 'peor', 'mayor', 'menor', 'primero', 'último', 'mismo', 'otro',
+    # Reddit specific
+    'reddit', 'comments', 'comment', 'post', 'posts', 'subreddit', 'edit', 
+    'deleted', 'removed', 'http', 'https', 'com', 'www', 'amp', 'bot',
+    'deleted', 'removed', 'moderator', 'automod', 'thanks', 'please',
+    'thanks', 'thank', 'edit', 'update', 'tldr', 'tl;dr'
+})
+
+
+@lru_cache(maxsize=1)
+def _sentiment_lexicon() -> Dict[str, float]:
+    """Word -> mean polarity from TextBlob's bundled en-sentiment.xml, parsed once per process.
+    
+    Returns an empty dict when the lexicon file can't be found, in which case
+    callers fall back to TextBlob itself.
+    """
+    try:
+        import textblob
+        path = os.path.join(os.path.dirname(textblob.__file__), 'en', 'en-sentiment.xml')
+        sums: Dict[str, List[float]] = {}
+        for word in ET.parse(path).getroot().iter('word'):
+            form = word.get('form', '').lower()
+            if form and ' ' not in form:
+                entry = sums.setdefault(form, [0.0, 0])
+                entry[0] += float(word.get('polarity', 0.0))
+                entry[1] += 1
+        return {form: total / count for form, (total, count) in sums.items()}
+    except Exception as e:
+        print(f"Sentiment lexicon unavailable, using TextBlob: {e}")
+        return {}
+
+
+def _lexicon_polarity(text: str, lexicon: Dict[str, float]) -> float:
+    """Mean polarity of the lexicon words in text, with simple negation."""
+    total = 0.0
+    matched = 0
+    negate = False
+    for token in _SENTIMENT_TOKEN_RE.findall(text.lower()):
+        if token in _NEGATIONS or token.endswith("n't"):
+            negate = True
+            continue
+        polarity = lexicon.get(token)
+        if polarity is None:
+            continue
+        total += -polarity if negate else polarity
+        matched += 1
+        negate = False
+    return total / matched if matched else 0.0
+
+
+@lru_cache(maxsize=2)
+def _language_model(path: str):
+    """fastText language-ID model loaded once per path, or None to fall back to langdetect."""
+    if not path:
+        return None
+    try:
+        import fasttext
+        return fasttext.load_model(path)
+    except Exception as e:
+        print(f"fastText language model unavailable, using langdetect: {e}")
+        return None
+
+
+def _or_query_term(keyword: str) -> str:
+    """keyword as one term of an OR query, matching what a search for it alone would.
+    
+    Quotes are stripped so user input can't unbalance the query, and multi-word
+    keywords are grouped rather than quoted so they stay all-words matches, not phrases.
+    """
+    words = keyword.replace('"', ' ').split()
+    return f"({' '.join(words)})" if len(words) > 1 else ''.join(words)
+
+
+def _preview(text: str, n: int = 200) -> str:
+    """First n characters of text, with an ellipsis only when something was cut."""
+    return text[:n] + '...' if len(text) > n else text
+
+
+# Most submission dicts a RedditScout keeps for reuse across searches
+_EXTRACT_CACHE_SIZE = 2048
+
+# Per-field getters so callers asking for a subset of submission data only touch
+# the PRAW attributes behind those fields
+_SUBMISSION_FIELDS = {
+    'id': lambda s: s.id,
+    'title': lambda s: s.title,
+    'author': lambda s: str(s.author) if s.author else '[deleted]',
+    'score': lambda s: s.score,
+    'upvote_ratio': lambda s: s.upvote_ratio,
+    'num_comments': lambda s: s.num_comments,
+    'created_utc': lambda s: s.created_utc,
+    'url': lambda s: f"https://reddit.com{s.permalink}",
+    'permalink': lambda s: f"https://reddit.com{s.permalink}",
+    'domain': lambda s: s.domain,
+    'is_self': lambda s: s.is_self,
+    'selftext': lambda s: getattr(s, 'selftext', '') or '',
+    'nsfw': lambda s: s.over_18,
+    'spoiler': lambda s: s.spoiler,
+    'stickied': lambda s: s.stickied,
+    'activity_score': lambda s: s.score + (s.num_comments * 2),
+    'engagement_rate': lambda s: (s.num_comments / max(s.score, 1)) * 100,
+}
+
 
 class RedditScout:
     """Reddit Scout for comprehensive Reddit exploration and analysis."""
     
-    def __init__(self):
-        """Initialize Reddit Scout with PRAW client."""
+    def __init__(self, client_id: Optional[str] = None, client_secret: Optional[str] = None,
+                 user_agent: Optional[str] = None, username: Optional[str] = None,
+                 password: Optional[str] = None):
+        """Initialize Reddit Scout with PRAW client.
+        
+        Credentials that are not passed fall back to the global settings.
+        """
+        self.client_id = client_id if client_id is not None else settings.reddit_client_id
+        self.client_secret = client_secret if client_secret is not None else settings.reddit_client_secret
+        self.user_agent = user_agent or settings.reddit_user_agent
+        self.username = username if username is not None else settings.reddit_username
+        self.password = password if password is not None else settings.reddit_password
+        # Concurrent global keyword searches allowed against the Reddit API at once
+        self._search_slots = threading.Semaphore(4)
+        # Subscriber counts by subreddit name, filled in batches for posts whose listing lacked them
+        self._subscriber_counts: Dict[str, int] = {}
+        self._subscriber_lock = threading.Lock()
+        # Recently extracted submission dicts, keyed on (id, score, num_comments) so a vote
+        # or new comment produces a fresh entry; bounded LRU shared by the worker threads
+        self._extract_cache: "OrderedDict[tuple, Dict]" = OrderedDict()
+        self._extract_lock = threading.Lock()
         self.reddit = None
         self._setup_reddit_client()
         
+    @staticmethod
+    def _http_session() -> requests.Session:
+        """Keep-alive HTTP session sized for the scout's concurrent searches.
+        
+        The pool matches the largest worker count (16) so threads reuse warm TLS
+        connections instead of opening new ones. Only connection failures are
+        retried here; prawcore still owns rate limiting and 5xx/429 handling.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16,
+                              max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.5))
+        session.mount('https://', adapter)
+        return session
+    
     def _setup_reddit_client(self):
         """Setup Reddit client with credentials."""
         try:
             self.reddit = praw.Reddit(
-                client_id=settings.reddit_client_id,
-                client_secret=settings.reddit_client_secret,
-                user_agent=settings.reddit_user_agent,
-                username=settings.reddit_username if settings.reddit_username else None,
-                password=settings.reddit_password if settings.reddit_password else None,
+                client_id=self.client_id,
+                client_secret=self.client_secret,
+                user_agent=self.user_agent,
+                username=self.username if self.username else None,
+                password=self.password if self.password else None,
+                requestor_kwargs={'session': self._http_session()},
             )
-            # Test connection
-            self.reddit.user.me()
-            print("✅ Reddit API connection established")
+            # No user.me() probe here: it cost a round trip on every construction and
+            # read-only listings/searches authenticate on first use anyway
+            print("✅ Reddit API client configured")
         except Exception as e:
             print(f"⚠️ Reddit API setup failed: {e}")
             # Use read-only mode
             self.reddit = praw.Reddit(
-                client_id=settings.reddit_client_id or "dummy",
-                client_secret=settings.reddit_client_secret or "dummy",
-                user_agent=settings.reddit_user_agent,
+                client_id=self.client_id or "dummy",
+                client_secret=self.client_secret or "dummy",
+                user_agent=self.user_agent,
+                requestor_kwargs={'session': self._http_session()},
             )
     
     def search_subreddits(self, query: str, limit: int = 25) -> List[Dict]:
@@ -78,6 +273,7 @@ class RedditScout:
         """Get detailed information about a specific subreddit."""
         try:
             subreddit = self.reddit.subreddit(subreddit_name)
+            created = datetime.fromtimestamp(subreddit.created_utc)
             
             return {
                 'name': subreddit.display_name,
@@ -86,7 +282,8 @@ class RedditScout:
                 'public_description': subreddit.public_description,
                 'subscribers': subreddit.subscribers,
                 'active_users': getattr(subreddit, 'active_user_count', 0),
-                'created_utc': datetime.fromtimestamp(subreddit.created_utc),
+                'created_utc': created,
+                'age_years': (datetime.now() - created).days // 365,
                 'nsfw': subreddit.over18,
                 'url': f"https://reddit.com{subreddit.url}",
                 'submission_type': subreddit.submission_type,
@@ -96,58 +293,56 @@ class RedditScout:
             print(f"Error getting subreddit info: {e}")
             return {}
     
-    def get_active_discussions(self, subreddit_name: str, limit: int = 50, time_filter: str = 'day') -> List[Dict]:
-        """Get active discussions from a subreddit."""
-        discussions = []
-        
+    def iter_discussions(self, subreddit_name: str, listing: str = 'hot', limit: int = 50, time_filter: str = 'day',
+                         fields: Optional[Sequence[str]] = None) -> Iterator[Dict]:
+        """Yield filtered discussions from a subreddit listing as PRAW returns them."""
         try:
             subreddit = self.reddit.subreddit(subreddit_name)
             
-            # Get hot posts (most active)
-            for submission in subreddit.hot(limit=limit):
-                if self._should_include_post(submission):
-                    discussion_data = self._extract_submission_data(submission)
-                    discussions.append(discussion_data)
-                    
-        except Exception as e:
-            print(f"Error getting active discussions: {e}")
-            
-        return sorted(discussions, key=lambda x: x['activity_score'], reverse=True)
-    
-    def get_trending_discussions(self, subreddit_name: str, limit: int = 50, time_filter: str = 'day') -> List[Dict]:
-        """Get trending discussions from a subreddit."""
-        discussions = []
-        
-        try:
-            subreddit = self.reddit.subreddit(subreddit_name)
+            if listing == 'top':
+                submissions = subreddit.top(time_filter=time_filter, limit=limit)
+            elif listing == 'new':
+                submissions = subreddit.new(limit=limit)
+            else:
+                submissions = subreddit.hot(limit=limit)
             
-            # Get top posts by time filter
-            for submission in subreddit.top(time_filter=time_filter, limit=limit):
-                if self._should_include_post(submission):
-                    discussion_data = self._extract_submission_data(submission)
-                    discussions.append(discussion_data)
+            yield from self._iter_filtered(submissions, fields)
                     
         except Exception as e:
-            print(f"Error getting trending discussions: {e}")
-            
-        return sorted(discussions, key=lambda x: x['score'], reverse=True)
+            print(f"Error streaming {listing} discussions: {e}")
+    
+    def _iter_filtered(self, submissions, fields: Optional[Sequence[str]] = None) -> Iterator[Dict]:
+        """Extract the submissions that pass the content filters - the one shared listing loop."""
+        include = self._post_filter()
+        extract = self._extract_submission_data
+        for submission in submissions:
+            if include(submission):
+                yield extract(submission, fields)
+    
+    def get_active_discussions(self, subreddit_name: str, limit: int = 50, time_filter: str = 'day',
+                               fields: Optional[Sequence[str]] = None, top_k: Optional[int] = None) -> List[Dict]:
+        """Get active discussions from a subreddit (only the top_k most active when given)."""
+        # Hot posts (most active), ranked straight off the PRAW generator
+        discussions = self.iter_discussions(subreddit_name, 'hot', limit=limit, fields=fields)
+        return self._rank(discussions, 'activity_score', top_k)
+    
+    def get_trending_discussions(self, subreddit_name: str, limit: int = 50, time_filter: str = 'day',
+                                 fields: Optional[Sequence[str]] = None, top_k: Optional[int] = None) -> List[Dict]:
+        """Get trending discussions from a subreddit (only the top_k highest scored when given)."""
+        # Top posts by time filter
+        discussions = self.iter_discussions(subreddit_name, 'top', limit=limit, time_filter=time_filter, fields=fields)
+        return self._rank(discussions, 'score', top_k)
+    
+    @staticmethod
+    def _rank(discussions: Iterator[Dict], field: str, top_k: Optional[int]) -> List[Dict]:
+        """Order discussions by field, descending; keep only a top_k heap when a cut-off is given."""
+        if top_k is None:
+            return sorted(discussions, key=lambda x: x[field], reverse=True)
+        return heapq.nlargest(top_k, discussions, key=lambda x: x[field])
     
     def get_new_discussions(self, subreddit_name: str, limit: int = 50) -> List[Dict]:
         """Get newest discussions from a subreddit."""
-        discussions = []
-        
-        try:
-            subreddit = self.reddit.subreddit(subreddit_name)
-            
-            for submission in subreddit.new(limit=limit):
-                if self._should_include_post(submission):
-                    discussion_data = self._extract_submission_data(submission)
-                    discussions.append(discussion_data)
-                    
-        except Exception as e:
-            print(f"Error getting new discussions: {e}")
-            
-        return discussions
+        return list(self.iter_discussions(subreddit_name, 'new', limit=limit))
     
     def analyze_subreddit_sentiment(self, subreddit_name: str, limit: int = 100) -> Dict:
         """Analyze sentiment of posts and comments in a subreddit."""
@@ -157,22 +352,25 @@ class RedditScout:
         try:
             subreddit = self.reddit.subreddit(subreddit_name)
             
+            # Collect every title and body first, then score them in one pass
+            texts_to_analyze = []
             for submission in subreddit.hot(limit=limit):
-                # Analyze submission title and text
-                texts_to_analyze = [submission.title]
-                if hasattr(submission, 'selftext') and submission.selftext:
-                    texts_to_analyze.append(submission.selftext)
-                
-                for text in texts_to_analyze:
-                    sentiment = self._analyze_text_sentiment(text)
-                    if sentiment:
-                        sentiments[sentiment] += 1
-                        analyzed_texts.append({
-                            'text': text[:100] + '...' if len(text) > 100 else text,
-                            'sentiment': sentiment,
-                            'post_id': submission.id,
-                            'score': submission.score
-                        })
+                post_id, score = submission.id, submission.score
+                texts_to_analyze.append((submission.title, post_id, score))
+                selftext = getattr(submission, 'selftext', '')
+                if selftext:
+                    texts_to_analyze.append((selftext, post_id, score))
+            
+            labels = self._score_sentiments([text for text, _, _ in texts_to_analyze])
+            for (text, post_id, score), sentiment in zip(texts_to_analyze, labels):
+                if sentiment:
+                    sentiments[sentiment] += 1
+                    analyzed_texts.append({
+                        'text': _preview(text, 100),
+                        'sentiment': sentiment,
+                        'post_id': post_id,
+                        'score': score
+                    })
                         
         except Exception as e:
             print(f"Error analyzing sentiment: {e}")
@@ -190,85 +388,201 @@ class RedditScout:
             'sample_texts': analyzed_texts[:20]  # Return sample
         }
     
-    def get_keyword_discussions(self, keywords: List[str], subreddit_names: List[str], limit: int = 50) -> List[Dict]:
+    def get_keyword_discussions(self, keywords: List[str], subreddit_names: List[str], limit: int = 50, max_workers: int = 16) -> List[Dict]:
         """Search for discussions containing specific keywords across multiple subreddits."""
+        if not keywords or not subreddit_names:
+            return []
+        
         all_discussions = []
+        per_keyword_limit = limit // len(keywords)
+        tasks = [(subreddit_name, keyword) for subreddit_name in subreddit_names for keyword in keywords]
         
-        for subreddit_name in subreddit_names:
-            for keyword in keywords:
-                try:
-                    subreddit = self.reddit.subreddit(subreddit_name)
-                    
-                    for submission in subreddit.search(keyword, limit=limit//len(keywords)):
-                        if self._should_include_post(submission):
-                            discussion_data = self._extract_submission_data(submission)
-                            discussion_data['matched_keyword'] = keyword
-                            discussion_data['subreddit'] = subreddit_name
-                            all_discussions.append(discussion_data)
-                            
-                except Exception as e:
-                    print(f"Error searching keyword '{keyword}' in r/{subreddit_name}: {e}")
-                    continue
+        # Each (subreddit, keyword) search is an independent network call - run them concurrently
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+            futures = [
+                executor.submit(self._search_subreddit_keyword, subreddit_name, keyword, per_keyword_limit)
+                for subreddit_name, keyword in tasks
+            ]
+            results = [future.result() for future in futures]
+        
+        # Posts matched by overlapping keywords are kept once, from the earliest task -
+        # deduping in task order keeps matched_keyword deterministic across runs
+        seen_ids = set()
+        for discussions in results:
+            for discussion in discussions:
+                if discussion['id'] not in seen_ids:
+                    seen_ids.add(discussion['id'])
+                    all_discussions.append(discussion)
                     
         return sorted(all_discussions, key=lambda x: x['score'], reverse=True)
     
-    def search_global_keywords(self, keywords: List[str], limit: int = None, time_filter: str = 'all', search_comments: bool = False, country_filter: str = None) -> List[Dict]:
-        """FAST search for discussions containing keywords across Reddit."""
+    def _search_subreddit_keyword(self, subreddit_name: str, keyword: str, limit: int) -> List[Dict]:
+        """Search a single subreddit for a single keyword (runs on a worker thread)."""
+        discussions = []
+        include = self._post_filter()
+        
+        try:
+            subreddit = self.reddit.subreddit(subreddit_name)
+            
+            for submission in subreddit.search(keyword, limit=limit):
+                if include(submission):
+                    discussion_data = self._extract_submission_data(submission)
+                    discussion_data['matched_keyword'] = keyword
+                    discussion_data['subreddit'] = subreddit_name
+                    # Same schema as global search so consumers can index directly
+                    discussion_data.setdefault('subreddit_subscribers', 0)
+                    discussions.append(discussion_data)
+                    
+        except Exception as e:
+            print(f"Error searching keyword '{keyword}' in r/{subreddit_name}: {e}")
+        
+        return discussions
+    
+    def search_global_keywords(self, keywords: List[str], limit: int = None, time_filter: str = 'all', search_comments: bool = False, country_filter: str = None,
+                               min_score: Optional[int] = None, min_comments: Optional[int] = None,
+                               exclude_nsfw: Optional[bool] = None) -> List[Dict]:
+        """FAST search for discussions containing keywords across Reddit.
+        
+        min_score/min_comments/exclude_nsfw override the configured content filters for
+        this call only; the scout is shared across sessions, so settings are never mutated.
+        """
         all_discussions = []
+        include = self._post_filter(min_score, min_comments, exclude_nsfw)
         seen_ids = set()  # To avoid duplicates
         
+        if not keywords:
+            return all_discussions
+        
         # Set reasonable limits for speed
         max_results_per_keyword = min(limit or 50, 50)  # Cap at 50 results per keyword
         
-        for keyword in keywords:
-            try:
-                print(f"🔍 FAST SEARCH for '{keyword}' across Reddit...")
+        # Several keywords: one a OR b OR ... request replaces a global search per keyword
+        combined, exhausted = [], False
+        if len(keywords) > 1:
+            combined, exhausted = self._search_combined_keywords(keywords, max_results_per_keyword * len(keywords), time_filter, include)
+        hits = Counter(d['matched_keyword'] for d in combined)
+        # A keyword is covered once it got its full share, or when the combined listing ran
+        # out before its limit - then a search of its own can't turn up anything more
+        covered = {keyword for keyword in keywords if exhausted or hits[keyword] >= max_results_per_keyword}
+        country_focus = bool(search_comments and country_filter)
+        
+        # Keywords short of their share fall back to their own global search;
+        # country-focused search stays per keyword either way
+        per_keyword = [
+            (keyword, keyword not in covered)
+            for keyword in keywords
+            if keyword not in covered or country_focus
+        ]
+        
+        for discussion_data in combined:
+            if discussion_data['id'] not in seen_ids:
+                seen_ids.add(discussion_data['id'])
+                all_discussions.append(discussion_data)
+        
+        # Each remaining keyword is an independent set of network calls - search them concurrently
+        if per_keyword:
+            with ThreadPoolExecutor(max_workers=min(8, len(per_keyword))) as executor:
+                futures = [
+                    executor.submit(self._search_one_keyword, keyword, max_results_per_keyword,
+                                    time_filter, search_comments, country_filter, include_global, include)
+                    for keyword, include_global in per_keyword
+                ]
+                # Merge in keyword order so the first keyword to match a post keeps it, as before
+                for future in futures:
+                    for discussion_data in future.result():
+                        if discussion_data['id'] in seen_ids:
+                            continue
+                        seen_ids.add(discussion_data['id'])
+                        all_discussions.append(discussion_data)
+        
+        self._fill_subscriber_counts(all_discussions)
                 
-                # FAST GLOBAL SEARCH - Limited but quick
-                print(f"  Searching Reddit with limit: {max_results_per_keyword}")
+        print(f"\n🎯 FAST SEARCH COMPLETE: {len(all_discussions)} total results found")
+        
+        # Sort by relevance: score and recency
+        return sorted(all_discussions, key=lambda x: (x['score'], x['created_utc']), reverse=True)
+    
+    def _search_combined_keywords(self, keywords: List[str], limit: int, time_filter: str,
+                                  include: Optional[Callable[[Any], bool]] = None) -> Tuple[List[Dict], bool]:
+        """One global OR search for several keywords, tagging each post with the first keyword it mentions.
+        
+        Also returns whether the listing ran out before limit, i.e. every match was seen.
+        """
+        discussions = []
+        exhausted = False
+        query = " OR ".join(term for term in map(_or_query_term, keywords) if term)
+        patterns = [(keyword, re.compile(re.escape(keyword.replace('"', '').strip()), re.IGNORECASE)) for keyword in keywords]
+        include = include or self._post_filter()
+        fetched = 0
+        if not query:
+            return discussions, exhausted
+        
+        with self._search_slots:
+            try:
+                print(f"🔍 FAST SEARCH for {len(keywords)} keywords in one query across Reddit...")
                 
                 for submission in self.reddit.subreddit('all').search(
-                    keyword, 
-                    limit=max_results_per_keyword, 
+                    query,
+                    limit=limit,
                     time_filter=time_filter,
                     sort='relevance'
                 ):
-                    if submission.id in seen_ids:
+                    fetched += 1
+                    if not include(submission):
                         continue
-                        
-                    seen_ids.add(submission.id)
                     
-                    if self._should_include_post(submission):
-                        discussion_data = self._extract_submission_data(submission)
-                        discussion_data['matched_keyword'] = keyword
-                        discussion_data['subreddit'] = submission.subreddit.display_name
-                        discussion_data['match_location'] = 'post'
-                        discussion_data['search_phase'] = 'global'
-                        
-                        # Add additional metadata
-                        discussion_data['subreddit_subscribers'] = getattr(submission.subreddit, 'subscribers', 0) or 0
-                        discussion_data['is_video'] = submission.is_video
-                        discussion_data['preview_text'] = submission.selftext[:200] + '...' if submission.selftext and len(submission.selftext) > 200 else submission.selftext
-                        
-                        all_discussions.append(discussion_data)
+                    text = f"{submission.title}\n{submission.selftext}"
+                    # Keyword order decides ties, as with separate searches; Reddit's stemming can
+                    # match posts where no keyword appears verbatim, which go to the first keyword
+                    keyword = next((kw for kw, pattern in patterns if pattern.search(text)), keywords[0])
+                    discussions.append(self._global_search_data(submission, keyword, 'global'))
                 
-                print(f"  Found {len([d for d in all_discussions if d.get('search_phase') == 'global' and d.get('matched_keyword') == keyword])} posts for '{keyword}'")
+                print(f"  Found {len(discussions)} posts for the combined query")
+                exhausted = fetched < limit
+                
+            except Exception as e:
+                print(f"Error in combined keyword search: {e}")
+        
+        return discussions, exhausted
+    
+    def _search_one_keyword(self, keyword: str, limit: int, time_filter: str, search_comments: bool, country_filter: Optional[str],
+                            include_global: bool = True, include: Optional[Callable[[Any], bool]] = None) -> List[Dict]:
+        """Global (and optional country-focused) search for one keyword (runs on a worker thread)."""
+        discussions = []
+        seen_ids = set()
+        include = include or self._post_filter()
+        
+        # Bound how many keyword searches hit the API at once
+        with self._search_slots:
+            try:
+                if include_global:
+                    print(f"🔍 FAST SEARCH for '{keyword}' across Reddit...")
+                    
+                    # FAST GLOBAL SEARCH - Limited but quick
+                    print(f"  Searching Reddit with limit: {limit}")
+                    
+                    for submission in self.reddit.subreddit('all').search(
+                        keyword, 
+                        limit=limit, 
+                        time_filter=time_filter,
+                        sort='relevance'
+                    ):
+                        if submission.id in seen_ids:
+                            continue
+                            
+                        seen_ids.add(submission.id)
+                        
+                        if include(submission):
+                            discussions.append(self._global_search_data(submission, keyword, 'global'))
+                    
+                    print(f"  Found {len(discussions)} posts for '{keyword}'")
                 
                 # Optional: Quick search in a few popular subreddits (if enabled)
                 if search_comments and country_filter:
                     print(f"  Optional: Quick search in {country_filter} subreddits...")
                     
-                    # Define focused subreddit lists by country
-                    country_subreddits = {
-                        'Spain': ['SpainFIRE', 'spain', 'es', 'eupersonalfinance'],
-                        'USA': ['personalfinance', 'investing', 'financialindependence', 'Fire'],
-                        'UK': ['UKPersonalFinance', 'FIREUK', 'unitedkingdom'],
-                        'Germany': ['Finanzen', 'germany', 'de'],
-                        'France': ['vosfinances', 'france'],
-                        'Canada': ['PersonalFinanceCanada', 'canada'],
-                    }
-                    
-                    target_subs = country_subreddits.get(country_filter, [])[:3]  # Limit to 3 subreddits max
+                    target_subs = COUNTRY_FOCUS_SUBREDDITS.get(country_filter, ())[:3]  # Limit to 3 subreddits max
+                    allowed = frozenset(sub.lower() for sub in target_subs)
                     
                     for sub_name in target_subs:
                         try:
@@ -282,19 +596,12 @@ class RedditScout:
                                     
                                 seen_ids.add(submission.id)
                                 
-                                if self._should_include_post(submission):
-                                    discussion_data = self._extract_submission_data(submission)
-                                    discussion_data['matched_keyword'] = keyword
-                                    discussion_data['subreddit'] = submission.subreddit.display_name
-                                    discussion_data['match_location'] = 'post'
-                                    discussion_data['search_phase'] = 'country_focused'
-                                    
-                                    # Add additional metadata
-                                    discussion_data['subreddit_subscribers'] = getattr(submission.subreddit, 'subscribers', 0) or 0
-                                    discussion_data['is_video'] = submission.is_video
-                                    discussion_data['preview_text'] = submission.selftext[:200] + '...' if submission.selftext and len(submission.selftext) > 200 else submission.selftext
-                                    
-                                    all_discussions.append(discussion_data)
+                                # Set membership keeps only posts that really live in the targeted subreddits
+                                if submission.subreddit.display_name.lower() not in allowed:
+                                    continue
+                                
+                                if include(submission):
+                                    discussions.append(self._global_search_data(submission, keyword, 'country_focused'))
                                     
                         except Exception as sub_error:
                             print(f"      ❌ r/{sub_name}: {sub_error}")
@@ -302,54 +609,89 @@ class RedditScout:
                         
             except Exception as e:
                 print(f"Error searching keyword '{keyword}': {e}")
-                continue
-                
-        print(f"\n🎯 FAST SEARCH COMPLETE: {len(all_discussions)} total results found")
         
-        # Sort by relevance: score and recency
-        return sorted(all_discussions, key=lambda x: (x['score'], x['created_utc']), reverse=True)
+        return discussions
+    
+    def _global_search_data(self, submission, keyword: str, search_phase: str) -> Dict:
+        """Submission data plus the metadata global search results carry."""
+        discussion_data = self._extract_submission_data(submission)
+        discussion_data['matched_keyword'] = keyword
+        discussion_data['subreddit'] = submission.subreddit.display_name
+        discussion_data['match_location'] = 'post'
+        discussion_data['search_phase'] = search_phase
+        
+        # Add additional metadata. Search listings carry the count inline; reading
+        # submission.subreddit.subscribers would fetch /about once per post instead.
+        discussion_data['subreddit_subscribers'] = getattr(submission, 'subreddit_subscribers', None)
+        discussion_data['is_video'] = submission.is_video
+        discussion_data['preview_text'] = _preview(discussion_data['selftext'])
+        
+        return discussion_data
+    
+    def _fill_subscriber_counts(self, discussions: List[Dict]):
+        """Fill missing subreddit_subscribers with one batched info() lookup per 100 unknown subreddits."""
+        missing = {d['subreddit'] for d in discussions if d['subreddit_subscribers'] is None}
+        with self._subscriber_lock:
+            to_fetch = [name for name in missing if name not in self._subscriber_counts]
+        if to_fetch:
+            try:
+                fetched = {sub.display_name: sub.subscribers or 0 for sub in self.reddit.info(subreddits=to_fetch)}
+            except Exception as e:
+                print(f"Error fetching subscriber counts: {e}")
+                fetched = {}
+            with self._subscriber_lock:
+                self._subscriber_counts.update(fetched)
+        
+        with self._subscriber_lock:
+            counts = self._subscriber_counts
+            for discussion in discussions:
+                if discussion['subreddit_subscribers'] is None:
+                    discussion['subreddit_subscribers'] = counts.get(discussion['subreddit'], 0)
     
     def get_subreddit_analytics(self, subreddit_name: str, limit: int = 100) -> Dict:
         """Get comprehensive analytics for a subreddit."""
         try:
             subreddit = self.reddit.subreddit(subreddit_name)
-            posts = []
+            # Plain columns and counters - a ~100 row DataFrame costs more than the maths
+            scores, comments, ratios, hours = [], [], [], []
+            authors, domains = Counter(), Counter()
+            self_posts = 0
             
             for submission in subreddit.hot(limit=limit):
-                posts.append({
-                    'id': submission.id,
-                    'title': submission.title,
-                    'score': submission.score,
-                    'num_comments': submission.num_comments,
-                    'upvote_ratio': submission.upvote_ratio,
-                    'created_utc': datetime.fromtimestamp(submission.created_utc),
-                    'author': str(submission.author) if submission.author else '[deleted]',
-                    'is_self': submission.is_self,
-                    'domain': submission.domain,
-                })
-            
-            df = pd.DataFrame(posts)
-            
-            if df.empty:
+                scores.append(submission.score)
+                comments.append(submission.num_comments)
+                ratios.append(submission.upvote_ratio)
+                hours.append(int(submission.created_utc) // 3600 % 24)  # UTC hour
+                authors[str(submission.author) if submission.author else '[deleted]'] += 1
+                if submission.is_self:
+                    self_posts += 1
+                else:
+                    domains[submission.domain] += 1
+            
+            if not scores:
                 return {'error': 'No data available'}
             
+            score_arr = np.asarray(scores, dtype=np.int64)
+            q20, q80 = np.quantile(score_arr, [0.2, 0.8])
+            high = int((score_arr > q80).sum())
+            low = int((score_arr <= q20).sum())
+            
             analytics = {
-                'total_posts': len(df),
-                'avg_score': df['score'].mean(),
-                'avg_comments': df['num_comments'].mean(),
-                'avg_upvote_ratio': df['upvote_ratio'].mean(),
-                'top_authors': df['author'].value_counts().head(10).to_dict(),
+                'total_posts': len(scores),
+                'avg_score': float(score_arr.mean()),
+                'avg_comments': float(np.mean(comments)),
+                'avg_upvote_ratio': float(np.mean(ratios)),
+                'top_authors': dict(authors.most_common(10)),
                 'post_types': {
-                    'self_posts': (df['is_self'] == True).sum(),
-                    'link_posts': (df['is_self'] == False).sum(),
+                    'self_posts': self_posts,
+                    'link_posts': len(scores) - self_posts,
                 },
-                'top_domains': df[df['is_self'] == False]['domain'].value_counts().head(10).to_dict(),
-                'activity_by_hour': self._analyze_posting_times(df),
+                'top_domains': dict(domains.most_common(10)),
+                'activity_by_hour': self._analyze_posting_times(hours),
                 'engagement_distribution': {
-                    'high_engagement': (df['score'] > df['score'].quantile(0.8)).sum(),
-                    'medium_engagement': ((df['score'] > df['score'].quantile(0.2)) & 
-                                        (df['score'] <= df['score'].quantile(0.8))).sum(),
-                    'low_engagement': (df['score'] <= df['score'].quantile(0.2)).sum(),
+                    'high_engagement': high,
+                    'medium_engagement': len(scores) - high - low,
+                    'low_engagement': low,
                 }
             }
             
@@ -365,45 +707,6 @@ class RedditScout:
             import re
             from collections import Counter
             
-            # Extended stopwords in multiple languages
-            stopwords = {
-                # English
-                'the', 'be', 'to', 'of', 'and', 'a', 'in', 'that', 'have', 'i',
-                'it', 'for', 'not', 'on', 'with', 'he', 'as', 'you', 'do', 'at',
-                'this', 'but', 'his', 'by', 'from', 'they', 'we', 'say', 'her', 'she',
-                'or', 'an', 'will', 'my', 'one', 'all', 'would', 'there', 'their',
-                'what', 'so', 'up', 'out', 'if', 'about', 'who', 'get', 'which', 'go',
-                'me', 'when', 'make', 'can', 'like', 'time', 'no', 'just', 'him', 'know',
-                'take', 'people', 'into', 'year', 'your', 'good', 'some', 'could', 'them',
-                'see', 'other', 'than', 'then', 'now', 'look', 'only', 'come', 'its', 'over',
-                'think', 'also', 'back', 'after', 'use', 'two', 'how', 'our', 'work',
-                'first', 'well', 'way', 'even', 'new', 'want', 'because', 'any', 'these',
-                'give', 'day', 'most', 'us', 'is', 'are', 'was', 'been', 'has', 'had',
-                'were', 'am', 'will', 'would', 'could', 'should', 'may', 'might', 'must',
-                'can', 'much', 'many', 'lot', 'more', 'less', 'very', 'too', 'still',
-                'being', 'going', 'why', 'before', 'here', 'there', 'where', 'does', 'did',
-                'thing', 'things', 'something', 'someone', 'really', 'actually', 'probably',
-                'maybe', 'seems', 'definitely', 'literally', 'basically', 'honestly',
-                'obviously', 'clearly', 'certainly', 'exactly', 'absolutely', 'completely',
-                # Spanish
-                'el', 'la', 'de', 'que', 'y', 'a', 'en', 'un', 'es', 'se', 'no', 'te', 'lo',
-                'le', 'da', 'su', 'por', 'son', 'con', 'no', 'me', 'todo', 'pero', 'más',
-                'hay', 'ya', 'está', 'mi', 'si', 'porque', 'qué', 'solo', 'has', 'le',
-                'ya', 'puede', 'ahora', 'cada', 'muy', 'sin', 'sobre', 'también', 'hasta',
-                'donde', 'who', 'desde', 'todos', 'durante', 'tanto', 'menos', 'mucho',
-                'ante', 'ellos', 'ella', 'uno', 'ser', 'tener', 'hacer', 'poder', 'decir',
-                'ir', 'ver', 'dar', 'saber', 'querer', 'estar', 'poner', 'parecer', 'seguir',
-                'para', 'como', 'con', 'del', 'una', 'este', 'esta', 'esto', 'ese', 'esa',
-                'eso', 'aquel', 'aquella', 'aquello', 'los', 'las', 'nos', 'vos', 'les',
-                'algo', 'alguien', 'nada', 'nadie', 'alguno', 'ninguno', 'mucho', 'poco',
-                'tanto', 'demasiado', 'bastante', 'más', 'menos', 'muy', 'bien', 'mal',
-                'mejor', 'peor', 'mayor', 'menor', 'primero', 'último', 'mismo', 'otro',
-                # Reddit specific
-                'reddit', 'comments', 'comment', 'post', 'posts', 'subreddit', 'edit', 
-                'deleted', 'removed', 'http', 'https', 'com', 'www', 'amp', 'bot',
-                'deleted', 'removed', 'moderator', 'automod', 'thanks', 'please',
-                'thanks', 'thank', 'edit', 'update', 'tldr', 'tl;dr'
-            }
             
             print(f"Fetching data from r/{subreddit_name}...")
             subreddit = self.reddit.subreddit(subreddit_name)
@@ -416,11 +719,11 @@ class RedditScout:
                     all_text.append(submission.title)
                 
                 # Add selftext if it exists and is substantial
-                if (hasattr(submission, 'selftext') and 
-                    submission.selftext and 
-                    submission.selftext not in ['[removed]', '[deleted]', ''] and 
-                    len(submission.selftext) > 10):  # Only add substantial text
-                    all_text.append(submission.selftext)
+                selftext = getattr(submission, 'selftext', '')
+                if (selftext and 
+                    selftext not in ('[removed]', '[deleted]') and 
+                    len(selftext) > 10):  # Only add substantial text
+                    all_text.append(selftext)
                 
                 # SKIP COMMENTS FOR SPEED - they're too slow to load
                 # Comments can add 15+ seconds to processing time
@@ -436,54 +739,58 @@ class RedditScout:
                     'subreddit': subreddit_name
                 }
             
-            # Combine and clean text
-            combined_text = ' '.join(all_text)
-            print(f"Combined text length: {len(combined_text)} characters")
-            
-            # Clean and normalize text
-            text_lower = combined_text.lower()
-            
-            # Extract words using regex (letters and numbers, including accented characters)
-            words = re.findall(r'\b[a-záéíóúñüç0-9]+\b', text_lower)
-            print(f"Extracted {len(words)} total words")
-            
-            # Filter words
-            filtered_words = []
-            for word in words:
-                if (len(word) >= 4 and  # Minimum length
-                    len(word) <= 20 and  # Maximum length  
-                    word not in stopwords and  # Not a stopword
-                    not word.isdigit() and  # Not just numbers
-                    not word.startswith(('http', 'www', '.com', '.es', '.org'))):  # Not URLs
-                    filtered_words.append(word)
-            
-            print(f"Filtered to {len(filtered_words)} meaningful words")
-            
-            if not filtered_words:
+            # Count piece by piece instead of joining and lower-casing one big copy of all text
+            text_length = sum(len(piece) for piece in all_text) + len(all_text) - 1
+            print(f"Combined text length: {text_length} characters")
+            
+            # Filter words: 4-20 chars, not a stopword, not just numbers. Tokens never
+            # contain '.' or '/', so URL pieces reduce to the http/www/com stopwords.
+            stopwords = _WORDCLOUD_STOPWORDS
+            word_freq = Counter()
+            total_words = 0
+            for piece in all_text:
+                words = _WORD_RE.findall(piece.lower())
+                total_words += len(words)
+                word_freq.update(
+                    word for word in words
+                    if 4 <= len(word) <= 20 and word not in stopwords and not word.isdigit()
+                )
+            filtered_count = sum(word_freq.values())
+            print(f"Extracted {total_words} total words")
+            print(f"Filtered to {filtered_count} meaningful words")
+            
+            if not filtered_count:
                 return {
                     'error': f'No meaningful words found after filtering for r/{subreddit_name}. Try a subreddit with more text content.',
                     'error_type': 'NoWordsAfterFiltering',
                     'subreddit': subreddit_name,
                     'debug_info': {
-                        'total_words': len(words),
-                        'text_length': len(combined_text),
+                        'total_words': total_words,
+                        'text_length': text_length,
                         'posts_processed': post_count
                     }
                 }
             
-            # Count frequencies
-            word_freq = Counter(filtered_words)
+            # Sample only needs the first 500 characters, so join just enough leading pieces
+            sample_pieces = []
+            sample_length = 0
+            for piece in all_text:
+                sample_pieces.append(piece)
+                sample_length += len(piece) + 1
+                if sample_length > 501:
+                    break
+            text_sample = ' '.join(sample_pieces)
             
             # Get top words
             top_words = word_freq.most_common(100)
             
             return {
-                'word_frequencies': dict(top_words),
-                'total_words': len(words),
-                'unique_words': len(set(filtered_words)),
-                'filtered_words': len(filtered_words),
+                'word_frequencies': np.array(top_words, dtype=_WORD_FREQ_DTYPE),
+                'total_words': total_words,
+                'unique_words': len(word_freq),
+                'filtered_words': filtered_count,
                 'posts_processed': post_count,
-                'text_sample': combined_text[:500] + '...' if len(combined_text) > 500 else combined_text
+                'text_sample': text_sample[:500] + '...' if text_length > 500 else text_sample
             }
             
         except Exception as e:
@@ -499,72 +806,130 @@ class RedditScout:
     
     def _should_include_post(self, submission) -> bool:
         """Check if a post should be included based on filters."""
-        if settings.exclude_nsfw and submission.over_18:
-            return False
-        if settings.exclude_spoilers and submission.spoiler:
-            return False
-        if submission.score < settings.min_score_threshold:
-            return False
-        if submission.num_comments < settings.min_comments_threshold:
-            return False
-        return True
+        return self._post_filter()(submission)
     
-    def _extract_submission_data(self, submission) -> Dict:
-        """Extract comprehensive data from a Reddit submission."""
-        return {
+    @staticmethod
+    def _post_filter(min_score: Optional[int] = None, min_comments: Optional[int] = None,
+                     exclude_nsfw: Optional[bool] = None) -> Callable[[Any], bool]:
+        """Snapshot the content filters into a predicate for one listing or search.
+        
+        Arguments left as None fall back to settings, read per call rather than at
+        init since the settings page can change them. Numeric checks run first: they
+        reject most posts and are plain int comparisons.
+        """
+        if min_score is None:
+            min_score = settings.min_score_threshold
+        if min_comments is None:
+            min_comments = settings.min_comments_threshold
+        if exclude_nsfw is None:
+            exclude_nsfw = settings.exclude_nsfw
+        exclude_spoilers = settings.exclude_spoilers
+        
+        def include(submission) -> bool:
+            return (submission.score >= min_score
+                    and submission.num_comments >= min_comments
+                    and not (exclude_nsfw and submission.over_18)
+                    and not (exclude_spoilers and submission.spoiler))
+        
+        return include
+    
+    def _extract_submission_data(self, submission, fields: Optional[Sequence[str]] = None) -> Dict:
+        """Extract comprehensive data from a Reddit submission (only the given fields when set)."""
+        if fields is not None:
+            return {field: _SUBMISSION_FIELDS[field](submission) for field in fields}
+        
+        # Read each lazy PRAW attribute once
+        score = submission.score
+        num_comments = submission.num_comments
+        key = (submission.id, score, num_comments)
+        with self._extract_lock:
+            cached = self._extract_cache.get(key)
+            if cached is not None:
+                self._extract_cache.move_to_end(key)
+        if cached is not None:
+            # Copy so callers adding matched_keyword etc. never touch the cached entry
+            return cached.copy()
+        
+        url = f"https://reddit.com{submission.permalink}"
+        data = {
             'id': submission.id,
             'title': submission.title,
             'author': str(submission.author) if submission.author else '[deleted]',
-            'score': submission.score,
+            'score': score,
             'upvote_ratio': submission.upvote_ratio,
-            'num_comments': submission.num_comments,
-            'created_utc': datetime.fromtimestamp(submission.created_utc),
-            'url': f"https://reddit.com{submission.permalink}",
-            'permalink': f"https://reddit.com{submission.permalink}",  # Added for compatibility
+            'num_comments': num_comments,
+            'created_utc': submission.created_utc,  # Raw epoch seconds; UI converts for display
+            'url': url,
+            'permalink': url,  # Added for compatibility
             'domain': submission.domain,
             'is_self': submission.is_self,
-            'selftext': submission.selftext if hasattr(submission, 'selftext') else '',
+            'selftext': getattr(submission, 'selftext', '') or '',
             'nsfw': submission.over_18,
             'spoiler': submission.spoiler,
             'stickied': submission.stickied,
-            'activity_score': submission.score + (submission.num_comments * 2),  # Weighted activity score
-            'engagement_rate': (submission.num_comments / max(submission.score, 1)) * 100,
+            'activity_score': score + (num_comments * 2),  # Weighted activity score
+            'engagement_rate': (num_comments / max(score, 1)) * 100,
         }
+        with self._extract_lock:
+            self._extract_cache[key] = data
+            if len(self._extract_cache) > _EXTRACT_CACHE_SIZE:
+                self._extract_cache.popitem(last=False)
+        return data.copy()
     
     def _analyze_text_sentiment(self, text: str) -> Optional[str]:
-        """Analyze sentiment of text using TextBlob."""
+        """Analyze sentiment of a single text."""
+        return self._score_sentiments([text])[0]
+    
+    def _score_sentiments(self, texts: List[str]) -> List[Optional[str]]:
+        """Label each text positive/negative/neutral from TextBlob's polarity lexicon.
+        
+        Scores with a preloaded word -> polarity dict instead of building a
+        TextBlob per text; TextBlob is only used if the lexicon can't be loaded.
+        """
         if not settings.sentiment_analysis_enabled:
-            return None
-            
-        try:
-            blob = TextBlob(text)
-            polarity = blob.sentiment.polarity
+            return [None] * len(texts)
+        
+        lexicon = _sentiment_lexicon()
+        labels = []
+        for text in texts:
+            try:
+                if lexicon:
+                    polarity = _lexicon_polarity(text, lexicon)
+                else:
+                    from textblob import TextBlob
+                    polarity = TextBlob(text).sentiment.polarity
+            except Exception as e:
+                print(f"Error analyzing sentiment: {e}")
+                labels.append(None)
+                continue
             
             if polarity > 0.1:
-                return 'positive'
+                labels.append('positive')
             elif polarity < -0.1:
-                return 'negative'
+                labels.append('negative')
             else:
-                return 'neutral'
-        except Exception as e:
-            print(f"Error analyzing sentiment: {e}")
-            return None
+                labels.append('neutral')
+        return labels
     
-    def _analyze_posting_times(self, df: pd.DataFrame) -> Dict:
-        """Analyze posting patterns by hour."""
+    def _analyze_posting_times(self, hours: List[int]) -> Dict:
+        """Analyze posting patterns by hour (only hours that have posts, in order)."""
         try:
-            df['hour'] = df['created_utc'].dt.hour
-            hourly_counts = df['hour'].value_counts().sort_index()
-            return hourly_counts.to_dict()
+            hourly_counts = np.bincount(np.asarray(hours, dtype=np.int64), minlength=24)
+            return {hour: int(count) for hour, count in enumerate(hourly_counts) if count}
         except Exception as e:
             print(f"Error analyzing posting times: {e}")
             return {}
     
     def _detect_language(self, text: str) -> Optional[str]:
-        """Detect language of text."""
+        """Detect language of text (fastText when a model is configured, else langdetect)."""
         try:
             if len(text.strip()) < 20:  # Too short for reliable detection
                 return None
+            model = _language_model(settings.language_model_path)
+            if model is not None:
+                # fastText predicts one line at a time; labels look like "__label__en"
+                labels, _ = model.predict(text.replace('\n', ' '), k=1)
+                return labels[0][len('__label__'):]
             return detect(text)
         except (LangDetectException, Exception):
             return None 
\ No newline at end of file
@@ -0,0 +1,13 @@
+"""One-shot messages that survive a st.rerun()."""
+
+import streamlit as st
+
+
+def show_flash():
+    """Show and clear the message a page queued in st.session_state['flash'] before rerunning.
+
+    The queued value is a (streamlit function name, text) pair, e.g. ('success', "Saved!").
+    """
+    msg = st.session_state.pop('flash', None)
+    if msg:
+        getattr(st, msg[0])(msg[1])
@@ -1,23 +1,172 @@
 """API Keys management page for Reddit Scout Pro."""
 
+import hmac
+from functools import lru_cache
+
 import streamlit as st
-from ...auth.decorators import require_auth, get_current_user
-from ...database.database import get_user_api_keys, upsert_user_api_keys
+from ...auth.decorators import check_session_validity, get_current_user
+from ...database.database import delete_user_api_keys, get_user_api_keys, upsert_user_api_keys
+from ..flash import show_flash
+
+
+_INSTRUCTIONS_MD = """
+### Step-by-Step Guide:
+
+1. **Go to Reddit Apps**: Visit [reddit.com/prefs/apps](https://www.reddit.com/prefs/apps)
+
+2. **Create a New App**:
+   - Click "Create App" or "Create Another App"
+   - Choose a name for your app (e.g., "My Reddit Scout")
+   - Select **"script"** as the app type
+   - Add a description (optional)
+   - Set redirect URI to: `http://localhost:8080`
+
+3. **Get Your Credentials**:
+   - **Client ID**: The string under "personal use script" (shorter string)
+   - **Client Secret**: The "secret" string (longer string)
+
+4. **Important Notes**:
+   - Keep your credentials secure and never share them
+   - These keys are encrypted and stored safely in our database
+   - You can update them anytime if needed
+"""
+
+_SECURITY_MD = """
+### How We Protect Your API Keys:
+
+- **Encryption**: Your Client Secret is encrypted using industry-standard AES encryption
+- **Secure Storage**: Keys are stored in an encrypted database
+- **No Logging**: We never log or display your actual API keys
+- **Local Processing**: All Reddit data analysis happens in real-time, nothing is permanently stored
+
+### What We Don't Store:
+- Your Reddit posts or comments
+- Your browsing history
+- Personal Reddit data
+- API responses (except for temporary caching)
+
+### Your Rights:
+- You can update or remove your API keys anytime
+- You can delete your account and all associated data
+- You maintain full control over your Reddit API access
+"""
+
+
+def _unchanged(existing, payload):
+    """True when every submitted field matches the stored (decrypted) keys."""
+    if not existing:
+        return False
+    # Constant-time compare so secrets don't leak through timing
+    return all(
+        hmac.compare_digest((existing.get(k) or "").encode(), (v or "").encode())
+        for k, v in payload.items()
+    )
+
+
+def _get_cached_keys(uid):
+    """Stored keys for uid, fetched once per session until a save/remove."""
+    cache = st.session_state.setdefault('api_keys_cache', {})
+    if uid not in cache:
+        cache[uid] = get_user_api_keys(uid)
+    return cache[uid]
+
+
+_INSTRUCTIONS_IMAGE_URL = "https://i.imgur.com/yNlEkWP.png"
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _instructions_image():
+    """Instructions screenshot bytes, or the URL itself if the fetch fails."""
+    import requests
+    try:
+        resp = requests.get(_INSTRUCTIONS_IMAGE_URL, timeout=5)
+        resp.raise_for_status()
+        return resp.content
+    except requests.RequestException:
+        return _INSTRUCTIONS_IMAGE_URL
+
+
+@lru_cache(maxsize=1)
+def _praw():
+    """Import praw on first use; later calls are a cache hit."""
+    import praw
+    return praw
+
+
+def _get_reddit(keys):
+    """praw.Reddit client for these credentials, reused across reruns."""
+    key = hash((
+        keys.get('client_id', ''), keys.get('client_secret', ''),
+        keys.get('user_agent', ''), keys.get('reddit_username', ''),
+        keys.get('reddit_password', ''),
+    ))
+    cache = st.session_state.setdefault('praw_clients', {})
+    if key not in cache:
+        cache[key] = _praw().Reddit(
+            client_id=keys.get('client_id', ''),
+            client_secret=keys.get('client_secret', ''),
+            user_agent=keys.get('user_agent') or 'RedditScoutPro/1.0',
+            username=keys.get('reddit_username') or None,
+            password=keys.get('reddit_password') or None,
+        )
+    return cache[key]
+
+
+# Quick Start target page -> radio label
+_QUICK_START = {
+    "Subreddit Finder": "🔍 Explore Subreddits",
+    "Active Discussions": "🔥 Active Discussions",
+    "Subreddit Analytics": "📊 Analytics",
+}
+
+
+@st.dialog("Remove API keys?")
+def _confirm_remove(uid):
+    """Modal confirmation; only rendered after the Remove button is clicked."""
+    st.warning("⚠️ Are you sure you want to remove your API keys?")
+    col1, col2 = st.columns(2)
+    
+    if col1.button("Yes, Remove", type="primary", use_container_width=True):
+        delete_user_api_keys(uid)
+        st.session_state.setdefault('api_keys_cache', {}).pop(uid, None)
+        st.session_state.pop('praw_clients', None)
+        st.session_state['keys_configured'] = False
+        st.session_state['flash'] = ('success', "API keys removed successfully.")
+        st.rerun()
+    
+    if col2.button("Cancel", use_container_width=True):
+        st.rerun()
+
+
+def _jump_to_quickstart():
+    """on_change callback: queue the chosen page for the next run and clear the choice."""
+    st.session_state.page_redirect = st.session_state._quickstart
+    # Otherwise the radio keeps its selection, and picking the same page again fires no change
+    st.session_state._quickstart = None
+
 
-@require_auth
 def render_api_keys_page():
     """Render the API keys management page."""
+    # Auth gate inline (was @require_auth); this page reruns on every widget event
+    user = get_current_user()
+    if not user:
+        st.error("🔒 Please log in to access this feature.")
+        st.stop()
+    if st.session_state.get('session_token') and not check_session_validity():
+        st.error("🕐 Your session has expired. Please log in again.")
+        st.rerun()
+    
+    show_flash()
     st.title("🔑 Reddit API Keys")
     st.markdown("Configure your Reddit API credentials to start exploring Reddit data.")
     
-    user = get_current_user()
-    if not user:
-        st.error("Authentication error. Please log in again.")
-        return
     
     # Prefill from DB and check current configuration status
-    existing = get_user_api_keys(user['user_id'])
-    is_configured = bool(existing and existing.get('client_id') and existing.get('client_secret'))
+    existing = _get_cached_keys(user['user_id'])
+    is_configured = st.session_state.get('keys_configured')
+    if is_configured is None:
+        is_configured = bool(existing and existing.get('client_id') and existing.get('client_secret'))
+        st.session_state['keys_configured'] = is_configured
     
     if is_configured:
         st.success("✅ Reddit API keys are configured and working!")
@@ -26,29 +175,9 @@ def render_api_keys_page():
     
     # Instructions section
     with st.expander("📖 How to get Reddit API Keys", expanded=not is_configured):
-        st.markdown("""
-        ### Step-by-Step Guide:
-        
-        1. **Go to Reddit Apps**: Visit [reddit.com/prefs/apps](https://www.reddit.com/prefs/apps)
-        
-        2. **Create a New App**:
-           - Click "Create App" or "Create Another App"
-           - Choose a name for your app (e.g., "My Reddit Scout")
-           - Select **"script"** as the app type
-           - Add a description (optional)
-           - Set redirect URI to: `http://localhost:8080`
+        st.markdown(_INSTRUCTIONS_MD)
         
-        3. **Get Your Credentials**:
-           - **Client ID**: The string under "personal use script" (shorter string)
-           - **Client Secret**: The "secret" string (longer string)
-        
-        4. **Important Notes**:
-           - Keep your credentials secure and never share them
-           - These keys are encrypted and stored safely in our database
-           - You can update them anytime if needed
-        """)
-        
-        st.image("https://i.imgur.com/yNlEkWP.png", caption="Example of Reddit app creation", width=600)
+        st.image(_instructions_image(), caption="Example of Reddit app creation", width=600)
     
     # API Keys form
     st.markdown("### Configure Your API Keys")
@@ -57,8 +186,9 @@ def render_api_keys_page():
         col1, col2 = st.columns(2)
 
         with col1:
-            client_id = st.text_input(
+            st.text_input(
                 "Reddit Client ID",
+                key="cred_client_id",
                 value=(existing.get('client_id') if existing else ""),
                 placeholder="Enter your Reddit Client ID",
                 help="The shorter string under 'personal use script'",
@@ -66,33 +196,45 @@ def render_api_keys_page():
             )
 
         with col2:
-            user_agent = st.text_input(
+            st.text_input(
                 "User Agent (Optional)",
+                key="cred_user_agent",
                 value=(existing.get('user_agent') if existing and existing.get('user_agent') else "RedditScoutPro/1.0"),
                 help="Identifies your app to Reddit's API"
             )
 
-        client_secret = st.text_input(
+        st.text_input(
             "Reddit Client Secret",
-            value=(existing.get('client_secret') if existing else ""),
+            key="cred_client_secret",
+            value="",
             placeholder="Enter your Reddit Client Secret",
-            help="The longer 'secret' string from your Reddit app",
+            help="The longer 'secret' string from your Reddit app. Leave blank to keep existing value",
             type="password"
         )
 
-        reddit_username = st.text_input(
+        st.text_input(
             "Reddit Username (Optional)",
+            key="cred_reddit_username",
             value=(existing.get('reddit_username') if existing else ""),
             placeholder="Enter Reddit username if using password auth",
         )
 
-        reddit_password = st.text_input(
+        st.text_input(
             "Reddit Password (Optional)",
-            value=(existing.get('reddit_password') if existing else ""),
+            key="cred_reddit_password",
+            value="",
             type="password",
             placeholder="Enter Reddit password if using password auth",
+            help="Leave blank to keep existing value",
         )
 
+        if existing and existing.get('reddit_password'):
+            st.checkbox(
+                "Clear stored Reddit password",
+                key="cred_clear_password",
+                help="Switch to app-only auth; also happens when the username is left blank",
+            )
+
         submit_button = st.form_submit_button(
             "Save API Keys",
             use_container_width=True,
@@ -100,25 +242,39 @@ def render_api_keys_page():
         )
 
         if submit_button:
-            if not client_id or not client_secret:
+            # Inputs are keyed, so their values are only read on submit
+            form = {
+                k: (st.session_state.get(f"cred_{k}") or "").strip()
+                for k in ("client_id", "client_secret", "user_agent", "reddit_username", "reddit_password")
+            }
+            # Secret fields are never prefilled; a blank input keeps the stored value
+            secrets = {k: form[k] for k in ("client_secret", "reddit_password")}
+            kept = {k: (existing or {}).get(k) or "" for k in secrets}
+            secrets = {**kept, **{k: v for k, v in secrets.items() if v}}
+            # Without a username the password is unusable, so app-only auth drops it too
+            if not form["reddit_username"]:
+                secrets["reddit_password"] = ""
+            elif st.session_state.get("cred_clear_password") and not form["reddit_password"]:
+                secrets["reddit_password"] = ""
+            payload = {
+                "client_id": form["client_id"],
+                "user_agent": form["user_agent"] or "RedditScoutPro/1.0",
+                "reddit_username": form["reddit_username"],
+                **secrets,
+            }
+            if not payload["client_id"] or not payload["client_secret"]:
                 st.error("Please provide both Client ID and Client Secret.")
+            elif _unchanged(existing, payload):
+                st.info("No changes to save.")
             else:
                 with st.spinner("Saving your API keys..."):
-                    upsert_user_api_keys(
-                        user_id=user['user_id'],
-                        payload={
-                            "client_id": client_id.strip(),
-                            "client_secret": client_secret.strip(),
-                            "user_agent": (user_agent.strip() if user_agent else "RedditScoutPro/1.0"),
-                            "reddit_username": reddit_username.strip() if reddit_username else "",
-                            "reddit_password": reddit_password.strip() if reddit_password else "",
-                        }
-                    )
-
-                    st.success("🎉 API keys saved successfully!")
-                    st.balloons()
-                    import time
-                    time.sleep(1)
+                    upsert_user_api_keys(user_id=user['user_id'], payload=payload)
+
+                    # Invalidate cached copies of this user's keys
+                    st.session_state['api_keys_cache'].pop(user['user_id'], None)
+                    st.session_state.pop('praw_clients', None)
+                    st.session_state['keys_configured'] = True
+                    st.session_state['flash'] = ('success', "🎉 API keys saved successfully!")
                     st.rerun()
     
     # Test connection section
@@ -131,15 +287,7 @@ def render_api_keys_page():
             if st.button("🔍 Test Reddit Connection", use_container_width=True):
                 with st.spinner("Testing connection..."):
                     try:
-                        import praw
-                        keys = existing or {}
-                        reddit = praw.Reddit(
-                            client_id=keys.get('client_id', ''),
-                            client_secret=keys.get('client_secret', ''),
-                            user_agent=keys.get('user_agent') or 'RedditScoutPro/1.0',
-                            username=keys.get('reddit_username') or None,
-                            password=keys.get('reddit_password') or None,
-                        )
+                        reddit = _get_reddit(existing or {})
                         reddit.user.me()
                         st.success("✅ Connection test successful!")
                     except Exception as e:
@@ -147,75 +295,24 @@ def render_api_keys_page():
         
         with col2:
             if st.button("🗑️ Remove API Keys", use_container_width=True):
-                st.session_state.confirm_delete = True
-        
-        # Confirmation dialog for deletion
-        if st.session_state.get('confirm_delete', False):
-            st.warning("⚠️ Are you sure you want to remove your API keys?")
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                if st.button("Yes, Remove", type="primary"):
-                    upsert_user_api_keys(
-                        user_id=user['user_id'],
-                        payload={
-                            "client_id": "",
-                            "client_secret": "",
-                            "user_agent": existing.get('user_agent') if existing else "RedditScoutPro/1.0",
-                            "reddit_username": "",
-                            "reddit_password": "",
-                        }
-                    )
-                    st.session_state.confirm_delete = False
-                    st.success("API keys removed successfully.")
-                    st.rerun()
-            
-            with col2:
-                if st.button("Cancel"):
-                    st.session_state.confirm_delete = False
-                    st.rerun()
+                _confirm_remove(user['user_id'])
     
     # Security information
     st.markdown("---")
     with st.expander("🔒 Security & Privacy Information"):
-        st.markdown("""
-        ### How We Protect Your API Keys:
-        
-        - **Encryption**: Your Client Secret is encrypted using industry-standard AES encryption
-        - **Secure Storage**: Keys are stored in an encrypted database
-        - **No Logging**: We never log or display your actual API keys
-        - **Local Processing**: All Reddit data analysis happens in real-time, nothing is permanently stored
-        
-        ### What We Don't Store:
-        - Your Reddit posts or comments
-        - Your browsing history
-        - Personal Reddit data
-        - API responses (except for temporary caching)
-        
-        ### Your Rights:
-        - You can update or remove your API keys anytime
-        - You can delete your account and all associated data
-        - You maintain full control over your Reddit API access
-        """)
+        st.markdown(_SECURITY_MD)
     
     # Quick start section
     if is_configured:
         st.markdown("---")
         st.markdown("### 🚀 Quick Start")
         
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            if st.button("🔍 Explore Subreddits", use_container_width=True):
-                st.session_state.page_redirect = "Subreddit Finder"
-                st.rerun()
-        
-        with col2:
-            if st.button("🔥 Active Discussions", use_container_width=True):
-                st.session_state.page_redirect = "Active Discussions"
-                st.rerun()
-        
-        with col3:
-            if st.button("📊 Analytics", use_container_width=True):
-                st.session_state.page_redirect = "Subreddit Analytics"
-                st.rerun()
+        st.radio(
+            "Jump to:",
+            list(_QUICK_START),
+            format_func=_QUICK_START.get,
+            horizontal=True,
+            index=None,
+            key="_quickstart",
+            on_change=_jump_to_quickstart,
+        )
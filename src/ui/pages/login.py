@@ -4,13 +4,48 @@ import streamlit as st
 try:
     from ...auth.auth_manager import AuthManager
     from ...auth.decorators import set_auth_state
+    from ..flash import show_flash
 except ImportError:
     # Fallback for direct imports
     from auth.auth_manager import AuthManager
     from auth.decorators import set_auth_state
+    from ui.flash import show_flash
+
+_ABOUT_MD = """
+**Reddit Scout Pro** is a powerful Reddit analytics and discovery tool that helps you:
+
+- 🔍 **Discover** relevant subreddits for your interests
+- 🔥 **Track** active discussions and trending topics
+- 📊 **Analyze** subreddit metrics and engagement patterns
+- 💭 **Monitor** sentiment across communities
+- 🔎 **Search** across multiple subreddits simultaneously
+- ☁️ **Visualize** popular topics with word clouds
+
+**Your Privacy**: We store only your login credentials and Reddit API keys (encrypted). 
+We never store or analyze your personal Reddit data.
+
+**Getting Started**: After signing in, you'll need to add your Reddit API keys to start exploring.
+Don't worry - we'll guide you through the process!
+"""
+
+
+@st.cache_resource
+def _auth_manager():
+    """Process-wide AuthManager; it holds no per-user state."""
+    return AuthManager()
+
+def _capture_client_info():
+    """Record the browser's User-Agent and forwarded IP once per session."""
+    if '_ua' not in st.session_state:
+        headers = st.context.headers
+        st.session_state['_ua'] = headers.get('User-Agent')
+        # First hop of the proxy chain is the client; Session.ip_address is String(45)
+        forwarded = headers.get('X-Forwarded-For') or ''
+        st.session_state['_ip'] = forwarded.split(',')[0].strip()[:45] or None
 
 def render_login_page():
     """Render the login page."""
+    _capture_client_info()
     st.title("🔐 Login to Reddit Scout Pro")
     st.markdown("Welcome back! Please sign in to access your personalized Reddit analytics.")
     
@@ -47,23 +82,18 @@ def render_login_page():
                     st.error("Please enter both username/email and password.")
                 else:
                     with st.spinner("Signing you in..."):
-                        auth = AuthManager()
+                        auth = _auth_manager()
                         result = auth.login_user(
                             username=username.strip(),
                             password=password,
-                            user_agent=None,
-                            ip_address=None
+                            user_agent=st.session_state['_ua'],
+                            ip_address=st.session_state['_ip']
                         )
                         
                         if result["success"]:
                             # Set authentication state
                             set_auth_state(result)
-                            st.success(f"Welcome back, {result['username']}! 🎉")
-                            st.balloons()
-                            
-                            # Small delay to show success message
-                            import time
-                            time.sleep(1)
+                            st.session_state['flash'] = ('success', f"Welcome back, {result['username']}! 🎉")
                             st.rerun()
                         else:
                             st.error(f"❌ {result['message']}")
@@ -142,25 +172,19 @@ def render_registration_page():
                     st.error("Please accept the Terms of Service to continue.")
                 else:
                     with st.spinner("Creating your account..."):
-                        auth = AuthManager()
+                        auth = _auth_manager()
                         result = auth.register_user(
                             username=username.strip(),
                             email=email.strip(),
-                            password=password
+                            password=password,
+                            login=True
                         )
                         
                         if result["success"]:
-                            st.success("🎉 Account created successfully!")
-                            st.info("You can now sign in with your new account.")
-                            
-                            # Auto-login the user
-                            login_result = auth.login_user(username, password)
-                            if login_result["success"]:
-                                set_auth_state(login_result)
-                                st.balloons()
-                                import time
-                                time.sleep(2)
-                                st.rerun()
+                            # Registration opened the session already; no second login round
+                            set_auth_state(result)
+                            st.session_state['flash'] = ('success', "🎉 Account created successfully!")
+                            st.rerun()
                         else:
                             st.error(f"❌ {result['message']}")
         
@@ -174,32 +198,23 @@ def render_registration_page():
 
 def render_auth_page():
     """Render the main authentication page (login/register)."""
+    show_flash()
     # Check if user wants to register
     if st.session_state.get('show_register', False):
         render_registration_page()
     else:
         render_login_page()
     
+    _about_fragment()
+
+@st.fragment
+def _about_fragment():
+    """Static About block and footer, kept out of the form's render path."""
     # Add some information about the app
     st.markdown("---")
     
     with st.expander("ℹ️ About Reddit Scout Pro", expanded=False):
-        st.markdown("""
-        **Reddit Scout Pro** is a powerful Reddit analytics and discovery tool that helps you:
-        
-        - 🔍 **Discover** relevant subreddits for your interests
-        - 🔥 **Track** active discussions and trending topics
-        - 📊 **Analyze** subreddit metrics and engagement patterns
-        - 💭 **Monitor** sentiment across communities
-        - 🔎 **Search** across multiple subreddits simultaneously
-        - ☁️ **Visualize** popular topics with word clouds
-        
-        **Your Privacy**: We store only your login credentials and Reddit API keys (encrypted). 
-        We never store or analyze your personal Reddit data.
-        
-        **Getting Started**: After signing in, you'll need to add your Reddit API keys to start exploring.
-        Don't worry - we'll guide you through the process!
-        """)
+        st.markdown(_ABOUT_MD)
     
     # Footer
     st.markdown("---")
@@ -0,0 +1,16 @@
+"""Executor helpers shared by the launcher and the setup/test scripts.
+
+Import-only: no logging configuration or other side effects at module level.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+
+def bounded_pool(n=None, executor=ThreadPoolExecutor):
+    """Executor with at most n workers (default 4), capped at the CPU count.
+
+    Shared by start.py, test_local.py and test_setup.py so concurrent startup
+    paths don't oversubscribe small containers.
+    """
+    return executor(max_workers=min(n or 4, os.cpu_count() or 2))
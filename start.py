@@ -6,14 +6,90 @@ Handles all potential deployment issues and provides clear error messages.
 
 import os
 import sys
-import subprocess
+import time
+import compileall
+import hashlib
+import shutil
 import logging
+from functools import partial
+from itertools import groupby
+from operator import itemgetter
+from importlib.util import find_spec
 from pathlib import Path
 
+from src.utils.concurrency import bounded_pool
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Warm starts skip the file/dependency checks while this stamp matches and is fresh
+PREFLIGHT_STAMP = Path('/tmp/reddit_scout_preflight.stamp')
+PREFLIGHT_STAMP_MAX_AGE = 24 * 3600
+
+REQUIRED_PATHS = (
+    'app_multi_user.py',
+    'src/',
+    'src/database/',
+    'src/auth/',
+    'src/core/',
+    'src/ui/',
+    'requirements.txt',
+)
+
+REQUIRED_VARS = (
+    ('DATABASE_URL', 'PostgreSQL database connection string'),
+    ('SECRET_KEY', 'Application secret key for sessions'),
+    ('ENCRYPTION_KEY', 'Encryption key for API keys (optional - will generate)'),
+)
+
+# A tuple entry lists interchangeable packages; any one of them satisfies it
+REQUIRED_PACKAGES = (
+    'streamlit',
+    'sqlalchemy',
+    'bcrypt',
+    'cryptography',
+    'praw',
+    ('psycopg2', 'psycopg'),
+)
+
+# Pre-flight checks return (ok, messages); messages are (level, text) pairs that
+# main() logs after the checks finish so parallel output doesn't interleave.
+
+def _emit(messages):
+    """Log collected (level, text) check messages in order, one record per run of same-level lines."""
+    for level, group in groupby(messages, key=itemgetter(0)):
+        logger.log(level, "\n".join(text for _, text in group))
+
+def _preflight_digest():
+    """Hash of requirements.txt and the required path list."""
+    h = hashlib.blake2b()
+    try:
+        h.update(Path('requirements.txt').read_bytes())
+    except OSError:
+        return None
+    h.update('\0'.join(sorted(REQUIRED_PATHS)).encode())
+    return h.hexdigest()
+
+def _preflight_stamp_valid(digest):
+    """True if the last successful pre-flight had the same digest and is recent."""
+    try:
+        fresh = time.time() - PREFLIGHT_STAMP.stat().st_mtime < PREFLIGHT_STAMP_MAX_AGE
+        return fresh and PREFLIGHT_STAMP.read_text().strip() == digest
+    except OSError:
+        return False
+
+def _write_preflight_stamp(digest):
+    """Record a successful pre-flight; failure to write is not fatal."""
+    try:
+        PREFLIGHT_STAMP.write_text(digest)
+    except OSError as e:
+        logger.warning(f"⚠️ Could not write pre-flight stamp: {e}")
+
+def _skipped(name):
+    """Result for a check skipped on a warm start."""
+    return lambda: (True, [(logging.INFO, f"⏭️ {name} unchanged since last start, skipped")])
+
 def check_python_version():
     """Ensure Python version is compatible."""
     if sys.version_info < (3, 8):
@@ -21,120 +97,118 @@ def check_python_version():
         sys.exit(1)
     logger.info(f"✅ Python {sys.version} is compatible")
 
-def check_environment_variables():
-    """Check critical environment variables."""
-    required_vars = {
-        'DATABASE_URL': 'PostgreSQL database connection string',
-        'SECRET_KEY': 'Application secret key for sessions',
-        'ENCRYPTION_KEY': 'Encryption key for API keys (optional - will generate)'
-    }
-    
+def check_environment_variables(env):
+    """Check critical environment variables in the env snapshot."""
+    messages = []
     missing_vars = []
-    for var, description in required_vars.items():
-        value = os.getenv(var)
+    for var, description in REQUIRED_VARS:
+        value = env.get(var)
         if not value:
             if var == 'ENCRYPTION_KEY':
-                logger.warning(f"⚠️ {var} not set - will auto-generate")
+                messages.append((logging.WARNING, f"⚠️ {var} not set - will auto-generate"))
             else:
-                logger.error(f"❌ {var} not set - {description}")
+                messages.append((logging.ERROR, f"❌ {var} not set - {description}"))
                 missing_vars.append(var)
         else:
             # Don't log actual values for security
-            logger.info(f"✅ {var} is set")
+            messages.append((logging.INFO, f"✅ {var} is set"))
     
     if missing_vars:
-        logger.error(f"Missing required environment variables: {', '.join(missing_vars)}")
-        logger.error("Set these in your deployment platform's environment variables section")
-        sys.exit(1)
+        messages.append((logging.ERROR, f"Missing required environment variables: {', '.join(missing_vars)}"))
+        messages.append((logging.ERROR, "Set these in your deployment platform's environment variables section"))
+    return not missing_vars, messages
+
+def _installed(package):
+    """Whether package can be imported; find_spec locates it without running its module code."""
+    try:
+        return find_spec(package) is not None
+    except ImportError:
+        return False
 
 def check_dependencies():
     """Check that all required packages are installed."""
-    required_packages = [
-        'streamlit',
-        'sqlalchemy', 
-        'bcrypt',
-        'cryptography',
-        'praw',
-        'psycopg2'
-    ]
-    
+    messages = []
     missing_packages = []
-    for package in required_packages:
-        try:
-            __import__(package)
-            logger.info(f"✅ {package} installed")
-        except ImportError:
-            logger.error(f"❌ {package} not installed")
+    for requirement in REQUIRED_PACKAGES:
+        alternatives = requirement if isinstance(requirement, tuple) else (requirement,)
+        package = next((name for name in alternatives if _installed(name)), None)
+        if package:
+            messages.append((logging.INFO, f"✅ {package} installed"))
+        else:
+            package = ' or '.join(alternatives)
+            messages.append((logging.ERROR, f"❌ {package} not installed"))
             missing_packages.append(package)
     
     if missing_packages:
-        logger.error(f"Missing packages: {', '.join(missing_packages)}")
-        logger.info("Installing missing packages...")
-        try:
-            subprocess.check_call([
-                sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt'
-            ])
-            logger.info("✅ Dependencies installed successfully")
-        except subprocess.CalledProcessError as e:
-            logger.error(f"❌ Failed to install dependencies: {e}")
-            sys.exit(1)
+        messages.append((logging.ERROR, f"Missing packages: {', '.join(missing_packages)}"))
+        messages.append((logging.ERROR, "Install dependencies at build time: pip install -r requirements.txt"))
+    return not missing_packages, messages
 
 def check_file_structure():
     """Verify all required files and directories exist."""
-    required_paths = [
-        'app_multi_user.py',
-        'src/',
-        'src/database/',
-        'src/auth/',
-        'src/core/',
-        'src/ui/',
-        'requirements.txt'
-    ]
+    # One directory read per parent instead of a stat() per required path
+    listings = {}
+    def _exists(path):
+        parent, _, name = path.rstrip('/').rpartition('/')
+        parent = parent or '.'
+        if parent not in listings:
+            try:
+                with os.scandir(parent) as entries:
+                    listings[parent] = {e.name for e in entries}
+            except OSError:
+                listings[parent] = set()
+        return name in listings[parent]
     
+    messages = []
     missing_paths = []
-    for path in required_paths:
-        if not Path(path).exists():
-            logger.error(f"❌ Missing: {path}")
+    for path in REQUIRED_PATHS:
+        if not _exists(path):
+            messages.append((logging.ERROR, f"❌ Missing: {path}"))
             missing_paths.append(path)
         else:
-            logger.info(f"✅ Found: {path}")
+            messages.append((logging.INFO, f"✅ Found: {path}"))
     
     if missing_paths:
-        logger.error(f"Missing required files/directories: {', '.join(missing_paths)}")
-        logger.error("Ensure the complete project structure is deployed")
-        sys.exit(1)
+        messages.append((logging.ERROR, f"Missing required files/directories: {', '.join(missing_paths)}"))
+        messages.append((logging.ERROR, "Ensure the complete project structure is deployed"))
+    return not missing_paths, messages
+
+def precompile_sources():
+    """Byte-compile src/ so imports load cached .pyc files; up-to-date ones are skipped."""
+    if not compileall.compile_dir('src', quiet=1):
+        logger.warning("⚠️ Some modules in src/ failed to byte-compile")
 
 def test_database_connection():
     """Test database connectivity before starting the app."""
+    messages = [(logging.INFO, "Testing database connection...")]
     try:
-        # Add src to path
-        src_path = Path(__file__).parent / "src"
-        sys.path.insert(0, str(src_path))
+        from src.database.database import init_db
         
-        from database.database import check_db_health, init_db
-        
-        logger.info("Testing database connection...")
+        # create_all() has to connect and inspect the schema, so a successful init is
+        # the connectivity probe; a separate SELECT 1 would only repeat the round trip
         if not init_db():
-            logger.error("❌ Database initialization failed")
-            sys.exit(1)
-        
-        if not check_db_health():
-            logger.error("❌ Database health check failed")
-            sys.exit(1)
+            messages.append((logging.ERROR, "❌ Database initialization failed"))
+            return False, messages
         
-        logger.info("✅ Database connection successful")
+        messages.append((logging.INFO, "✅ Database connection successful"))
+        return True, messages
         
     except Exception as e:
-        logger.error(f"❌ Database test failed: {e}")
-        logger.error("Check your DATABASE_URL and ensure PostgreSQL is running")
-        sys.exit(1)
+        messages.append((logging.ERROR, f"❌ Database test failed: {e}"))
+        messages.append((logging.ERROR, "Check your DATABASE_URL and ensure PostgreSQL is running"))
+        return False, messages
 
-def start_streamlit():
+def start_streamlit(env):
     """Start the Streamlit application with proper configuration."""
-    port = os.getenv('PORT', '8501')
+    port = env.get('PORT', '8501')
+    
+    # Prefer the streamlit script installed beside this interpreter (same environment);
+    # fall back to `python -m streamlit` when there is none
+    streamlit_bin = shutil.which('streamlit', path=os.path.dirname(sys.executable))
+    launcher = [streamlit_bin] if streamlit_bin else [sys.executable, '-m', 'streamlit']
     
-    cmd = [
-        sys.executable, '-m', 'streamlit', 'run', 'app_multi_user.py',
+    cmd = launcher + [
+        'run', 'app_multi_user.py',
         '--server.port', port,
         '--server.address', '0.0.0.0',
         '--server.headless', 'true',
@@ -148,7 +222,8 @@ def start_streamlit():
     
     try:
         # Use exec to replace this process with Streamlit
-        os.execvp(sys.executable, cmd)
+        # Absolute path, no PATH search; hand over the same environment snapshot the checks saw
+        os.execve(cmd[0], cmd, env)
     except Exception as e:
         logger.error(f"❌ Failed to start Streamlit: {e}")
         sys.exit(1)
@@ -157,17 +232,38 @@ def main():
     """Main startup sequence."""
     logger.info("🚀 Starting Reddit Scout Pro Community Edition...")
     
-    # Run all checks
+    # One environment snapshot shared by the checks and the launcher
+    env = os.environ.copy()
+    
+    # Cheap gate first; the remaining checks are independent and I/O-bound
     check_python_version()
-    check_file_structure()
-    check_environment_variables()
-    check_dependencies()
-    test_database_connection()
+    # Before anything imports src, so this launch already benefits
+    precompile_sources()
+    
+    digest = _preflight_digest()
+    warm = digest is not None and _preflight_stamp_valid(digest)
+    checks = (
+        _skipped("File structure") if warm else check_file_structure,
+        partial(check_environment_variables, env),
+        _skipped("Dependencies") if warm else check_dependencies,
+        test_database_connection,
+    )
+    with bounded_pool(len(checks)) as pool:
+        results = list(pool.map(lambda check: check(), checks))
+    
+    for _, messages in results:
+        _emit(messages)
+    
+    if not all(ok for ok, _ in results):
+        sys.exit(1)
+    
+    if digest is not None and not warm:
+        _write_preflight_stamp(digest)
     
     logger.info("✅ All checks passed! Starting application...")
     
     # Start the application
-    start_streamlit()
+    start_streamlit(env)
 
 if __name__ == "__main__":
     try:
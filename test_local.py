@@ -6,29 +6,31 @@ Tests all components without requiring deployment.
 
 import os
 import sys
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import sqlite3
 from pathlib import Path
 
-# Add src to path
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
+from src.utils.concurrency import bounded_pool
 
 def test_imports():
     """Test all imports."""
     print("🔍 Testing imports...")
     
+    # Existence only; the tests below import the modules they actually exercise
     tests = [
-        ("Database", lambda: __import__('database.database')),
-        ("Models", lambda: __import__('database.models')),
-        ("Auth Manager", lambda: __import__('auth.auth_manager')),
-        ("Encryption", lambda: __import__('core.encryption')),
-        ("UI Login", lambda: __import__('ui.pages.login')),
+        ("Database", 'src.database.database'),
+        ("Models", 'src.database.models'),
+        ("Auth Manager", 'src.auth.auth_manager'),
+        ("Encryption", 'src.core.encryption'),
+        ("UI Login", 'src.ui.pages.login'),
     ]
     
     passed = 0
-    for name, test_func in tests:
+    for name, module in tests:
         try:
-            test_func()
+            if importlib.util.find_spec(module) is None:
+                raise ImportError(f"No module named '{module}'")
             print(f"✅ {name} imports OK")
             passed += 1
         except Exception as e:
@@ -36,36 +38,43 @@ def test_imports():
     
     return passed, len(tests)
 
-def test_database():
-    """Test database functionality with SQLite."""
-    print("\n🗄️ Testing database...")
-    
+def open_test_db():
+    """Initialize the SQLite test database once and return a shared session."""
     # Set environment for SQLite testing
     os.environ['DATABASE_URL'] = 'sqlite:///test_reddit_scout.db'
     
     try:
-        from database.database import init_db, check_db_health, get_db_session
-        from database.models import User, APIKey
+        from src.database.database import init_db, get_db_session
         
-        # Initialize database
         if not init_db():
             print("❌ Database initialization failed")
-            return False
+            return None
+        return get_db_session()
+    except Exception as e:
+        print(f"❌ Database initialization failed: {e}")
+        return None
+
+def test_database(db):
+    """Test database functionality with SQLite."""
+    print("\n🗄️ Testing database...")
+    
+    if db is None:
+        print("❌ Database not initialized")
+        return False
+    
+    try:
+        from src.database.database import check_db_health
+        from src.database.models import User
         
         # Test health check
         if not check_db_health():
             print("❌ Database health check failed")
             return False
         
-        # Test basic operations
-        db = get_db_session()
-        try:
-            # Count users (should be 0)
-            user_count = db.query(User).count()
-            print(f"✅ Database operations OK (users: {user_count})")
-            return True
-        finally:
-            db.close()
+        # Count users (should be 0)
+        user_count = db.query(User).count()
+        print(f"✅ Database operations OK (users: {user_count})")
+        return True
             
     except Exception as e:
         print(f"❌ Database test failed: {e}")
@@ -76,7 +85,7 @@ def test_encryption():
     print("\n🔐 Testing encryption...")
     
     try:
-        from core.encryption import APIKeyEncryption, encrypt_api_key, decrypt_api_key
+        from src.core.encryption import APIKeyEncryption, encrypt_api_key, decrypt_api_key
         
         # Test encryption/decryption
         test_key = "test_reddit_api_key_12345"
@@ -94,12 +103,16 @@ def test_encryption():
         print(f"❌ Encryption test failed: {e}")
         return False
 
-def test_authentication():
+def test_authentication(db):
     """Test authentication system."""
     print("\n👤 Testing authentication...")
     
+    if db is None:
+        print("❌ Database not initialized")
+        return False
+    
     try:
-        from auth.auth_manager import AuthManager
+        from src.auth.auth_manager import AuthManager
         
         auth = AuthManager()
         
@@ -134,7 +147,7 @@ def test_reddit_client():
     print("\n🤖 Testing Reddit client...")
     
     try:
-        from core.reddit_scout_multi import UserRedditScout
+        from src.core.reddit_scout_multi import UserRedditScout
         
         # Test initialization (should handle missing API keys gracefully)
         scout = UserRedditScout(user_id=999)  # Fake user ID
@@ -174,42 +187,64 @@ def test_streamlit_compatibility():
 
 def cleanup():
     """Clean up test files."""
-    test_db = Path("test_reddit_scout.db")
-    if test_db.exists():
-        test_db.unlink()
+    try:
+        Path("test_reddit_scout.db").unlink()
         print("🧹 Cleaned up test database")
+    except FileNotFoundError:
+        pass
 
 def main():
     """Run all tests."""
     print("🚀 Reddit Scout Pro - Local Testing Suite")
     print("=" * 50)
     
-    tests = [
+    # One database init and session shared by the tests that need it
+    db = open_test_db()
+    
+    # Tests that don't need the shared session run in worker processes, each with its
+    # own import graph; the SQLite-backed ones stay here on the shared session
+    isolated = [
         ("Imports", test_imports),
-        ("Database", test_database),
         ("Encryption", test_encryption),
-        ("Authentication", test_authentication),
         ("Reddit Client", test_reddit_client),
         ("Streamlit", test_streamlit_compatibility),
     ]
+    local = [
+        ("Database", lambda: test_database(db)),
+        ("Authentication", lambda: test_authentication(db)),
+    ]
+    order = ["Imports", "Database", "Encryption", "Authentication", "Reddit Client", "Streamlit"]
+    
+    outcomes = {}
+    with bounded_pool(len(isolated), ProcessPoolExecutor) as pool:
+        futures = {pool.submit(test_func): test_name for test_name, test_func in isolated}
+        for test_name, test_func in local:
+            try:
+                outcomes[test_name] = test_func()
+            except Exception as e:
+                outcomes[test_name] = e
+        for future in as_completed(futures):
+            try:
+                outcomes[futures[future]] = future.result()
+            except Exception as e:
+                outcomes[futures[future]] = e
     
     total_passed = 0
     total_tests = 0
     
-    for test_name, test_func in tests:
-        try:
-            result = test_func()
-            if isinstance(result, tuple):  # For imports test
-                passed, count = result
-                total_passed += passed
-                total_tests += count
-            elif result:
-                total_passed += 1
-                total_tests += 1
-            else:
-                total_tests += 1
-        except Exception as e:
-            print(f"💥 {test_name} test crashed: {e}")
+    for test_name in order:
+        result = outcomes[test_name]
+        if isinstance(result, Exception):
+            print(f"💥 {test_name} test crashed: {result}")
+            total_tests += 1
+        elif isinstance(result, tuple):  # For imports test
+            passed, count = result
+            total_passed += passed
+            total_tests += count
+        elif result:
+            total_passed += 1
+            total_tests += 1
+        else:
             total_tests += 1
     
     print("\n" + "=" * 50)
@@ -220,6 +255,8 @@ def main():
     else:
         print("❌ Some tests failed. Check issues above.")
     
+    if db is not None:
+        db.close()
     cleanup()
     return total_passed == total_tests
 
@@ -1,12 +1,13 @@
 """Test script to verify Reddit Scout Pro multi-user setup."""
 
+import io
 import os
 import sys
+import threading
 import logging
 from datetime import datetime
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+from src.utils.concurrency import bounded_pool
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -135,6 +136,37 @@ def test_environment():
     
     return True
 
+# Per-thread output buffers for tests running concurrently
+_captured = threading.local()
+
+class _ThreadStdout:
+    """sys.stdout stand-in that sends a thread's prints to its buffer while it runs a test."""
+    
+    def __init__(self, stream):
+        self._stream = stream
+    
+    def write(self, text):
+        buf = getattr(_captured, 'buf', None)
+        return (buf if buf is not None else self._stream).write(text)
+    
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+def _run_test(test_name, test_func):
+    """Run one setup test, reporting failures; returns (passed, printed output)."""
+    _captured.buf = io.StringIO()
+    try:
+        print(f"\n📋 {test_name} Test:")
+        try:
+            if test_func():
+                return True, _captured.buf.getvalue()
+            print(f"❌ {test_name} test failed")
+        except Exception as e:
+            print(f"❌ {test_name} test error: {e}")
+        return False, _captured.buf.getvalue()
+    finally:
+        _captured.buf = None
+
 def main():
     """Run all tests."""
     print("🚀 Reddit Scout Pro Multi-User Setup Test")
@@ -147,19 +179,33 @@ def main():
         ("Authentication", test_authentication),
         ("Reddit Client", test_reddit_client)
     ]
+    # Tests that need another test to have passed first
+    requires = {"Authentication": "Database"}
     
     passed = 0
     total = len(tests)
     
-    for test_name, test_func in tests:
-        print(f"\n📋 {test_name} Test:")
-        try:
-            if test_func():
-                passed += 1
-            else:
-                print(f"❌ {test_name} test failed")
-        except Exception as e:
-            print(f"❌ {test_name} test error: {e}")
+    # Independent tests run concurrently; each one's output is buffered and printed
+    # in list order, so reports never interleave
+    outcomes = {}
+    stdout = sys.stdout
+    sys.stdout = _ThreadStdout(stdout)
+    try:
+        with bounded_pool(4) as pool:
+            futures = {name: pool.submit(_run_test, name, func) for name, func in tests if name not in requires}
+            for test_name, test_func in tests:
+                needed = requires.get(test_name)
+                if test_name in futures:
+                    outcomes[test_name] = futures[test_name].result()
+                elif outcomes[needed][0]:
+                    outcomes[test_name] = _run_test(test_name, test_func)
+                else:
+                    outcomes[test_name] = (False, f"\n📋 {test_name} Test:\n⏭️ Skipped - {needed} test failed\n")
+                ok, output = outcomes[test_name]
+                stdout.write(output)
+                passed += ok
+    finally:
+        sys.stdout = stdout
     
     print("\n" + "=" * 50)
     print(f"📊 Test Results: {passed}/{total} passed")